@@ -52,7 +52,7 @@ class AnimatedDiagram:
         this dynamically built topology.
         """
         from manim import tempconfig
-        from manim_devops.core import DevopsScene
+        from manim_devops.scene import DevopsScene
         
         # 1. Sanitize the diagram name into a valid python Class name for Manim's file writer
         safe_name = "".join([c if c.isalnum() else "" for c in self.name.title()])
@@ -63,7 +63,9 @@ class AnimatedDiagram:
         # 2. Dynamically construct the Scene subclass definition
         class CustomFacadeScene(DevopsScene):
             def construct(self):
-                # Simply loop over the mathematical matrix and draw it
+                # Build the harvested nodes' icons at this scene's resolution,
+                # then simply loop over the mathematical matrix and draw it
+                self.materialize_nodes(topology_ref.nodes)
                 self.render_topology(topology_ref)
                 
         # Rename the class so Manim writes the output file nicely (e.g. MyDiagram.mp4)
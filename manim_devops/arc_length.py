@@ -0,0 +1,85 @@
+"""
+Cumulative arc-length tables for moving packets along rendered edges.
+
+``MoveAlongPath`` calls ``point_from_proportion`` on every frame, which
+walks the edge's bezier curves and measures them again each time. Edges
+are polylines, so a table of their vertices and the cumulative distance to
+each one turns any number of positions into one ``searchsorted`` and a
+lerp, with the packet moving at constant speed across segments of any
+length.
+
+Each edge caches its table on the mobject. The table is rebuilt whenever
+the edge's ``points`` array is replaced, which is how Manim moves and
+reshapes mobjects (e.g. ScaleOutAction rerouting an edge). No manim import.
+"""
+from typing import Any
+
+import numpy as np
+
+from manim_devops.constants import ARC_LENGTH_SAMPLES
+
+# Distance along a straight cubic of its handles, as set_points_as_corners places them
+_THIRDS = np.array([1.0 / 3.0, 2.0 / 3.0])
+
+
+class ArcLengthTable:
+    """Vertices of a polyline with the cumulative distance to each one."""
+    __slots__ = ("vertices", "cumulative", "length")
+
+    def __init__(self, vertices: np.ndarray):
+        vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+        if len(vertices) < 2:  # a point (or nothing): every distance maps to it
+            vertices = np.repeat(vertices[:1] if len(vertices) else np.zeros((1, 3)), 2, axis=0)
+        steps = np.linalg.norm(np.diff(vertices, axis=0), axis=1)
+        self.vertices = vertices
+        self.cumulative = np.concatenate([[0.0], np.cumsum(steps)])
+        self.length = float(self.cumulative[-1])
+
+    @classmethod
+    def from_points(cls, points: np.ndarray) -> "ArcLengthTable":
+        """
+        Builds the table of a VMobject's cubic bezier points. Straight curves
+        contribute their anchors; any curved one is sampled instead.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        curves = points[:len(points) // 4 * 4].reshape(-1, 4, 3)
+        if not len(curves):
+            return cls(points[:1])
+        starts, ends = curves[:, 0], curves[:, 3]
+        chords = ends - starts
+        handles = starts[:, None, :] + _THIRDS[None, :, None] * chords[:, None, :]
+        tolerance = 1e-6 * (1.0 + np.abs(curves).max())
+        if np.allclose(curves[:, 1:3], handles, rtol=0.0, atol=tolerance):
+            return cls(np.concatenate([starts, ends[-1:]]))
+        t = np.linspace(0.0, 1.0, ARC_LENGTH_SAMPLES + 1)[:-1, None]
+        weights = np.stack([(1 - t) ** 3, 3 * (1 - t) ** 2 * t, 3 * (1 - t) * t ** 2, t ** 3])  # (4, samples, 1)
+        samples = np.einsum("kso,ckd->csd", weights, curves).reshape(-1, 3)
+        return cls(np.concatenate([samples, ends[-1:]]))
+
+    def point_at(self, distances) -> np.ndarray:
+        """
+        The points ``distances`` along the polyline (clamped to its ends),
+        one row per distance.
+        """
+        distances = np.clip(np.asarray(distances, dtype=float).reshape(-1), 0.0, self.length)
+        segment = np.searchsorted(self.cumulative, distances, side="right") - 1
+        segment = np.clip(segment, 0, len(self.vertices) - 2)
+        low, high = self.cumulative[segment], self.cumulative[segment + 1]
+        span = high - low
+        t = np.divide(distances - low, span, out=np.zeros_like(span), where=span > 0)
+        return self.vertices[segment] + (self.vertices[segment + 1] - self.vertices[segment]) * t[:, None]
+
+    def point_at_proportion(self, proportions) -> np.ndarray:
+        """Like ``point_at`` with distances given as fractions of the length."""
+        return self.point_at(np.asarray(proportions, dtype=float) * self.length)
+
+
+def arc_length_table(edge: Any) -> ArcLengthTable:
+    """The cached table of a rendered edge, rebuilt if its points were replaced."""
+    points = edge.points
+    cached = getattr(edge, "_arc_length_table", None)
+    if cached is not None and cached[0] is points:
+        return cached[1]
+    table = ArcLengthTable.from_points(points)
+    edge._arc_length_table = (points, table)
+    return table
@@ -46,3 +46,17 @@ class CloudNode(GraphEntity):
     """
     def __init__(self, node_id: str, label: Optional[str] = None):
         super().__init__(node_id, label)
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the node's render geometry exists; plain CloudNodes defer none."""
+        return True
+
+    def materialize(self, pixels_per_unit: Optional[float] = None, instanced: bool = False) -> "CloudNode":
+        """
+        Builds any deferred render geometry. Called by the rendering pipeline
+        when a node is actually placed, with the screen's ``pixels_per_unit``
+        so detail can match the drawn size, and ``instanced`` when identical
+        icons may share geometry; plain CloudNodes have none.
+        """
+        return self
@@ -1,8 +1,10 @@
 from pathlib import Path
+from typing import Optional
 import logging
 from manim import SVGMobject
 from manim_devops.assets import CloudNode
-from manim_devops.constants import FALLBACK_CIRCLE_RADIUS, AWS_FALLBACK_COLOR
+from manim_devops.assets.icon_cache import ICON_CACHE
+from manim_devops.constants import FALLBACK_CIRCLE_RADIUS, AWS_FALLBACK_COLOR, ICON_SCALE
 
 logger = logging.getLogger(__name__)
 
@@ -13,26 +15,54 @@ class AWSNode(CloudNode, SVGMobject):
     """
     The provider-specific generic base.
     Inherits Math properties from CloudNode, and Render properties from SVGMobject.
+
+    Construction only sets up an empty SVGMobject and records the icon
+    reference; the icon's paths are added by materialize(), which
+    render_topology, ScaleOutAction and the diagram adapter call when they
+    draw a node. Adding a node to a DevopsScene before that is an error.
     """
     def __init__(self, node_id: str, label: str, svg_filename: str):
         # 1. Initialize Math Tracker
         CloudNode.__init__(self, node_id, label)
         
-        # 2. Initialize Visual Renderer
-        svg_path = ASSETS_DIR / svg_filename
+        # 2. Initialize the Visual Renderer; the icon waits for materialize()
+        self.svg_filename = svg_filename
+        self._materialized = False
+        SVGMobject.__init__(self, ASSETS_DIR / svg_filename, should_center=False, height=None)
+
+    def init_svg_mobject(self, use_svg_cache: bool) -> "AWSNode":
+        """SVGMobject hook: the paths come from the icon cache in materialize()."""
+        return self
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._materialized
+
+    def materialize(self, pixels_per_unit: Optional[float] = None, instanced: bool = False) -> "AWSNode":
+        """
+        Adds the icon's paths (once) from the shared parsed-icon cache, at
+        the level of detail matching ``pixels_per_unit`` when given. With
+        ``instanced``, the paths share one read-only copy of the icon's points
+        with every other instanced node of the same icon.
+        """
+        if self._materialized:
+            return self
+        svg_path = ASSETS_DIR / self.svg_filename
         
         try:
-            SVGMobject.__init__(self, str(svg_path))
-            self.scale(0.5)
-            # Ensure internal SVG elements stack correctly (last element on top)
-            for i, submob in enumerate(self.submobjects):
-                submob.set_z_index(i)
+            icon = ICON_CACHE.load(svg_path, ICON_SCALE, pixels_per_unit, instanced)
+            # The copy is private to this node: adopt its paths and the
+            # icon's own style, never its identity or other state
+            self.add(*icon.submobjects)
+            self.match_style(icon, family=False)
         except FileNotFoundError:
-            logger.warning("SVG '%s' not found at %s. Using fallback circle for '%s'.", svg_filename, svg_path, node_id)
+            logger.warning("SVG '%s' not found at %s. Using fallback circle for '%s'.", self.svg_filename, svg_path, self.node_id)
             self._apply_fallback()
         except Exception as e:
-            logger.warning("Failed to parse SVG '%s': %s. Using fallback for '%s'.", svg_filename, e, node_id)
+            logger.warning("Failed to parse SVG '%s': %s. Using fallback for '%s'.", self.svg_filename, e, self.node_id)
             self._apply_fallback()
+        self._materialized = True
+        return self
 
     def _apply_fallback(self):
         """Replaces this node's geometry with a generic colored circle."""
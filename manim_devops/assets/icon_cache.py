@@ -0,0 +1,195 @@
+"""
+Process-wide cache of parsed icon geometry.
+
+Parsing an SVG (XML, bezier path construction, the per-submobject z-index
+pass) dominates the cost of creating an AWSNode, and every node of a given
+type parses the same file. Parsed, scaled icons are kept here as templates
+keyed by ``(path, mtime, scale)``; new nodes take a deep copy, so editing an
+SVG on disk invalidates its entry and no two nodes share mutable geometry.
+Instanced copies share the template's read-only points instead.
+"""
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from manim import SVGMobject
+
+from manim_devops.assets.icon_store import default_icon_store
+from manim_devops.assets.instancing import InstancedPath, instance_icon
+from manim_devops.assets.lod import lod_level, lod_thresholds, reduce_points
+from manim_devops.assets.sanitize import sanitized_svg
+from manim_devops.constants import ICON_CACHE_MAX_ENTRIES, ICON_CACHE_MAX_BYTES
+
+
+def icon_nbytes(icon) -> int:
+    """Bytes held by the point arrays of an icon and all its submobjects, shared ones included."""
+    return sum(
+        mob.points.nbytes + (mob.geometry.points.nbytes if isinstance(mob, InstancedPath) else 0)
+        for mob in icon.get_family()
+    )
+
+
+def parse_icon(svg_path: Path, scale: float) -> SVGMobject:
+    """
+    Parses and scales an SVG, stacking its elements last-on-top. The file is
+    read through the sanitiser, so vendor icons using CSS classes or
+    gradient paints load too.
+    """
+    icon = SVGMobject(str(sanitized_svg(svg_path)))
+    icon.scale(scale)
+    # Ensure internal SVG elements stack correctly (last element on top)
+    for i, submob in enumerate(icon.submobjects):
+        submob.set_z_index(i)
+    return icon
+
+
+def _style_key(mob) -> Optional[tuple]:
+    """Everything that decides how a path is painted, or None if unknown."""
+    try:
+        return (
+            mob.fill_rgbas.tobytes(), mob.stroke_rgbas.tobytes(), mob.background_stroke_rgbas.tobytes(),
+            float(mob.stroke_width), float(mob.background_stroke_width),
+        )
+    except AttributeError:
+        return None  # e.g. the OpenGL renderer: never merge
+
+
+def _bounds(points: np.ndarray) -> np.ndarray:
+    return np.concatenate([points[:, :2].min(axis=0), points[:, :2].max(axis=0)])
+
+
+def reduce_icon(icon: SVGMobject, level: int) -> SVGMobject:
+    """
+    Returns a copy of ``icon`` simplified for drawing ``level`` pixels wide:
+    beziers are simplified, sub-pixel subpaths dropped, and consecutive
+    same-style paths merged into one submobject. Paths are only merged when
+    they do not overlap, so fill rules and stacking cannot change the result.
+    """
+    tolerance, min_detail = lod_thresholds(max(icon.width, icon.height), level)
+    reduced = icon.copy()
+    merged = []  # [submobject, style, bounds]
+    for submob in reduced.submobjects:
+        points = reduce_points(submob.points, tolerance, min_detail)
+        if len(points) == 0:
+            continue
+        submob.set_points(points)
+        style, bounds = _style_key(submob), _bounds(points)
+        if merged and style is not None and merged[-1][1] == style:
+            head = merged[-1]
+            disjoint = (bounds[:2] > head[2][2:]).any() or (head[2][:2] > bounds[2:]).any()
+            if disjoint:
+                head[0].append_points(points)
+                head[2] = np.concatenate([np.minimum(head[2][:2], bounds[:2]), np.maximum(head[2][2:], bounds[2:])])
+                continue
+        merged.append([submob, style, bounds])
+    reduced.submobjects = [submob for submob, _, _ in merged]
+    return reduced
+
+
+class IconCache:
+    """
+    Thread-safe LRU of parsed icon templates, bounded both by entry count
+    and by the total bytes of their point arrays.
+
+    Two threads missing on the same key may both parse it; the second put
+    simply replaces the first, which is cheaper than holding a lock across
+    the parse.
+    """
+    def __init__(self, max_entries: int = ICON_CACHE_MAX_ENTRIES, max_bytes: int = ICON_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()  # key -> (template, nbytes)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @staticmethod
+    def key(svg_path: Path, scale: float) -> tuple[str, int, float]:
+        """Cache key for an icon file; raises FileNotFoundError if it is missing."""
+        path = Path(svg_path).resolve()
+        return str(path), path.stat().st_mtime_ns, float(scale)
+
+    def get(self, key) -> Optional[SVGMobject]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, template: SVGMobject) -> None:
+        size = icon_nbytes(template)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._nbytes -= previous[1]
+            if size > self.max_bytes:
+                return  # Never let one oversized icon flush everything else
+            self._entries[key] = (template, size)
+            self._nbytes += size
+            while len(self._entries) > self.max_entries or self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._nbytes -= evicted
+
+    def load(
+        self, svg_path: Path, scale: float, pixels_per_unit: Optional[float] = None, instanced: bool = False
+    ) -> SVGMobject:
+        """
+        Returns a fresh copy of the parsed icon. A miss first tries the
+        on-disk IconStore and only parses the file if that misses too.
+        Parse errors propagate and are not cached.
+
+        With ``pixels_per_unit``, icons drawn small on screen come from a
+        level-of-detail variant (see reduce_icon), cached per level. With
+        ``instanced``, the copy's paths share one read-only copy of the
+        template's points and are placed when drawn (see instance_icon).
+        """
+        key = self.key(svg_path, scale)
+        template = self.get(key)
+        if template is None:
+            store = default_icon_store()
+            store_key = store.make_key(svg_path, scale) if store is not None else None
+            template = store.get(store_key) if store is not None else None
+            if template is None:
+                template = parse_icon(svg_path, scale)
+                if store is not None:
+                    store.put(store_key, template)
+            self.put(key, template)
+
+        if pixels_per_unit is not None:
+            level = lod_level(max(template.width, template.height) * pixels_per_unit)
+            if level is not None:
+                key = key + (level,)
+                variant = self.get(key)
+                if variant is None:
+                    variant = reduce_icon(template, level)
+                    self.put(key, variant)
+                template = variant
+
+        if instanced:
+            prototype = self.get(key + ("instanced",))
+            if prototype is None:
+                prototype = instance_icon(template)
+                self.put(key + ("instanced",), prototype)
+            template = prototype
+        return template.copy()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+ICON_CACHE = IconCache()
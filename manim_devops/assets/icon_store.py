@@ -0,0 +1,261 @@
+"""
+Persistent, cross-process cache of parsed icon geometry.
+
+The in-process IconCache still pays one SVG parse per icon per worker. This
+store keeps the parsed, scaled point arrays and per-path styles on disk so a
+cold worker rebuilds icons from memory-mapped arrays without touching the
+XML parser. Entries are keyed by the SVG's content hash, the scale, and the
+Manim version, so neither renaming, touching nor upgrading can serve stale
+geometry.
+
+Each entry is two files: ``<key>.npy``, one flat float64 buffer holding the
+points and RGBA rows of the icon and every path, and ``<key>.json``, the
+offsets and the remaining style state (widths, opacities, sheen, joint and
+cap style, z-index ...) needed to slice it back apart. (An ``.npz`` archive
+cannot be memory-mapped, hence the plain ``.npy``.) The JSON is written last
+and acts as the commit marker.
+
+Paths come back as plain VMobjects: the SVG path subclasses only differ in
+how their constructor generates points, which the stored arrays replace.
+
+Pre-warm the store for an asset pack with::
+
+    python -m manim_devops.assets.icon_store [ASSET_DIR ...]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from manim import CapStyleType, LineJointType, ManimColor, VMobject, __version__ as MANIM_VERSION
+
+from manim_devops.assets.sanitize import SANITIZER_VERSION
+from manim_devops.cache import default_cache_dir
+from manim_devops.constants import ICON_SCALE, ICON_STORE_MAX_ENTRIES, ICON_STORE_DISABLE_ENV
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout of an entry changes
+ICON_STORE_FORMAT_VERSION = 2
+
+# Per-path arrays stored in the flat buffer, with their row width
+_ARRAYS = (("points", 3), ("fill_rgbas", 4), ("stroke_rgbas", 4), ("background_stroke_rgbas", 4))
+# Scalar (or small vector) style attributes stored in the JSON
+_STYLE_FIELDS = (
+    "fill_opacity", "stroke_opacity", "stroke_width", "background_stroke_opacity", "background_stroke_width",
+    "sheen_factor", "sheen_direction", "shade_in_3d", "close_new_points", "make_smooth_after_applying_functions",
+    "pre_function_handle_to_anchor_scale_factor", "tolerance_for_point_equality", "n_points_per_cubic_curve",
+    "z_index",
+)
+# Enum style attributes, stored by member name
+_ENUM_FIELDS = {"joint_type": LineJointType, "cap_style": CapStyleType}
+
+
+class IconStore:
+    """
+    A size-bounded LRU of parsed icons on disk. As with LayoutCache, read and
+    write failures are logged and treated as misses.
+    """
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = ICON_STORE_MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir("icons")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(svg_path: Path, scale: float) -> str:
+        """Content hash of the SVG plus everything that shapes the parsed result."""
+        digest = hashlib.sha256(Path(svg_path).read_bytes())
+        digest.update(
+            f"|{float(scale)!r}|{MANIM_VERSION}|{ICON_STORE_FORMAT_VERSION}|{SANITIZER_VERSION}".encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.npy", self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[VMobject]:
+        """Rebuilds the icon for ``key`` from memory-mapped arrays, or None on a miss."""
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as fh:
+                meta = json.load(fh)
+            if meta.get("version") != ICON_STORE_FORMAT_VERSION:
+                raise ValueError(f"format version {meta.get('version')!r}")
+            buffer = np.load(data_path, mmap_mode="r")
+            icon = _rebuild(buffer, meta["icon"], meta["paths"])
+            os.utime(meta_path)  # Mark as most recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Discarding unreadable icon cache entry %s: %s", meta_path, e)
+            self._unlink(meta_path)
+            self._unlink(data_path)
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return icon
+
+    def put(self, key: str, icon: VMobject) -> bool:
+        """Stores the paths of ``icon``; returns False if it cannot be serialised."""
+        try:
+            chunks = []
+            spec = _describe(icon, chunks)
+            paths = [_describe(mob, chunks) for mob in icon.submobjects]
+        except (AttributeError, TypeError, ValueError) as e:
+            # e.g. the OpenGL renderer stores styles differently
+            logger.debug("Not storing icon %s on disk: %s", key, e)
+            return False
+
+        buffer = np.concatenate(chunks) if chunks else np.empty(0)
+        data_path, meta_path = self._paths(key)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial entry
+            with open(data_path.with_suffix(suffix), "wb") as fh:
+                np.save(fh, buffer)
+            os.replace(data_path.with_suffix(suffix), data_path)
+            with open(meta_path.with_suffix(suffix), "w", encoding="utf-8") as fh:
+                json.dump(
+                    {"version": ICON_STORE_FORMAT_VERSION, "icon": spec, "paths": paths}, fh, separators=(",", ":")
+                )
+            os.replace(meta_path.with_suffix(suffix), meta_path)
+        except OSError as e:
+            logger.warning("Could not write icon cache entry %s: %s", meta_path, e)
+            return False
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries beyond ``max_entries``."""
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((meta_path.stat().st_mtime, meta_path))
+            except FileNotFoundError:
+                continue  # Evicted by another process meanwhile
+        entries.sort()
+        for _, meta_path in entries[:max(0, len(entries) - self.max_entries)]:
+            self._unlink(meta_path)
+            self._unlink(meta_path.with_suffix(".npy"))
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def warm(self, asset_dir: Path, scale: float = ICON_SCALE) -> dict:
+        """Parses and stores every ``*.svg`` under ``asset_dir`` not already cached."""
+        from manim_devops.assets.icon_cache import parse_icon
+        stats = {"stored": 0, "cached": 0, "failed": 0}
+        for svg_path in sorted(Path(asset_dir).rglob("*.svg")):
+            key = self.make_key(svg_path, scale)
+            if self._paths(key)[1].exists():
+                stats["cached"] += 1
+                continue
+            try:
+                stored = self.put(key, parse_icon(svg_path, scale))
+            except Exception as e:
+                logger.warning("Failed to parse SVG '%s': %s", svg_path, e)
+                stored = False
+            stats["stored" if stored else "failed"] += 1
+        return stats
+
+
+def _json_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _describe(mob: VMobject, chunks: list) -> dict:
+    """Appends the arrays of ``mob`` to ``chunks`` and returns its JSON spec."""
+    counts = []
+    for name, width in _ARRAYS:
+        array = np.asarray(getattr(mob, name), dtype=np.float64).reshape(-1, width)
+        chunks.append(array.ravel())
+        counts.append(len(array))
+    spec = {"counts": counts, "style": {name: _json_value(getattr(mob, name)) for name in _STYLE_FIELDS}}
+    spec["style"].update((name, getattr(mob, name).name) for name in _ENUM_FIELDS)
+    spec["style"]["background_stroke_color"] = mob.background_stroke_color.to_hex(with_alpha=True)
+    if mob.get_background_image() is not None:
+        raise TypeError("background images are not stored")
+    return spec
+
+
+def _restore(mob: VMobject, spec: dict, buffer: np.ndarray, offset: int) -> int:
+    """Applies a spec written by _describe; returns the end offset of its arrays."""
+    for (name, width), count in zip(_ARRAYS, spec["counts"]):
+        end = offset + count * width
+        setattr(mob, name, buffer[offset:end].reshape(count, width))
+        offset = end
+    style = spec["style"]
+    for name in _STYLE_FIELDS:
+        setattr(mob, name, style[name])
+    mob.sheen_direction = np.array(style["sheen_direction"])
+    for name, enum in _ENUM_FIELDS.items():
+        setattr(mob, name, enum[style[name]])
+    mob.background_stroke_color = ManimColor(style["background_stroke_color"])
+    return offset
+
+
+def _rebuild(buffer: np.ndarray, icon_spec: dict, paths: list[dict]) -> VMobject:
+    """Slices the flat buffer back into the styled icon and one VMobject per SVG path."""
+    icon = VMobject()
+    offset = _restore(icon, icon_spec, buffer, 0)
+    for spec in paths:
+        mob = VMobject()
+        offset = _restore(mob, spec, buffer, offset)
+        icon.add(mob)
+    return icon
+
+
+_DEFAULT_STORES: dict[Path, IconStore] = {}
+_DEFAULT_STORES_LOCK = threading.Lock()
+
+
+def default_icon_store() -> Optional[IconStore]:
+    """
+    Returns the process-wide store for the current cache directory, or None
+    when disabled via ``$MANIM_DEVOPS_NO_ICON_CACHE``.
+    """
+    if os.environ.get(ICON_STORE_DISABLE_ENV):
+        return None
+    cache_dir = default_cache_dir("icons")
+    with _DEFAULT_STORES_LOCK:
+        if cache_dir not in _DEFAULT_STORES:
+            _DEFAULT_STORES[cache_dir] = IconStore(cache_dir)
+        return _DEFAULT_STORES[cache_dir]
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    from manim_devops.assets.aws import ASSETS_DIR
+    parser = argparse.ArgumentParser(description="Pre-warm the on-disk icon geometry cache.")
+    parser.add_argument("asset_dirs", nargs="*", type=Path, default=[ASSETS_DIR], help="directories of SVG icons")
+    parser.add_argument("--scale", type=float, default=ICON_SCALE)
+    args = parser.parse_args(argv)
+
+    store = IconStore()
+    failed = 0
+    for asset_dir in args.asset_dirs:
+        stats = store.warm(asset_dir, args.scale)
+        failed += stats["failed"]
+        print(json.dumps({"asset_dir": str(asset_dir), "cache_dir": str(store.cache_dir), **stats}))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
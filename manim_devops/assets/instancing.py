@@ -0,0 +1,135 @@
+"""
+Instanced icon geometry for diagrams with thousands of identical nodes.
+
+A copied icon owns a private copy of every path's points, so memory grows
+with the node count even though all EC2 icons are the same shape at a
+different place. An instanced node instead holds an ``InstancedIcon``: its
+paths keep their own styles but no points, only a reference to one
+read-only ``IconGeometry`` shared by every copy, and the icon's own points
+are the four corners of its bounding box.
+
+Manim moves, scales, rotates and animates those corners like any other
+points; nothing is overridden. The geometry is placed where it is drawn:
+``InstancingCamera`` (the camera of every DevopsScene) maps each shared
+path through the affine transform taking the icon's original corners to
+its current ones. Scenes drawing instanced icons with another camera show
+nothing for them. Bounds (and so the centre used by ``scale`` and
+``rotate``) are those of the transformed box, which after a rotation can
+be larger than those of the rotated paths.
+"""
+from typing import Optional
+
+import numpy as np
+from manim import Camera, VMobject
+
+
+class IconGeometry:
+    """Read-only points shared by every instance of one icon path."""
+    __slots__ = ("points",)
+
+    def __init__(self, points: np.ndarray):
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        points.setflags(write=False)
+        self.points = points
+
+    # Shared, never copied: Mobject.copy() deep-copies instances
+    def __copy__(self) -> "IconGeometry":
+        return self
+
+    def __deepcopy__(self, memo) -> "IconGeometry":
+        return self
+
+
+class InstancedPath(VMobject):
+    """
+    One path of an InstancedIcon: per-instance styles, no points of its
+    own. ``geometry`` holds the shared points in the icon's original frame.
+    """
+    def __init__(self, geometry: IconGeometry, **kwargs):
+        super().__init__(**kwargs)
+        self.geometry = geometry
+
+
+def _corners(points: np.ndarray) -> np.ndarray:
+    """Lower-left, lower-right, upper-left and upper-right of the points' box."""
+    if not len(points):
+        return np.zeros((4, 3))
+    (left, bottom), (right, top) = points[:, :2].min(axis=0), points[:, :2].max(axis=0)
+    return np.array([[left, bottom, 0.0], [right, bottom, 0.0], [left, top, 0.0], [right, top, 0.0]])
+
+
+class InstancedIcon(VMobject):
+    """
+    The paths of one icon drawn from shared geometry. Its points are the
+    corners of the icon's bounding box, so bounds, centre and every
+    transform behave as for the icon itself; it is never drawn as a path.
+    """
+    def __init__(self, icon: VMobject, **kwargs):
+        super().__init__(fill_opacity=0, stroke_opacity=0, stroke_width=0, **kwargs)
+        paths = [submob for submob in icon.submobjects if len(submob.points)]
+        corners = _corners(np.concatenate([path.points for path in paths]) if paths else np.zeros((0, 3)))
+        self.reference = IconGeometry(corners)
+        self.points = corners
+        for submob in paths:
+            path = InstancedPath(IconGeometry(submob.points))
+            path.match_style(submob, family=False)
+            path.joint_type, path.cap_style = submob.joint_type, submob.cap_style
+            path.z_index = submob.z_index
+            self.add(path)
+
+    def placement(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The (matrix, offset) mapping shared points to where this icon is
+        drawn: ``points @ matrix + offset``.
+        """
+        reference, corners = self.reference.points, self.points
+        width, height = reference[3, :2] - reference[0, :2]
+        matrix = np.eye(3)
+        matrix[0] = (corners[1] - corners[0]) / width if width else 0.0
+        matrix[1] = (corners[2] - corners[0]) / height if height else 0.0
+        return matrix, corners[0] - reference[0] @ matrix
+
+    def drawn_paths(self) -> list[tuple[InstancedPath, np.ndarray]]:
+        """Each path, in z order, with the points it is drawn at."""
+        matrix, offset = self.placement()
+        paths = sorted(
+            (path for path in self.submobjects if isinstance(path, InstancedPath)), key=lambda path: path.z_index
+        )
+        return [(path, path.geometry.points @ matrix + offset) for path in paths]
+
+
+class InstancingCamera(Camera):
+    """
+    The Cairo camera, drawing each InstancedIcon as its paths' shared
+    geometry placed by the icon's corners. Everything else is drawn as by
+    Camera.
+    """
+    _placed: Optional[np.ndarray] = None  # points of the InstancedPath being drawn
+
+    def display_vectorized(self, vmobject: VMobject, ctx) -> "InstancingCamera":
+        if not isinstance(vmobject, InstancedIcon):
+            return super().display_vectorized(vmobject, ctx)
+        for path, points in vmobject.drawn_paths():
+            self._placed = points
+            try:
+                super().display_vectorized(path, ctx)
+            finally:
+                self._placed = None
+        return self
+
+    def transform_points_pre_display(self, mobject, points: np.ndarray) -> np.ndarray:
+        if self._placed is not None and isinstance(mobject, InstancedPath) and not len(points):
+            points = self._placed
+        return super().transform_points_pre_display(mobject, points)
+
+
+def instance_icon(icon: VMobject) -> VMobject:
+    """
+    Returns an icon styled like ``icon`` whose single submobject is an
+    InstancedIcon over its paths, so copies of it share the path geometry
+    and only copy styles and four corner points.
+    """
+    prototype = VMobject()
+    prototype.match_style(icon, family=False)
+    prototype.add(InstancedIcon(icon))
+    return prototype
@@ -0,0 +1,127 @@
+"""
+Level-of-detail reduction for icon geometry.
+
+Cairo's per-frame cost grows with the number of bezier segments and paths
+it has to fill, yet an icon drawn 20 pixels wide cannot show most of them.
+These helpers work on Manim's point layout — (4n, 3) arrays where each
+group of four rows is one cubic (anchor, handle, handle, anchor) — and are
+pure NumPy, so they can be tested without a renderer:
+
+- flat cubics are collapsed to lines, and runs of lines are thinned with
+  Ramer-Douglas-Peucker at a given tolerance;
+- subpaths smaller than a detail threshold are dropped.
+
+Both thresholds are expressed in world units; callers derive them from the
+on-screen size in pixels (see ``lod_level`` / ``lod_thresholds``).
+"""
+from typing import Optional
+
+import numpy as np
+
+from manim_devops.constants import ICON_LOD_LEVELS, ICON_LOD_TOLERANCE_PX, ICON_LOD_MIN_DETAIL_PX
+
+_JOIN_TOLERANCE = 1e-6  # anchors closer than this continue the same subpath
+
+
+def lod_level(pixels: Optional[float]) -> Optional[int]:
+    """
+    Quantises an on-screen icon size to the smallest level that covers it,
+    so icons of similar size share one simplified variant. Returns None for
+    full detail (unknown size, or larger than the biggest level).
+    """
+    if pixels is None:
+        return None
+    for level in ICON_LOD_LEVELS:
+        if pixels <= level:
+            return level
+    return None
+
+
+def lod_thresholds(extent: float, level: int) -> tuple[float, float]:
+    """(simplification tolerance, minimum detail size) in world units for an icon ``extent`` units wide."""
+    world_per_pixel = extent / level
+    return ICON_LOD_TOLERANCE_PX * world_per_pixel, ICON_LOD_MIN_DETAIL_PX * world_per_pixel
+
+
+def subpaths(points: np.ndarray) -> list[np.ndarray]:
+    """Splits a (4n, 3) point array into (m, 4, 3) cubic arrays, one per subpath."""
+    curves = np.asarray(points, dtype=float).reshape(-1, 4, 3)
+    if len(curves) == 0:
+        return []
+    gaps = np.abs(curves[1:, 0] - curves[:-1, 3]).max(axis=1) > _JOIN_TOLERANCE
+    return np.split(curves, np.flatnonzero(gaps) + 1)
+
+
+def _distance_to_segment(points: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Distance of each of ``points`` from the segment ``start -> end`` (broadcasting)."""
+    chord = end - start
+    length_sq = np.einsum("...i,...i->...", chord, chord)
+    t = np.einsum("...i,...i->...", points - start, chord) / np.where(length_sq > 0, length_sq, 1.0)
+    closest = start + np.clip(t, 0.0, 1.0)[..., None] * chord
+    return np.linalg.norm(points - closest, axis=-1)
+
+
+def _rdp(anchors: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices of the anchors a Ramer-Douglas-Peucker pass keeps."""
+    keep = np.zeros(len(anchors), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(anchors) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        inner = anchors[first + 1:last]
+        distances = _distance_to_segment(inner, anchors[first], anchors[last])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
+def _lines(anchors: np.ndarray) -> np.ndarray:
+    """Straight cubics through consecutive anchors, handles at thirds."""
+    starts, ends = anchors[:-1], anchors[1:]
+    step = (ends - starts) / 3.0
+    return np.stack([starts, starts + step, ends - step, ends], axis=1)
+
+
+def simplify_subpath(curves: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Replaces cubics whose handles lie within ``tolerance`` of their chord by
+    lines, and thins each run of lines with RDP. Curved cubics are kept.
+    """
+    if tolerance <= 0 or len(curves) == 0:
+        return curves
+    flat = np.maximum(
+        _distance_to_segment(curves[:, 1], curves[:, 0], curves[:, 3]),
+        _distance_to_segment(curves[:, 2], curves[:, 0], curves[:, 3]),
+    ) <= tolerance
+    pieces = []
+    # Runs of equal flatness: boundaries where the flag changes
+    bounds = np.flatnonzero(np.diff(flat.astype(np.int8))) + 1
+    for run in np.split(np.arange(len(curves)), bounds):
+        if not flat[run[0]]:
+            pieces.append(curves[run])
+            continue
+        anchors = np.concatenate([curves[run, 0], curves[run[-1:], 3]])
+        pieces.append(_lines(anchors[_rdp(anchors, tolerance)]))
+    return np.concatenate(pieces)
+
+
+def reduce_points(points: np.ndarray, tolerance: float, min_detail: float) -> np.ndarray:
+    """
+    Simplifies every subpath of a Manim point array and drops subpaths whose
+    bounding box is smaller than ``min_detail`` on both axes.
+    """
+    kept = []
+    for curves in subpaths(points):
+        extent = np.ptp(curves.reshape(-1, 3)[:, :2], axis=0)
+        if (extent < min_detail).all():
+            continue
+        kept.append(simplify_subpath(curves, tolerance).reshape(-1, 3))
+    if not kept:
+        return np.empty((0, 3))
+    return np.concatenate(kept)
@@ -0,0 +1,194 @@
+"""
+Streaming SVG sanitiser for vendor icon packs.
+
+Manim's SVG loader ignores CSS ``<style>`` sheets and gradient paints, so
+icons exported by design tools (``class="cls-1"`` everywhere, ``fill=
+"url(#grad)"``) come out black or fail to load. ``sanitize_svg`` rewrites
+such files in a single SAX pass:
+
+- ``<style>`` class rules are inlined as presentation attributes on every
+  element that uses them (class rules beat presentation attributes; an
+  inline ``style=`` still wins, as in CSS);
+- ``url(#gradient)`` fills and strokes are replaced by the gradient's first
+  stop colour;
+- ``<style>``, ``<metadata>``, ``<title>``, ``<desc>`` and editor-specific
+  (Inkscape / Sodipodi) elements are dropped.
+
+Being single-pass, a class or gradient must be defined before it is used,
+which is what every common exporter emits (``<defs>`` first).
+
+``sanitized_svg`` stores the output under the cache directory keyed by the
+input's content hash, so each distinct icon is sanitised once and then
+reused across renders and processes.
+"""
+import hashlib
+import os
+import re
+import threading
+import xml.sax
+from pathlib import Path
+from typing import BinaryIO, Optional
+from xml.sax.handler import feature_external_ges, feature_external_pes
+from xml.sax.saxutils import XMLGenerator
+from xml.sax.xmlreader import AttributesImpl
+
+from manim_devops.cache import default_cache_dir
+
+# Bump when the sanitiser's output for a given input changes
+SANITIZER_VERSION = 1
+
+_DROPPED_ELEMENTS = {"style", "metadata", "title", "desc"}
+_DROPPED_PREFIXES = ("sodipodi:", "inkscape:")
+_CSS_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_URL_PAINT = re.compile(r"url\(\s*['\"]?#([^)'\"]+)['\"]?\s*\)")
+_GRADIENTS = {"linearGradient", "radialGradient"}
+
+
+def _declarations(text: str) -> dict[str, str]:
+    """Parses ``a: b; c: d`` into a dict."""
+    result = {}
+    for rule in text.split(";"):
+        if ":" in rule:
+            key, value = rule.split(":", 1)
+            result[key.strip()] = value.strip()
+    return result
+
+
+class _SanitizingHandler(xml.sax.handler.ContentHandler):
+    """SAX handler that rewrites the document into ``out`` as it is read."""
+    def __init__(self, out: BinaryIO):
+        super().__init__()
+        self._writer = XMLGenerator(out, encoding="utf-8", short_empty_elements=True)
+        self._classes: dict[str, dict[str, str]] = {}
+        self._gradient_colors: dict[str, str] = {}
+        self._gradient: Optional[str] = None  # id of the gradient being read
+        self._skip_depth = 0
+        self._css: Optional[list[str]] = None  # text of the <style> being read
+
+    def startDocument(self):
+        self._writer.startDocument()
+
+    def endDocument(self):
+        self._writer.endDocument()
+
+    def startElement(self, name, attrs):
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+        if name in _DROPPED_ELEMENTS or name.startswith(_DROPPED_PREFIXES):
+            self._skip_depth = 1
+            self._css = [] if name == "style" else None
+            return
+
+        attributes = dict(attrs)
+        for class_name in attributes.pop("class", "").split():
+            attributes.update(self._classes.get(class_name, {}))
+
+        if name in _GRADIENTS:
+            self._gradient = attributes.get("id")
+            inherited = self._paint_id(attributes.get("xlink:href") or attributes.get("href") or "")
+            if self._gradient and inherited in self._gradient_colors:
+                self._gradient_colors[self._gradient] = self._gradient_colors[inherited]
+        elif name == "stop" and self._gradient and self._gradient not in self._gradient_colors:
+            color = _declarations(attributes.get("style", "")).get("stop-color") or attributes.get("stop-color")
+            if color:
+                self._gradient_colors[self._gradient] = color
+
+        for key in ("fill", "stroke"):
+            if key in attributes:
+                attributes[key] = self._resolve_paint(attributes[key])
+        if "url(" in attributes.get("style", ""):
+            declarations = _declarations(attributes["style"])
+            for key in ("fill", "stroke"):
+                if key in declarations:
+                    declarations[key] = self._resolve_paint(declarations[key])
+            attributes["style"] = ";".join(f"{key}:{value}" for key, value in declarations.items())
+
+        self._writer.startElement(name, AttributesImpl(attributes))
+
+    def endElement(self, name):
+        if self._skip_depth:
+            self._skip_depth -= 1
+            if self._skip_depth == 0 and self._css is not None:
+                self._add_stylesheet("".join(self._css))
+                self._css = None
+            return
+        if name in _GRADIENTS:
+            self._gradient = None
+        self._writer.endElement(name)
+
+    def characters(self, content):
+        if self._skip_depth:
+            if self._css is not None:
+                self._css.append(content)
+            return
+        self._writer.characters(content)
+
+    def ignorableWhitespace(self, whitespace):
+        if not self._skip_depth:
+            self._writer.ignorableWhitespace(whitespace)
+
+    @staticmethod
+    def _paint_id(value: str) -> Optional[str]:
+        match = _URL_PAINT.search(value)
+        if match:
+            return match.group(1)
+        return value[1:] if value.startswith("#") else None
+
+    def _resolve_paint(self, value: str) -> str:
+        """Replaces a gradient reference by its first stop colour, when known."""
+        paint_id = self._paint_id(value) if value.startswith("url(") else None
+        return self._gradient_colors.get(paint_id, value) if paint_id else value
+
+    def _add_stylesheet(self, css: str) -> None:
+        for selectors, body in _CSS_RULE.findall(_CSS_COMMENT.sub("", css)):
+            declarations = _declarations(body)
+            for selector in selectors.split(","):
+                selector = selector.strip()
+                # Only plain class selectors are meaningful on icon sheets
+                if selector.startswith(".") and re.fullmatch(r"\.[\w-]+", selector):
+                    self._classes.setdefault(selector[1:], {}).update(declarations)
+
+
+def sanitize_svg(source: Path, out: BinaryIO) -> None:
+    """Streams a sanitised copy of the SVG at ``source`` into ``out``."""
+    parser = xml.sax.make_parser()
+    # Never fetch external DTDs or entities while reading vendor files
+    parser.setFeature(feature_external_ges, False)
+    parser.setFeature(feature_external_pes, False)
+    parser.setContentHandler(_SanitizingHandler(out))
+    with open(source, "rb") as fh:
+        parser.parse(fh)
+
+
+def content_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sanitized_svg(svg_path: Path, cache_dir: Optional[Path] = None) -> Path:
+    """
+    Returns the path of the sanitised copy of ``svg_path``, producing it only
+    if no copy exists yet for this exact content. Raises FileNotFoundError
+    for a missing file and xml.sax.SAXParseException for malformed XML.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir("svg")
+    digest = hashlib.sha256(f"{content_hash(svg_path)}|{SANITIZER_VERSION}".encode("utf-8")).hexdigest()
+    target = cache_dir / f"{digest}.svg"
+    if target.exists():
+        return target
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so concurrent renders never read a partial file
+    tmp_path = target.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as out:
+            sanitize_svg(svg_path, out)
+        os.replace(tmp_path, target)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return target
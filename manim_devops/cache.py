@@ -0,0 +1,193 @@
+"""
+Persistent, content-addressed cache for Topology layouts.
+
+A layout is a pure function of the graph shape (node ids, edge list,
+cluster membership), the scale factor and LAYOUT_SEED. Re-rendering the
+same architecture with only caption or timing changes therefore produces
+the exact same coordinates, so we store them on disk keyed by a stable
+hash of those inputs and skip the layout step on repeat renders.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from manim_devops.constants import (
+    LAYOUT_CACHE_MAX_ENTRIES, LAYOUT_CACHE_DIR_ENV, LAYOUT_CACHE_DISABLE_ENV,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk format or the meaning of a cached layout changes
+CACHE_FORMAT_VERSION = 2
+
+
+def default_cache_dir(kind: str = "layout") -> Path:
+    """
+    Resolves the cache location: ``$MANIM_DEVOPS_CACHE_DIR/<kind>`` if set,
+    otherwise ``$XDG_CACHE_HOME/manim_devops/<kind>`` (``~/.cache`` fallback).
+    """
+    override = os.environ.get(LAYOUT_CACHE_DIR_ENV)
+    if override:
+        return Path(override) / kind
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "manim_devops" / kind
+
+
+class LayoutCache:
+    """
+    A size-bounded LRU cache of layout coordinates, one JSON file per entry.
+
+    Recency is tracked through file mtimes (touched on every hit), so the
+    LRU order survives across processes and CI runs sharing the directory.
+    Failures to read or write are logged and treated as misses — a broken
+    cache must never break a render.
+    """
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = LAYOUT_CACHE_MAX_ENTRIES):
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Picklable (minus the lock) so layouts can be computed in a worker process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cached layout files."""
+        return self._cache_dir
+
+    @staticmethod
+    def make_key(payload: dict) -> str:
+        """
+        Returns a stable SHA-256 hex digest of a JSON-serialisable payload.
+        Keys are sorted so dict ordering never changes the hash.
+        """
+        blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict[str, tuple[float, float, float]]]:
+        """Returns the cached coordinates for ``key``, or None on a miss."""
+        path = self._path_for(key)
+        with self._lock:
+            try:
+                with open(path, "r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+                if data.get("version") != CACHE_FORMAT_VERSION:
+                    raise ValueError(f"format version {data.get('version')!r}")
+                coords = {node_id: tuple(xyz) for node_id, xyz in data["coords"].items()}
+                os.utime(path)  # Mark as most recently used
+            except FileNotFoundError:
+                self.misses += 1
+                logger.debug("Layout cache miss for %s", key)
+                return None
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning("Discarding unreadable layout cache entry %s: %s", path, e)
+                self._unlink(path)
+                self.misses += 1
+                return None
+            self.hits += 1
+            logger.debug("Layout cache hit for %s", key)
+            return coords
+
+    def put(self, key: str, coords: dict[str, tuple[float, float, float]]) -> None:
+        """Stores ``coords`` under ``key`` and evicts least recently used entries."""
+        path = self._path_for(key)
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "coords": {node_id: list(xyz) for node_id, xyz in coords.items()},
+        }
+        with self._lock:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                # Write-then-rename so concurrent readers never see a partial file
+                tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(tmp_path, "w", encoding="utf-8") as fh:
+                    json.dump(payload, fh, separators=(",", ":"))
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning("Could not write layout cache entry %s: %s", path, e)
+                return
+            self._evict()
+
+    def _evict(self) -> None:
+        """Deletes the oldest entries until the cache is within ``max_entries``."""
+        entries = self._entries()
+        overflow = len(entries) - self.max_entries
+        if overflow <= 0:
+            return
+        entries.sort(key=lambda item: item[1])
+        for path, _ in entries[:overflow]:
+            self._unlink(path)
+            self.evictions += 1
+
+    def _entries(self) -> list[tuple[Path, float]]:
+        entries = []
+        try:
+            for path in self._cache_dir.glob("*.json"):
+                try:
+                    entries.append((path, path.stat().st_mtime))
+                except FileNotFoundError:
+                    continue  # Evicted by another process meanwhile
+        except OSError:
+            pass
+        return entries
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Removes every cached layout and resets the counters."""
+        with self._lock:
+            for path, _ in self._entries():
+                self._unlink(path)
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Machine-readable counters, e.g. for printing in CI logs."""
+        with self._lock:
+            return {
+                "cache_dir": str(self._cache_dir),
+                "entries": len(self._entries()),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_DEFAULT_CACHES: dict[Path, LayoutCache] = {}
+_DEFAULT_CACHES_LOCK = threading.Lock()
+
+
+def default_layout_cache() -> Optional[LayoutCache]:
+    """
+    Returns the process-wide cache for the current cache directory, or None
+    when caching is disabled via ``$MANIM_DEVOPS_NO_LAYOUT_CACHE``.
+    """
+    if os.environ.get(LAYOUT_CACHE_DISABLE_ENV):
+        return None
+    cache_dir = default_cache_dir()
+    with _DEFAULT_CACHES_LOCK:
+        if cache_dir not in _DEFAULT_CACHES:
+            _DEFAULT_CACHES[cache_dir] = LayoutCache(cache_dir)
+        return _DEFAULT_CACHES[cache_dir]
@@ -1,12 +1,29 @@
-from manim import Animation, Succession, AnimationGroup, MoveAlongPath, Indicate, Dot, FadeOut, GrowFromCenter, Create, VMobject, Text
-from manim_devops.core import DevopsScene, NodeCluster
+import logging
+import numpy as np
+from manim import Animation, Succession, AnimationGroup, MoveAlongPath, Indicate, Dot, FadeOut, GrowFromCenter, Create, VMobject
+from manim_devops.arc_length import ArcLengthTable, arc_length_table
+from manim_devops.core import NodeCluster
+from manim_devops.scene import DevopsScene
 from manim_devops.assets import CloudNode
-from manim_devops.layout import OrthogonalRouter
+from manim_devops.layout import RoutingIndex
+from manim_devops.labels import build_labels
 from manim_devops.constants import (
     Z_PACKET, Z_EDGE, Z_NODE, PACKET_RADIUS, PULSE_SCALE_FACTOR,
-    SCALE_OUT_NODE_RADIUS, EDGE_COLOR, DEFAULT_TRAFFIC_COLOR, LABEL_FONT_SIZE,
+    SCALE_OUT_NODE_RADIUS, EDGE_COLOR, DEFAULT_TRAFFIC_COLOR,
+    PACKET_SPEED, PACKET_FIELD_CAPACITY, PACKET_SPACING,
 )
 
+logger = logging.getLogger(__name__)
+
+class MoveAlongEdge(MoveAlongPath):
+    """
+    MoveAlongPath at constant speed: positions come from the edge's cached
+    arc-length table instead of ``point_from_proportion``.
+    """
+    def interpolate_mobject(self, alpha: float) -> None:
+        point = arc_length_table(self.path).point_at_proportion(self.rate_func(alpha))[0]
+        self.mobject.move_to(point)
+
 def TrafficFlow(scene: DevopsScene, source: CloudNode, target: CloudNode, color: str = DEFAULT_TRAFFIC_COLOR) -> Animation:
     """
     Constructs a cinematic animation sequence representing abstract data 
@@ -27,16 +44,11 @@ def TrafficFlow(scene: DevopsScene, source: CloudNode, target: CloudNode, color:
             "Call scene.render_topology(topo) before using TrafficFlow."
         )
     
-    # 1. Edge Lookup & Reverse Path Resolution
-    is_reversed = False
-    
-    if (src_id, tgt_id) in scene.rendered_edges:
-        edge = scene.rendered_edges[(src_id, tgt_id)]
-    elif (tgt_id, src_id) in scene.rendered_edges:
-        edge = scene.rendered_edges[(tgt_id, src_id)]
-        is_reversed = True
-    else:
+    # 1. Edge Lookup & Reverse Path Resolution (one unordered-pair lookup)
+    found = scene.rendered_edges.find(src_id, tgt_id)
+    if found is None:
         raise KeyError(f"TrafficFlow Error: No rendered edge found between '{src_id}' and '{tgt_id}'")
+    edge, is_reversed = found
         
     # 2. Spawn the Abstract Packet
     packet = Dot(color=color, radius=PACKET_RADIUS)
@@ -45,23 +57,25 @@ def TrafficFlow(scene: DevopsScene, source: CloudNode, target: CloudNode, color:
     
     # 3. Construct the Path Animation
     # If the user asked for B->A, but the math line is A->B, we must reverse the vector sequence.
-    travel_anim = MoveAlongPath(packet, edge)
+    travel_anim = MoveAlongEdge(packet, edge)
     
     if is_reversed:
-        # Manim's rate_func inversion allows a MoveAlongPath to run backwards
+        # Manim's rate_func inversion allows a MoveAlongEdge to run backwards
         # effectively tracing B->A without mutating the underlying VMobject
         def reverse_rate(t):
             return 1 - t
-        travel_anim = MoveAlongPath(packet, edge, rate_func=reverse_rate)
+        travel_anim = MoveAlongEdge(packet, edge, rate_func=reverse_rate)
         
     # 4. Success Indicator (Flash the Target Node)
-    # We must find the actual instantiated Mobject inside the topology
-    target_mobject = None
-    for node in scene.mobjects:
-        # Safe check, since we added non-CloudNode labels to the scene as well
-        if isinstance(node, CloudNode) and node.node_id == tgt_id:
-            target_mobject = node
-            break
+    # We must find the actual instantiated Mobject: O(1) through the registry,
+    # scanning only for nodes placed into scene.mobjects by hand
+    target_mobject = scene.registry.nodes.get(tgt_id)
+    if target_mobject is None:
+        for node in scene.mobjects:
+            # Safe check, since we added non-CloudNode labels to the scene as well
+            if isinstance(node, CloudNode) and node.node_id == tgt_id:
+                target_mobject = node
+                break
             
     # Fallback to flashing the abstract point if the Mobject somehow wasn't drawn
     flash_target = target_mobject if target_mobject else packet
@@ -78,6 +92,26 @@ def TrafficFlow(scene: DevopsScene, source: CloudNode, target: CloudNode, color:
         AnimationGroup(pulse_anim, cleanup_anim)
     )
 
+def _routing_index(scene: DevopsScene) -> RoutingIndex:
+    """
+    Returns the scene's persistent RoutingIndex, building one on first use
+    for scenes whose memory was populated without render_topology().
+    """
+    if getattr(scene, 'routing', None) is None:
+        known = [
+            mob for mob in scene.mobjects
+            if isinstance(mob, CloudNode) and mob.node_id in scene.rendered_coords
+        ]
+        routing = RoutingIndex()
+        routing.add_nodes(
+            [mob.node_id for mob in known],
+            [scene.rendered_coords[mob.node_id] for mob in known],
+            [SCALE_OUT_NODE_RADIUS] * len(known),
+            sizes=[(mob.width, mob.height) for mob in known],
+        )
+        scene.routing = routing
+    return scene.routing
+
 def ScaleOutAction(scene: DevopsScene, cluster: NodeCluster, new_child: CloudNode, target: CloudNode = None) -> AnimationGroup:
     """
     Dynamically spawns a new CloudNode into an existing NodeCluster during a scene.
@@ -102,48 +136,76 @@ def ScaleOutAction(scene: DevopsScene, cluster: NodeCluster, new_child: CloudNod
         raise KeyError(f"ScaleOutAction Error: NodeCluster '{cluster.node_id}' not found in Scene memory.")
         
     center_tuple = scene.rendered_coords[cluster.node_id]
-    coords = cluster.resolve_child_coordinates(center_tuple)
+    if hasattr(scene, 'topology'):
+        coords = scene.topology.resolve_cluster_coordinates(cluster, center_tuple)
+    else:
+        coords = cluster.resolve_child_coordinates(center_tuple)
     new_coord = coords[new_child.node_id]
     
     # Save the new child's mathematical coordinate for future Scaling actions
     scene.rendered_coords[new_child.node_id] = new_coord
     
-    # Force the visual CloudNode to its absolute calculated location
+    # Build the icon now that it is drawn, then force the visual CloudNode
+    # to its absolute calculated location
+    scene.materialize_nodes([new_child])
     new_child.move_to(new_coord)
     
-    # 3. State Registration: Inject into global mobjects array so TrafficFlow can find it
+    # 3. State Registration: Inject into global mobjects array and the id
+    #    registry so TrafficFlow can find it
     scene.mobjects.append(new_child)
+    scene.registry.add_cluster(cluster)
+    # The static layer changes: the cached background must be redrawn
+    scene.invalidate_background()
     
     # Prepare the organic spawner animation
     animations = [GrowFromCenter(new_child)]
     
     # Add text label below the new node (matching render_topology behavior)
-    label = Text(new_child.label or new_child.node_id, font_size=LABEL_FONT_SIZE)
+    label = build_labels([new_child.label or new_child.node_id], glyphs=scene.label_glyphs)[0]
     label.next_to(new_child, direction=[0, -1, 0])
     label.set_z_index(Z_NODE)
+    scene.registry.add_node(new_child, label)
     animations.append(Create(label))
     
+    # 3b. Incremental Rerouting: only edges now running through the new icon move
+    routing = _routing_index(scene)
+    rerouted = routing.add_node(
+        new_child.node_id, new_coord, SCALE_OUT_NODE_RADIUS, size=(new_child.width, new_child.height)
+    )
+    layer = getattr(scene, 'edge_layer', None)
+    relayered = False
+    for edge, waypoints in rerouted.items():
+        # A bundled edge leaves its bundle and is drawn on its own from now on
+        scene.unbundle_edge(edge)
+        if layer is not None and edge in layer.edge_paths:
+            # Merged edges: the undrawn track snaps, the drawn layer morphs once
+            layer.set_path(edge, waypoints)
+            scene.rendered_edges[edge].set_points_as_corners(waypoints)
+            relayered = True
+        elif edge in scene.rendered_edges:
+            animations.append(scene.rendered_edges[edge].animate.set_points_as_corners(waypoints))
+    if relayered:
+        animations.append(layer.animate.rebuild())
+    
     # 4. Organic Networking (Draw dynamic line to target)
     if target:
         if target.node_id not in scene.rendered_coords:
              raise KeyError(f"ScaleOutAction Error: Target '{target.node_id}' not found in Scene memory.")
              
         target_coord = scene.rendered_coords[target.node_id]
+        if target.node_id not in routing:
+            routing.add_node(target.node_id, target_coord, SCALE_OUT_NODE_RADIUS)
         
-        router = OrthogonalRouter()
-        waypoints = router.compute_path(
-            new_coord,
-            target_coord,
-            source_radius=SCALE_OUT_NODE_RADIUS,
-            target_radius=SCALE_OUT_NODE_RADIUS
-        )
+        edge = (new_child.node_id, target.node_id)
+        routing.add_edges([edge])
+        waypoints = routing.paths[edge]
         
         line = VMobject(color=EDGE_COLOR)
         line.set_points_as_corners(waypoints)
         line.set_z_index(Z_EDGE) 
         
         # State Registration: store edge for future TrafficFlow animations
-        scene.rendered_edges[(new_child.node_id, target.node_id)] = line
+        scene.rendered_edges[edge] = line
         
         # 4b. Sync edge to source Topology (Finding 04)
         if hasattr(scene, 'topology'):
@@ -153,3 +215,190 @@ def ScaleOutAction(scene: DevopsScene, cluster: NodeCluster, new_child: CloudNod
         animations.append(Create(line))
         
     return AnimationGroup(*animations)
+
+# Bezier control points of a unit circle as four quarter arcs
+_ARC_HANDLE = 4.0 / 3.0 * (np.sqrt(2.0) - 1.0)
+_QUARTER = np.array([[1.0, 0.0, 0.0], [1.0, _ARC_HANDLE, 0.0], [_ARC_HANDLE, 1.0, 0.0], [0.0, 1.0, 0.0]])
+_UNIT_CIRCLE = np.concatenate([
+    _QUARTER @ np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]]) for c, s in ((1, 0), (0, 1), (-1, 0), (0, -1))
+])
+
+class PacketField(VMobject):
+    """
+    Bulk traffic: every packet in flight as one mobject. Packet state lives
+    in preallocated numpy arrays (edge slot, distance travelled, speed,
+    direction) and one updater advances all of them per frame; packets are
+    drawn as the circular subpaths of this single VMobject, so Manim sees
+    one mobject however many packets move.
+
+    Spawning and despawning only write array slots. A packet leaves when
+    it reaches its target; with every slot in use, further spawns are
+    dropped. Unlike TrafficFlow, targets are not pulsed on arrival.
+
+    Usage::
+
+        field = PacketField(self)
+        self.add(field)
+        field.emit(alb, web, rate=20)   # packets per second, until rate=0
+        field.spawn(web, db, count=50)  # one burst
+        self.wait(5)
+    """
+    def __init__(
+        self,
+        scene: DevopsScene,
+        color: str = DEFAULT_TRAFFIC_COLOR,
+        speed: float = PACKET_SPEED,
+        capacity: int = PACKET_FIELD_CAPACITY,
+        radius: float = PACKET_RADIUS,
+    ):
+        if not hasattr(scene, 'rendered_edges'):
+            raise RuntimeError(
+                "PacketField requires a rendered topology. "
+                "Call scene.render_topology(topo) before using PacketField."
+            )
+        super().__init__(fill_color=color, fill_opacity=1.0, stroke_width=0)
+        self.set_z_index(Z_PACKET)
+        self.speed = speed
+        self.radius = radius
+        self.dropped = 0
+        self._edges = scene.rendered_edges
+        # Packet slots; a path of -1 marks a free slot
+        self._path = np.full(capacity, -1, dtype=np.intp)
+        self._distance = np.zeros(capacity)
+        self._speed = np.zeros(capacity)
+        self._reverse = np.zeros(capacity, dtype=bool)
+        # Arc-length tables of every edge used so far, packed into one array;
+        # path p spans vertices [_start[p], _end[p]) at distances _base[p] + local
+        self._slots: dict[tuple[str, str], int] = {}
+        self._paths: list[VMobject] = []
+        self._tables: list[ArcLengthTable] = []
+        self._pack()
+        # Emitters: (path, reversed) -> [rate, fractional packets owed]
+        self._emitters: dict[tuple[int, bool], list[float]] = {}
+        self.add_updater(PacketField.advance)
+
+    @property
+    def in_flight(self) -> int:
+        """Packets currently travelling."""
+        return int(np.count_nonzero(self._path >= 0))
+
+    def _resolve(self, source: CloudNode, target: CloudNode) -> tuple[int, bool]:
+        """The path slot of the edge between two nodes and whether to travel it backwards."""
+        src_id, tgt_id = source.node_id, target.node_id
+        found = self._edges.find(src_id, tgt_id)
+        if found is None:
+            raise KeyError(f"PacketField Error: No rendered edge found between '{src_id}' and '{tgt_id}'")
+        edge, is_reversed = found
+        key = (tgt_id, src_id) if is_reversed else (src_id, tgt_id)
+        if key not in self._slots:
+            self._slots[key] = len(self._paths)
+            self._paths.append(edge)
+            self._tables.append(arc_length_table(edge))
+            self._pack()
+        return self._slots[key], is_reversed
+
+    def _pack(self) -> None:
+        """Concatenates the tables so one searchsorted covers every path."""
+        lengths = np.array([table.length for table in self._tables])
+        counts = np.array([len(table.vertices) for table in self._tables], dtype=np.intp)
+        self._length = lengths
+        self._base = np.concatenate([[0.0], np.cumsum(lengths)[:-1]]) if len(lengths) else lengths
+        self._end = np.cumsum(counts)
+        self._start = self._end - counts
+        if self._tables:
+            self._vertices = np.concatenate([table.vertices for table in self._tables])
+            self._cumulative = np.concatenate([
+                base + table.cumulative for base, table in zip(self._base, self._tables)
+            ])
+        else:
+            self._vertices, self._cumulative = np.zeros((0, 3)), np.zeros(0)
+
+    def _sync_paths(self) -> None:
+        """Repacks if an edge was reshaped (e.g. rerouted) since it was packed."""
+        stale = False
+        for slot, edge in enumerate(self._paths):
+            table = arc_length_table(edge)
+            if table is not self._tables[slot]:
+                self._tables[slot] = table
+                stale = True
+        if stale:
+            self._pack()
+
+    def _launch(self, path: int, is_reversed: bool, distances: np.ndarray, speed: float) -> int:
+        """Fills free slots with packets at ``distances`` along ``path``."""
+        free = np.flatnonzero(self._path < 0)[:len(distances)]
+        if len(free) < len(distances):
+            if not self.dropped:
+                logger.warning("PacketField is full (%d packets); dropping new packets", len(self._path))
+            self.dropped += len(distances) - len(free)
+        self._path[free] = path
+        self._distance[free] = distances[:len(free)]
+        self._speed[free] = speed
+        self._reverse[free] = is_reversed
+        return len(free)
+
+    def spawn(self, source: CloudNode, target: CloudNode, count: int = 1, spacing: float = None, speed: float = None) -> int:
+        """
+        Sends a burst of ``count`` packets from ``source`` to ``target``, one
+        behind the other ``spacing`` apart. Returns how many were spawned.
+        """
+        path, is_reversed = self._resolve(source, target)
+        spacing = PACKET_SPACING * self.radius if spacing is None else spacing
+        spawned = self._launch(path, is_reversed, -spacing * np.arange(count), self.speed if speed is None else speed)
+        self._refresh()
+        return spawned
+
+    def emit(self, source: CloudNode, target: CloudNode, rate: float) -> None:
+        """Streams ``rate`` packets per second from ``source`` to ``target``; 0 stops it."""
+        stream = self._resolve(source, target)
+        if rate > 0:
+            self._emitters.setdefault(stream, [0.0, 0.0])[0] = rate
+        else:
+            self._emitters.pop(stream, None)
+
+    def clear(self) -> None:
+        """Removes every packet and stream."""
+        self._path[:] = -1
+        self._emitters.clear()
+        self._refresh()
+
+    def advance(self, dt: float) -> "PacketField":
+        """Moves every packet ``dt`` seconds on; the per-frame updater."""
+        for (path, is_reversed), emitter in self._emitters.items():
+            rate, owed = emitter
+            due = owed + rate * dt
+            count = int(due)
+            if count:
+                # Packet k was due (k - owed) / rate into the frame
+                elapsed = dt - (np.arange(1, count + 1) - owed) / rate
+                self._launch(path, is_reversed, self.speed * elapsed, self.speed)
+            emitter[1] = due - count
+        self._sync_paths()
+        active = np.flatnonzero(self._path >= 0)
+        self._distance[active] += self._speed[active] * dt
+        arrived = active[self._distance[active] >= self._length[self._path[active]]]
+        self._path[arrived] = -1
+        self._refresh()
+        return self
+
+    def positions(self) -> np.ndarray:
+        """Centres of the packets on screen, one row each."""
+        index = np.flatnonzero((self._path >= 0) & (self._distance >= 0))
+        path = self._path[index]
+        length = self._length[path]
+        distance = np.minimum(self._distance[index], length)
+        distance = np.where(self._reverse[index], length - distance, distance)
+        position = self._base[path] + distance
+        segment = np.searchsorted(self._cumulative, position, side="right") - 1
+        segment = np.clip(segment, self._start[path], self._end[path] - 2)
+        low, high = self._cumulative[segment], self._cumulative[segment + 1]
+        span = high - low
+        t = np.divide(position - low, span, out=np.zeros_like(span), where=span > 0)
+        return self._vertices[segment] + (self._vertices[segment + 1] - self._vertices[segment]) * t[:, None]
+
+    def _refresh(self) -> None:
+        """Rewrites the points: one circle per visible packet."""
+        centres = self.positions()
+        points = (_UNIT_CIRCLE * self.radius)[None, :, :] + centres[:, None, :]
+        self.set_points(points.reshape(-1, 3))
+
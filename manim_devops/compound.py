@@ -0,0 +1,241 @@
+"""
+Recursive compound-graph layout for nested NodeClusters (VPC -> subnet -> ASG).
+
+Each cluster's interior is laid out on its own, bottom-up: a cluster only
+sees its direct children, with nested clusters reduced to sized boxes.
+Interiors depend only on their *shape* (nesting plus internal edges), never
+on node ids, so identical subtrees — fifty copies of the same VPC module —
+are laid out once and then served from a per-shape cache. Distinct sibling
+subtrees can be laid out in parallel on a process pool.
+
+A shape is ``None`` for a leaf, or ``(child_shapes, internal_edges)`` for a
+cluster, where ``internal_edges`` are ``(i, j)`` pairs of direct-child indices.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from manim_devops.constants import (
+    CLUSTER_CHILD_SPACING, CLUSTER_PADDING, CLUSTER_ROW_LIMIT,
+    CLUSTER_SEPARATION_ITERATIONS, CLUSTER_PARALLEL_MIN_NODES, CLUSTER_CACHE_MAX_ENTRIES,
+)
+
+Shape = Optional[tuple]
+
+
+class InteriorLayout:
+    """
+    Offsets of a cluster's direct children around the cluster center, the
+    size of the cluster's bounding box, and the nested layouts of any child
+    clusters (None for leaf children).
+    """
+    def __init__(self, offsets: np.ndarray, size: np.ndarray, children: list):
+        self.offsets = offsets
+        self.size = size
+        self.children = children
+
+
+def box_size(layout: Optional[InteriorLayout]) -> np.ndarray:
+    """Footprint of a child inside its parent: one slot for a leaf, padded bounds for a cluster."""
+    if layout is None:
+        return np.array([CLUSTER_CHILD_SPACING, CLUSTER_CHILD_SPACING])
+    return layout.size + 2 * CLUSTER_PADDING
+
+
+def leaf_count(shape: Shape) -> int:
+    if shape is None:
+        return 1
+    return sum(leaf_count(child) for child in shape[0])
+
+
+def separate_boxes(
+    centers: np.ndarray,
+    sizes: np.ndarray,
+    movers: Optional[np.ndarray] = None,
+    iterations: int = CLUSTER_SEPARATION_ITERATIONS,
+) -> np.ndarray:
+    """
+    Pushes overlapping axis-aligned boxes apart along their cheaper axis.
+    Non-mover boxes stay where they are.
+
+    Only pairs involving at least one ``movers`` box (default: all) are
+    checked, which keeps the top-level pass at O(clusters x nodes) instead
+    of O(nodes^2) on large topologies.
+    """
+    centers = np.array(centers, dtype=float)
+    n = len(centers)
+    is_mover = np.ones(n, dtype=bool) if movers is None else np.asarray(movers, dtype=bool)
+    mover_idx = np.flatnonzero(is_mover)
+    if n < 2 or len(mover_idx) == 0:
+        return centers
+    half = np.asarray(sizes, dtype=float) / 2.0
+    everyone = np.arange(n)
+    # A mover/mover pair is seen from both sides; keep only one visit
+    duplicate = is_mover[None, :] & (everyone[None, :] <= mover_idx[:, None])
+
+    for _ in range(iterations):
+        delta = centers[None, :, :] - centers[mover_idx][:, None, :]
+        overlap = half[mover_idx][:, None, :] + half[None, :, :] - np.abs(delta)
+        hit = (overlap > 1e-9).all(axis=2) & ~duplicate
+        if not hit.any():
+            break
+        rows, cols = np.nonzero(hit)
+        pair_overlap = overlap[rows, cols]
+        pair_delta = delta[rows, cols]
+        axis = np.argmin(pair_overlap, axis=1)
+        pick = np.arange(len(rows))
+        direction = np.where(pair_delta[pick, axis] >= 0, 1.0, -1.0)
+        # Two movers split the overlap; a mover alone clears all of it
+        both = is_mover[cols]
+        push = np.zeros_like(pair_delta)
+        push[pick, axis] = direction * pair_overlap[pick, axis] * np.where(both, 0.5, 1.0)
+        displacement = np.zeros_like(centers)
+        np.add.at(displacement, cols[both], push[both])
+        np.add.at(displacement, mover_idx[rows], -push)
+        centers += displacement
+    return centers
+
+
+def _pack_rows(sizes: np.ndarray, row_limit: Optional[int] = None) -> np.ndarray:
+    """
+    Packs children left-to-right in a single row. With ``row_limit``, more
+    children than that wrap into a centered, roughly square grid.
+    """
+    count = len(sizes)
+    columns = count if row_limit is None or count <= row_limit else int(np.ceil(np.sqrt(count)))
+    centers = np.zeros((count, 2))
+    row_widths = []
+    top = 0.0
+    for start in range(0, count, columns):
+        row = slice(start, min(start + columns, count))
+        widths, heights = sizes[row, 0], sizes[row, 1]
+        row_height = heights.max()
+        centers[row, 0] = np.cumsum(widths) - widths / 2.0
+        centers[row, 1] = -(top + row_height / 2.0)
+        row_widths.append((row, widths.sum()))
+        top += row_height
+    widest = max(width for _, width in row_widths)
+    for row, width in row_widths:
+        centers[row, 0] += (widest - width) / 2.0
+    return centers
+
+
+class _ShapeCache:
+    """Thread-safe LRU of InteriorLayouts keyed by (shape, engine token, row limit)."""
+    def __init__(self, max_entries: int = CLUSTER_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[InteriorLayout]:
+        with self._lock:
+            layout = self._entries.get(key)
+            if layout is not None:
+                self._entries.move_to_end(key)
+            return layout
+
+    def put(self, key, layout: InteriorLayout) -> None:
+        with self._lock:
+            self._entries[key] = layout
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+INTERIOR_CACHE = _ShapeCache()
+
+
+def layout_shape(shape: tuple, engine, row_limit: Optional[int] = CLUSTER_ROW_LIMIT) -> InteriorLayout:
+    """Lays out a cluster shape bottom-up, memoising every subtree."""
+    key = (shape, engine.cache_token, row_limit)
+    cached = INTERIOR_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    child_shapes, internal_edges = shape
+    children = [None if child is None else layout_shape(child, engine, row_limit) for child in child_shapes]
+    if not children:
+        layout = InteriorLayout(np.zeros((0, 2)), np.zeros(2), [])
+        INTERIOR_CACHE.put(key, layout)
+        return layout
+
+    sizes = np.array([box_size(child) for child in children])
+    if internal_edges:
+        sources = np.array([i for i, _ in internal_edges], dtype=np.int64)
+        targets = np.array([j for _, j in internal_edges], dtype=np.int64)
+        spread = CLUSTER_CHILD_SPACING * np.sqrt(len(children))
+        centers = engine.compute(len(children), sources, targets) * spread
+        centers = separate_boxes(centers, sizes)
+    else:
+        centers = _pack_rows(sizes, row_limit)
+
+    lo = (centers - sizes / 2.0).min(axis=0)
+    hi = (centers + sizes / 2.0).max(axis=0)
+    layout = InteriorLayout(centers - (lo + hi) / 2.0, hi - lo, children)
+    INTERIOR_CACHE.put(key, layout)
+    return layout
+
+
+def _layout_in_worker(args) -> InteriorLayout:
+    shape, engine, row_limit = args
+    return layout_shape(shape, engine, row_limit)
+
+
+def layout_shapes(
+    shapes: list[tuple], engine, workers: Optional[int] = None, row_limit: Optional[int] = CLUSTER_ROW_LIMIT
+) -> list[InteriorLayout]:
+    """
+    Lays out sibling cluster shapes. Identical shapes are computed once;
+    when the uncached work is large enough the distinct shapes are farmed
+    out to a process pool, so an estate costs about as much as its largest
+    cluster.
+    """
+    unique = list(dict.fromkeys(shapes))
+    missing = [shape for shape in unique if INTERIOR_CACHE.get((shape, engine.cache_token, row_limit)) is None]
+    if len(missing) > 1 and sum(leaf_count(shape) for shape in missing) >= CLUSTER_PARALLEL_MIN_NODES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_layout_in_worker, [(shape, engine, row_limit) for shape in missing])
+            for shape, layout in zip(missing, results):
+                INTERIOR_CACHE.put((shape, engine.cache_token, row_limit), layout)
+    resolved = {shape: layout_shape(shape, engine, row_limit) for shape in unique}
+    return [resolved[shape] for shape in shapes]
+
+
+def place_cluster(cluster, layout: InteriorLayout, center: tuple[float, float, float]) -> dict[str, tuple[float, float, float]]:
+    """Turns an InteriorLayout into absolute coordinates for every descendant."""
+    coords = {}
+    stack = [(cluster, layout, center)]
+    while stack:
+        node, node_layout, (cx, cy, cz) = stack.pop()
+        for child, child_layout, (dx, dy) in zip(node.children, node_layout.children, node_layout.offsets.tolist()):
+            child_center = (cx + dx, cy + dy, cz)
+            coords[child.node_id] = child_center
+            if child_layout is not None:  # None marks a leaf (or an already expanded cluster)
+                stack.append((child, child_layout, child_center))
+    return coords
+
+
+def cluster_shape(cluster, internal_edges: Optional[dict] = None, _seen: Optional[set] = None) -> tuple:
+    """
+    Reduces a cluster subtree to its id-free shape. ``internal_edges`` maps
+    a cluster id to the (i, j) direct-child index pairs connected inside it.
+    A cluster reachable twice (or cyclically) is only expanded the first time.
+    """
+    from manim_devops.core import NodeCluster
+    seen = _seen if _seen is not None else {cluster.node_id}
+    child_shapes = []
+    for child in cluster.children:
+        if isinstance(child, NodeCluster) and child.node_id not in seen:
+            seen.add(child.node_id)
+            child_shapes.append(cluster_shape(child, internal_edges, seen))
+        else:
+            child_shapes.append(None)
+    edges = tuple(sorted((internal_edges or {}).get(cluster.node_id, ())))
+    return (tuple(child_shapes), edges)
@@ -8,6 +8,51 @@ so they can be tuned in one place instead of grepping the codebase.
 LAYOUT_SEED = 42
 DEFAULT_SCALE_FACTOR = 3.0
 ADAPTER_SCALE_FACTOR = 4.0
+DEFAULT_LAYOUT_ENGINE = "spring"   # or "layered" for tiered DAG architectures
+LAYERED_SWEEPS = 4                 # barycenter crossing-reduction passes
+FORCE_MAX_ITERATIONS = 100         # upper bound for the grid-accelerated force engine
+FORCE_TOLERANCE = 1e-3             # stop once the mean step < tolerance * optimal distance
+FORCE_MAX_GRID = 512               # cap on repulsion grid cells per side
+FORCE_CHUNK_SIZE = 4096            # particles per near-field batch
+FORCE_KERNEL_CACHE_SIZE = 4        # FFT kernels (one per grid size) kept between iterations
+FORCE_CELL_OCCUPANCY = 1           # mean nodes per repulsion cell the grid is refined to
+
+# ─── Graph Storage ──────────────────────────────────────────
+DEFAULT_GRAPH_STORAGE = "edgelist"  # or "compact" for NumPy edge arrays on large inventories
+COMPACT_INITIAL_CAPACITY = 1024   # preallocated edge slots in CompactGraph
+COMPACT_MERGE_MIN = 4096          # pending edges buffered before merging into the sorted key array
+
+# ─── Incremental Relayout ───────────────────────────────────
+RELAYOUT_HOPS = 2           # graph distance around changed nodes that may move
+RELAYOUT_ITERATIONS = 50    # spring iterations for the warm-started region
+
+# ─── Cluster Layout ─────────────────────────────────────────
+CLUSTER_CHILD_SPACING = 1.0          # slot width of a leaf inside a cluster
+CLUSTER_PADDING = 0.5                # margin around a nested cluster's children
+CLUSTER_ROW_LIMIT = None             # opt-in: wrap children into a grid beyond this many (None = one row)
+CLUSTER_SEPARATION_ITERATIONS = 50   # overlap-removal passes for sized cluster boxes
+CLUSTER_PARALLEL_MIN_NODES = 5000    # uncached leaves before sibling clusters use a process pool
+CLUSTER_CACHE_MAX_ENTRIES = 1024     # in-memory LRU bound on memoised cluster interiors
+
+# ─── Layout Cache ───────────────────────────────────────────
+LAYOUT_CACHE_MAX_ENTRIES = 256          # LRU bound on cached layout files
+LAYOUT_CACHE_DIR_ENV = "MANIM_DEVOPS_CACHE_DIR"
+LAYOUT_CACHE_DISABLE_ENV = "MANIM_DEVOPS_NO_LAYOUT_CACHE"
+
+# ─── Edge Routing ───────────────────────────────────────────
+ROUTER_CLEARANCE = 0.15       # gap kept between a re-routed edge and foreign icons
+ROUTER_BEND_PENALTY = 0.5     # extra A* cost per 90-degree turn
+ROUTER_SEARCH_MARGIN = 2.0    # obstacle search window around an edge's bounding box
+ROUTER_TIME_BUDGET = 0.02     # seconds of search per edge before falling back to the L-bend
+ROUTER_MAX_GRID_POINTS = 50_000  # visibility-grid size of an edge before it keeps the L-bend
+ROUTER_GRID_CELL = 1.0        # cell size of the obstacle spatial index
+BUNDLE_MIN_EDGES = 3          # fan-out/fan-in size before edges share a trunk
+
+# ─── Layout Metrics ─────────────────────────────────────────
+METRICS_NODE_SIZE = 1.0           # icon footprint assumed when measuring without rendering
+METRICS_LABEL_CHAR_WIDTH = 0.12   # estimated label width per character at LABEL_FONT_SIZE
+METRICS_LABEL_HEIGHT = 0.25       # estimated label height at LABEL_FONT_SIZE
+METRICS_LABEL_GAP = 0.25          # gap between icon and label (Manim's default next_to buff)
 
 # ─── Z-Index Layering ───────────────────────────────────────
 # Higher values render on TOP of lower values.
@@ -17,11 +62,37 @@ Z_NODE = 10          # Infrastructure icons (top layer)
 
 # ─── Visual Sizing ──────────────────────────────────────────
 LABEL_FONT_SIZE = 16
+LABEL_FONT = ""               # Pango font family for node labels ("" = Manim's default)
+LABEL_CACHE_MAX_ENTRIES = 4096  # distinct label mobjects kept per process
 PACKET_RADIUS = 0.1
 PULSE_SCALE_FACTOR = 1.2
 CLUSTER_FALLBACK_RADIUS = 2.0
 SCALE_OUT_NODE_RADIUS = 0.5
 FALLBACK_CIRCLE_RADIUS = 0.5
+ICON_SCALE = 0.5           # provider SVGs are drawn at half their parsed size
+
+# ─── Icon Caches ────────────────────────────────────────────
+ICON_CACHE_MAX_ENTRIES = 128               # parsed SVG templates kept per process
+ICON_CACHE_MAX_BYTES = 64 * 1024 * 1024    # bound on the templates' point arrays
+ICON_STORE_MAX_ENTRIES = 1024              # LRU bound on parsed icons kept on disk
+ICON_STORE_DISABLE_ENV = "MANIM_DEVOPS_NO_ICON_CACHE"
+
+# ─── Icon Level of Detail ───────────────────────────────────
+ICON_LOD_LEVELS = (16, 32, 64, 128)   # on-screen icon sizes (px) that get a simplified variant
+ICON_LOD_TOLERANCE_PX = 0.5           # max deviation allowed when simplifying beziers
+ICON_LOD_MIN_DETAIL_PX = 1.0          # subpaths smaller than this on screen are dropped
+
+# ─── Render Pipeline ────────────────────────────────────────
+PIPELINE_PROCESS_MIN_NODES = 2000   # nodes before layout runs in a worker process instead of the caller
+
+# ─── Background Compositing ─────────────────────────────────
+BACKGROUND_OVERLAP_MARGIN = 0.25   # margin around moving mobjects when finding icons drawn above them
+
+# ─── Packet Motion ──────────────────────────────────────────
+PACKET_SPEED = 2.0               # scene units per second travelled by PacketField packets
+PACKET_FIELD_CAPACITY = 4096     # preallocated packet slots per PacketField
+PACKET_SPACING = 3.0             # gap between packets of one burst, in packet radii
+ARC_LENGTH_SAMPLES = 16          # samples per curved bezier in an edge's arc-length table
 
 # ─── Animation Timing ───────────────────────────────────────
 RENDER_DURATION = 3.0      # seconds for the initial topology draw
@@ -1,58 +1,94 @@
-import networkx as nx
-from typing import List, Tuple
-from manim import Scene, VMobject, Create, Text, GrowFromCenter
+"""
+The headless model layer: Topology and NodeCluster.
+
+Nothing here imports manim, so topology-generation jobs and layout tests
+never pay for the rendering stack. DevopsScene lives in
+``manim_devops.scene`` and is still importable from here; the lookup is
+deferred until it is first accessed.
+"""
+import copy
+import hashlib
+import numpy as np
+from typing import Iterable, List, Optional, Tuple, Union
 from manim_devops.assets import GraphEntity, CloudNode
-from manim_devops.layout import OrthogonalRouter
+from manim_devops.cache import LayoutCache, default_layout_cache
+from manim_devops.storage import GraphStorage, csr_from_edges, gather_neighbours, resolve_graph_storage
+from manim_devops.engines import LayoutEngine, resolve_layout_engine
+from manim_devops.compound import (
+    box_size, cluster_shape, layout_shape, layout_shapes, place_cluster, separate_boxes,
+)
 from manim_devops.constants import (
-    LAYOUT_SEED, DEFAULT_SCALE_FACTOR, Z_NODE, Z_EDGE,
-    LABEL_FONT_SIZE, CLUSTER_FALLBACK_RADIUS,
-    RENDER_DURATION, POST_RENDER_WAIT, EDGE_COLOR,
+    LAYOUT_SEED, DEFAULT_SCALE_FACTOR, DEFAULT_LAYOUT_ENGINE, CLUSTER_ROW_LIMIT, DEFAULT_GRAPH_STORAGE,
+    RELAYOUT_HOPS, RELAYOUT_ITERATIONS,
 )
 
 class NodeCluster(GraphEntity):
     """
-    A logical container that NetworkX treats as a single layout node, 
-    but which internally calculates deterministic offsets for its children, 
+    A logical container that the layout engine treats as a single sized node,
+    but which internally calculates deterministic offsets for its children,
     preventing sub-graph physics collisions.
+
+    Clusters nest (VPC -> subnet -> ASG): a child may itself be a NodeCluster,
+    and the interior of every cluster is laid out recursively, bottom-up.
     
     Inherits from GraphEntity (not CloudNode) because it is NOT renderable —
     it has no SVG, no .move_to(), and no .width. This prevents Liskov violations.
     """
     def __init__(self, node_id: str, label: str):
         super().__init__(node_id, label)
-        self.children: List[CloudNode] = []
+        self.children: List[GraphEntity] = []
         
-    def add_child(self, child: CloudNode):
+    def add_child(self, child: GraphEntity):
         if child not in self.children:
             self.children.append(child)
             
     def resolve_child_coordinates(self, center: tuple[float, float, float]) -> dict[str, tuple[float, float, float]]:
         """
-        Calculates horizontal offsets for children relative to the center.
-        Dynamically supports any number of children by spacing them evenly.
+        Calculates offsets for every descendant relative to the center.
+        Leaf children are spaced evenly in a row; nested clusters are laid
+        out recursively and packed as boxes. Internal edges are unknown here — use
+        Topology.resolve_cluster_coordinates() to take them into account.
         """
-        coords = {}
-        n = len(self.children)
-        if n == 0:
-            return coords
-        
-        spacing = 1.0
-        # Center the children: offsets go from -(n-1)/2 to +(n-1)/2
-        for i, child in enumerate(self.children):
-            offset_x = (i - (n - 1) / 2) * spacing
-            coords[child.node_id] = (center[0] + offset_x, center[1], center[2])
-        return coords
+        if not self.children:
+            return {}
+        layout = layout_shape(cluster_shape(self), resolve_layout_engine(DEFAULT_LAYOUT_ENGINE))
+        return place_cluster(self, layout, center)
 
 class Topology:
     """
     The mathematical model representing the architecture state.
-    Calculates layouts utilizing NetworkX.
+    Calculates layouts through a pluggable LayoutEngine ("spring" by
+    default, which delegates to NetworkX; "layered" for tiered DAGs).
+
+    Node ids are interned in a GraphStorage, so engines receive edge index
+    arrays directly. ``graph_storage="compact"`` keeps the edges in NumPy
+    arrays instead of the default edge dict, for large inventories.
+
+    Layouts are memoised in a persistent LayoutCache keyed by the graph
+    shape, so re-rendering an unchanged architecture skips the engine.
+    ``layout_cache=None`` uses the shared default_layout_cache();
+    pass ``layout_cache=False`` to always recompute.
+
+    ``cluster_row_limit`` opts in to wrapping unconnected cluster children
+    into a grid beyond that many; by default they stay in one row.
     """
-    def __init__(self, scale_factor: float = DEFAULT_SCALE_FACTOR):
+    def __init__(
+        self,
+        scale_factor: float = DEFAULT_SCALE_FACTOR,
+        layout_cache: Union[LayoutCache, None, bool] = None,
+        layout_engine: Union[str, LayoutEngine] = DEFAULT_LAYOUT_ENGINE,
+        cluster_row_limit: Optional[int] = CLUSTER_ROW_LIMIT,
+        graph_storage: Union[str, GraphStorage] = DEFAULT_GRAPH_STORAGE,
+    ):
         self._nodes: dict[str, GraphEntity] = {}
-        self._edges: set[tuple[str, str]] = set()
-        self._edge_order: list[tuple[str, str]] = []  # preserve draw order
+        self._graph = resolve_graph_storage(graph_storage)  # interned ids + edges, in draw order
         self.scale_factor = scale_factor
+        if layout_cache is None:
+            layout_cache = default_layout_cache()
+        self.layout_cache = None if layout_cache is False else layout_cache
+        self.layout_engine = resolve_layout_engine(layout_engine)
+        self.cluster_row_limit = cluster_row_limit
+        self._compound = None  # (layout_key, _compound_graph() result)
 
     @property
     def nodes(self) -> list[GraphEntity]:
@@ -62,124 +98,382 @@ class Topology:
     @property
     def edges(self) -> list[tuple[str, str]]:
         """Public API — returns edges in insertion order."""
-        return list(self._edge_order)
+        return list(self._graph.edges())
+
+    @property
+    def graph(self) -> GraphStorage:
+        """Interned view of the edges for engines that work on indices."""
+        return self._graph
 
     def add_node(self, node: GraphEntity) -> None:
         if node.node_id not in self._nodes:
             self._nodes[node.node_id] = node
+            self._graph.intern(node.node_id)
 
     def add_nodes(self, nodes: list[GraphEntity]) -> None:
         for node in nodes:
             self.add_node(node)
 
     def connect(self, source: GraphEntity, target: GraphEntity) -> None:
-        edge = (source.node_id, target.node_id)
-        if edge not in self._edges:
-            self._edges.add(edge)
-            self._edge_order.append(edge)
+        self._graph.add_edge(self._graph.intern(source.node_id), self._graph.intern(target.node_id))
 
-    def calculate_layout(self) -> dict[str, tuple[float, float, float]]:
-        G = nx.DiGraph()
-        for node_id in self._nodes:
-            G.add_node(node_id)
-        for edge in self._edge_order:
-            G.add_edge(edge[0], edge[1])
+    def _compound_graph(
+        self, key: Optional[str] = None,
+    ) -> tuple[list[str], np.ndarray, np.ndarray, dict[str, set[tuple[int, int]]], dict[str, str]]:
+        """
+        The collapsed graph of _build_compound_graph(), cached per layout key
+        so repeated ScaleOutActions on an unchanged topology don't rebuild it.
+        The result is shared: callers must not mutate it.
+        """
+        key = self.layout_key() if key is None else key
+        if self._compound is None or self._compound[0] != key:
+            self._compound = (key, self._build_compound_graph())
+        return self._compound[1]
 
-        nx_coords = nx.spring_layout(G, seed=LAYOUT_SEED)
+    def _build_compound_graph(
+        self,
+    ) -> tuple[list[str], np.ndarray, np.ndarray, dict[str, set[tuple[int, int]]], dict[str, str]]:
+        """
+        Collapses nested clusters into their top-level ancestors.
 
-        manim_coords = {}
-        for node_id, vector_2d in nx_coords.items():
-            x = float(vector_2d[0]) * self.scale_factor
-            y = float(vector_2d[1]) * self.scale_factor
-            manim_coords[node_id] = (x, y, 0.0)
-            
-        # Phase 4: Dynamic Sub-Graph Coordinates
+        Returns the top-level node ids (insertion order, followed by edge
+        endpoints that were never added, in edge order), the edges lifted to
+        those ids as index arrays (deduplicated, first-appearance order), the
+        internal edges of every cluster as (i, j) direct-child index pairs,
+        and the top-level owner of every node id (itself if top-level).
+        An edge between a cluster and its own descendant has no geometric
+        meaning inside the cluster and is ignored by the layout.
+        """
+        nested = set()
         for node in self._nodes.values():
             if isinstance(node, NodeCluster):
-                cluster_center = manim_coords[node.node_id]
-                child_coords = node.resolve_child_coordinates(cluster_center)
-                manim_coords.update(child_coords)
+                stack, seen = [node], {node.node_id}
+                while stack:
+                    for child in stack.pop().children:
+                        if child.node_id not in seen:
+                            seen.add(child.node_id)
+                            nested.add(child.node_id)
+                            if isinstance(child, NodeCluster):
+                                stack.append(child)
+        ids = [node_id for node_id in self._nodes if node_id not in nested]
 
-        return manim_coords
+        # Path of (cluster id, child index) hops from a top-level node down to each
+        # descendant; mirrors the traversal order of compound.cluster_shape()
+        paths: dict[str, list[tuple[str, int]]] = {node_id: [] for node_id in ids}
 
+        def assign(cluster: NodeCluster, prefix: list[tuple[str, int]], seen: set[str]) -> None:
+            for i, child in enumerate(cluster.children):
+                if isinstance(child, NodeCluster) and child.node_id in seen:
+                    continue
+                paths.setdefault(child.node_id, prefix + [(cluster.node_id, i)])
+                if isinstance(child, NodeCluster):
+                    seen.add(child.node_id)
+                    assign(child, paths[child.node_id], seen)
 
-class DevopsScene(Scene):
-    """
-    The orchestrator. Replaces standard Manim Scene to provide
-    context-aware rendering of Topologies without manual cartesian tracking.
-    """
-    def render_topology(self, topology: Topology) -> None:
+        for node_id in list(ids):
+            node = self._nodes[node_id]
+            if isinstance(node, NodeCluster):
+                assign(node, [], {node_id})
+        # Members of a cluster cycle have no top-level ancestor; keep them top-level
+        for node_id in self._nodes:
+            if node_id not in paths:
+                paths[node_id] = []
+                ids.append(node_id)
+        index = {node_id: i for i, node_id in enumerate(ids)}
+
+        # Top-level position of every interned id (-1 for never-added endpoints)
+        graph = self._graph
+        owner = np.full(graph.num_nodes, -1, dtype=np.int64)
+        for node_id, path in paths.items():
+            interned = graph.get(node_id)
+            if interned is not None:
+                owner[interned] = index[path[0][0] if path else node_id]
+        edge_sources, edge_targets = graph.edge_arrays()
+        endpoints = np.column_stack([edge_sources, edge_targets]).ravel()
+        implicit = endpoints[owner[endpoints] < 0]
+        if len(implicit):  # Implicit nodes, in edge order, as NetworkX would add them
+            _, first = np.unique(implicit, return_index=True)
+            for interned in implicit[np.sort(first)].tolist():
+                owner[interned] = len(ids)
+                paths[graph.ids[interned]] = []
+                ids.append(graph.ids[interned])
+
+        lifted_sources = owner[edge_sources]
+        lifted_targets = owner[edge_targets]
+        crossing = lifted_sources != lifted_targets
+        lifted_sources, lifted_targets = lifted_sources[crossing], lifted_targets[crossing]
+        _, first = np.unique(lifted_sources * len(ids) + lifted_targets, return_index=True)
+        first.sort()
+        sources, targets = lifted_sources[first], lifted_targets[first]
+
+        internal: dict[str, set[tuple[int, int]]] = {}
+        for edge in np.flatnonzero(~crossing).tolist():
+            src, tgt = graph.ids[edge_sources[edge]], graph.ids[edge_targets[edge]]
+            src_path, tgt_path = paths[src], paths[tgt]
+            src_line = [cluster_id for cluster_id, _ in src_path] + [src]
+            tgt_line = [cluster_id for cluster_id, _ in tgt_path] + [tgt]
+            depth = 0
+            while depth < min(len(src_line), len(tgt_line)) and src_line[depth] == tgt_line[depth]:
+                depth += 1
+            if depth == len(src_line) or depth == len(tgt_line):
+                continue  # Self-loop, or an edge into the endpoint's own cluster
+            ancestor = src_path[depth - 1][0]
+            internal.setdefault(ancestor, set()).add((src_path[depth - 1][1], tgt_path[depth - 1][1]))
+
+        owners = {node_id: path[0][0] if path else node_id for node_id, path in paths.items()}
+        return ids, sources, targets, internal, owners
+
+    def _place_descendants(
+        self,
+        coords: dict[str, tuple[float, float, float]],
+        ids: list[str],
+        internal: dict[str, set[tuple[int, int]]],
+    ) -> list[tuple[int, np.ndarray]]:
         """
-        Takes a Topology, positions all nodes natively, draws the Orthogonal
-        edges, and plays a unified FadeIn/Create animation.
+        Lays out every top-level cluster interior and writes the absolute
+        coordinates of all descendants into ``coords``. Returns the index and
+        footprint of each placed cluster.
         """
-        coords = topology.calculate_layout()
-        router = OrthogonalRouter()
-        
-        self.topology = topology  # Store reference so ScaleOutAction can sync (Finding 04)
-        self.rendered_coords = coords  # Persistent memory for ScaleOut offsets Matrix
-        self.rendered_edges = {}  # Persistent memory for Phase 3 TrafficFlow animations
-        animations = []
-        
-        # 1. Place the Mobjects (Nodes) at their mathematical coordinates
-        for node in topology.nodes:
-            # Phase 4 Bugfix: NodeClusters are purely abstract geometric containers.
-            # They do not have visual SVGs or `.move_to()` rendering methods.
-            if isinstance(node, NodeCluster):
-                continue
-                
-            numeric_coord = coords[node.node_id]
-            node.move_to(numeric_coord)
-            
-            # Force nodes to render on top of lines
-            node.set_z_index(Z_NODE)
-            
-            animations.append(GrowFromCenter(node))
-            
-            # Keep track of generated visuals for future cinematic actions (Phase 3)
-            self.mobjects.append(node)
-            
-            # Add text label below
-            label = Text(node.label or node.node_id, font_size=LABEL_FONT_SIZE)
-            label.next_to(node, direction=[0, -1, 0])
-            label.set_z_index(Z_NODE)
-            
-            animations.append(Create(label))
-            
-        # 2. Build a lookup dict for O(1) node access during edge rendering
-        node_lookup = {n.node_id: n for n in topology.nodes}
-        for mob in self.mobjects:
-            if hasattr(mob, 'node_id'):
-                node_lookup[mob.node_id] = mob
-        
-        # 3. Draw the Orthogonal Routing Edges
-        for src_id, tgt_id in topology.edges:
-            src_node = node_lookup[src_id]
-            tgt_node = node_lookup[tgt_id]
-            
-            # Phase 4 Bugfix: NodeClusters don't have .width
-            src_radius = CLUSTER_FALLBACK_RADIUS if isinstance(src_node, NodeCluster) else src_node.width / 2.0
-            tgt_radius = CLUSTER_FALLBACK_RADIUS if isinstance(tgt_node, NodeCluster) else tgt_node.width / 2.0
-            
-            waypoints = router.compute_path(
-                coords[src_id],
-                coords[tgt_id],
-                source_radius=src_radius,
-                target_radius=tgt_radius
-            )
-            
-            line = VMobject(color=EDGE_COLOR)
-            line.set_points_as_corners(waypoints)
-            
-            # Z-Index renders below components
-            line.set_z_index(Z_EDGE) 
-            
-            # Store edge mathematically for future traffic animation (Phase 3)
-            self.rendered_edges[(src_id, tgt_id)] = line
-            
-            animations.append(Create(line))
+        clusters = [
+            (i, self._nodes[node_id]) for i, node_id in enumerate(ids)
+            if isinstance(self._nodes.get(node_id), NodeCluster) and node_id in coords
+        ]
+        layouts = layout_shapes(
+            [cluster_shape(cluster, internal) for _, cluster in clusters], self.layout_engine,
+            row_limit=self.cluster_row_limit,
+        )
+        for (_, cluster), layout in zip(clusters, layouts):
+            for node_id, xyz in place_cluster(cluster, layout, coords[cluster.node_id]).items():
+                coords.setdefault(node_id, xyz)  # A node shared by two clusters stays with the first
+        return [(i, box_size(layout)) for (i, _), layout in zip(clusters, layouts)]
+
+    def resolve_cluster_coordinates(
+        self, cluster: NodeCluster, center: tuple[float, float, float]
+    ) -> dict[str, tuple[float, float, float]]:
+        """
+        Like NodeCluster.resolve_child_coordinates(), but lays the interior out
+        with this topology's engine, honouring edges between the children.
+        """
+        if not cluster.children:
+            return {}
+        internal = self._compound_graph()[3]
+        layout = layout_shape(cluster_shape(cluster, internal), self.layout_engine, self.cluster_row_limit)
+        return place_cluster(cluster, layout, center)
+
+    def layout_key(self) -> str:
+        """
+        Stable content hash of every input that influences calculate_layout().
+        Node and edge order are included because spring_layout's seeded
+        initial positions depend on insertion order.
+        """
+        clusters = {}
+        stack = [node for node in self._nodes.values() if isinstance(node, NodeCluster)]
+        while stack:
+            cluster = stack.pop()
+            if cluster.node_id not in clusters:
+                clusters[cluster.node_id] = [child.node_id for child in cluster.children]
+                stack.extend(child for child in cluster.children if isinstance(child, NodeCluster))
+        edge_sources, edge_targets = self._graph.edge_arrays()
+        edge_digest = hashlib.sha256(edge_sources.tobytes() + edge_targets.tobytes()).hexdigest()
+        return LayoutCache.make_key({
+            "nodes": list(self._nodes),
+            "interned": self._graph.ids,
+            "edges": edge_digest,
+            "clusters": clusters,
+            "scale_factor": float(self.scale_factor),
+            "seed": LAYOUT_SEED,
+            "engine": self.layout_engine.cache_token,
+            "cluster_row_limit": self.cluster_row_limit,
+        })
+
+    def calculate_layout(self) -> dict[str, tuple[float, float, float]]:
+        cache_key = None
+        if self.layout_cache is not None:
+            cache_key = self.layout_key()
+            cached = self.layout_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        manim_coords = self._compute_layout(cache_key)
+
+        if cache_key is not None:
+            self.layout_cache.put(cache_key, manim_coords)
+        return manim_coords
+
+    def layout_snapshot(self) -> "Topology":
+        """
+        A copy holding only what calculate_layout() reads: ids, cluster
+        structure, edges, scale, engine and cache. Render state stays behind,
+        so the copy is cheap to pickle to a worker process and yields the
+        same layout (and cache key).
+        """
+        entities: dict[str, GraphEntity] = {}
+
+        def skeleton(node: GraphEntity) -> GraphEntity:
+            if node.node_id not in entities:
+                if isinstance(node, NodeCluster):
+                    cluster = entities[node.node_id] = NodeCluster(node.node_id, node.label)
+                    cluster.children = [skeleton(child) for child in node.children]
+                else:
+                    entities[node.node_id] = GraphEntity(node.node_id, node.label)
+            return entities[node.node_id]
+
+        snapshot = Topology.__new__(Topology)
+        snapshot._nodes = {node_id: skeleton(node) for node_id, node in self._nodes.items()}
+        snapshot._graph = copy.deepcopy(self._graph)
+        snapshot.scale_factor = self.scale_factor
+        snapshot.layout_cache = self.layout_cache
+        snapshot.layout_engine = self.layout_engine
+        snapshot.cluster_row_limit = self.cluster_row_limit
+        snapshot._compound = None
+        return snapshot
+
+    def _compute_layout(self, key: Optional[str] = None) -> dict[str, tuple[float, float, float]]:
+        ids, sources, targets, internal, _ = self._compound_graph(key)
+        positions = self.layout_engine.compute(len(ids), sources, targets) * self.scale_factor
+
+        manim_coords = {
+            node_id: (float(x), float(y), 0.0)
+            for node_id, (x, y) in zip(ids, positions.tolist())
+        }
             
-        # Play the cinematic rendering
-        self.play(*animations, run_time=RENDER_DURATION)
-        self.wait(POST_RENDER_WAIT)
+        # Phase 4: Dynamic Sub-Graph Coordinates, laid out recursively per cluster
+        placed = self._place_descendants(manim_coords, ids, internal)
+        if not placed:
+            return manim_coords
+
+        # Clusters are sized super-nodes: push them off anything they now cover
+        sizes = np.tile(box_size(None), (len(ids), 1))
+        movers = np.zeros(len(ids), dtype=bool)
+        for i, size in placed:
+            sizes[i] = size
+            movers[i] = True
+        separated = separate_boxes(positions, sizes, movers)
+        if np.array_equal(separated, positions):
+            return manim_coords
+        top_level = {
+            node_id: (float(x), float(y), 0.0)
+            for node_id, (x, y) in zip(ids, separated.tolist())
+        }
+        self._place_descendants(top_level, ids, internal)
+        return top_level
+
+    def relayout(
+        self,
+        previous: dict[str, tuple[float, float, float]],
+        changed: Iterable[str],
+        hops: int = RELAYOUT_HOPS,
+        iterations: int = RELAYOUT_ITERATIONS,
+    ) -> dict[str, tuple[float, float, float]]:
+        """
+        Incrementally updates a previous layout after a few nodes were added
+        or reconnected, instead of recomputing (and moving) everything.
+
+        The engine is warm-started from ``previous``; only nodes within
+        ``hops`` graph hops of ``changed`` may move, while their outer
+        neighbours and any node already sitting close to that region stay
+        pinned as anchors. Every other coordinate is copied through untouched.
+        A change inside a cluster moves that cluster as a whole and re-packs
+        its interior. Engines without warm-start support (e.g. "layered",
+        which is linear anyway) fall back to a full calculate_layout().
+        """
+        ids, edge_sources, edge_targets, internal, owners = self._compound_graph()
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        changed = list(dict.fromkeys(index[owners[node_id]] for node_id in changed if node_id in owners))
+        if not changed:
+            return dict(previous)
+        if not self.layout_engine.supports_warm_start or not any(node_id in previous for node_id in ids):
+            return self.calculate_layout()
+
+        num_nodes = len(ids)
+        indptr, neighbours = csr_from_edges(num_nodes, edge_sources, edge_targets, undirected=True)
+
+        # 1. Breadth-first ring of nodes that are allowed to move
+        depth = np.full(num_nodes, -1, dtype=np.int64)
+        depth[changed] = 0
+        frontier = np.array(changed, dtype=np.int64)
+        for ring in range(1, hops + 1):
+            reached = gather_neighbours(indptr, neighbours, frontier)
+            frontier = np.unique(reached[depth[reached] < 0])
+            if len(frontier) == 0:
+                break
+            depth[frontier] = ring
+        free = depth >= 0
+
+        # 2. Seed positions in normalised layout space; new nodes start at
+        #    the centroid of their already-placed neighbours
+        rng = np.random.default_rng(LAYOUT_SEED)
+        scale = self.scale_factor
+        pos = np.zeros((num_nodes, 2))
+        has_pos = np.zeros(num_nodes, dtype=bool)
+        for i, node_id in enumerate(ids):
+            if node_id in previous:
+                pos[i] = previous[node_id][:2]
+                has_pos[i] = True
+        pos /= scale
+        was_placed = has_pos.copy()
+        placed_centroid = pos[has_pos].mean(axis=0) if has_pos.any() else np.zeros(2)
+        # Stable sort over index order (never set order) keeps LAYOUT_SEED determinism
+        seeds = np.flatnonzero(free & ~has_pos)
+        for i in seeds[np.argsort(depth[seeds], kind="stable")].tolist():
+            adjacent = neighbours[indptr[i]:indptr[i + 1]]
+            anchors = pos[adjacent[has_pos[adjacent]]]
+            centroid = anchors.mean(axis=0) if len(anchors) else placed_centroid
+            pos[i] = centroid + rng.uniform(-0.05, 0.05, size=2)
+            has_pos[i] = True
+
+        # 3. Anchors: graph neighbours of the free region plus any unchanged
+        #    node within two spacings of it, so the region doesn't collapse
+        #    onto unrelated icons
+        pinned = np.zeros(num_nodes, dtype=bool)
+        pinned[gather_neighbours(indptr, neighbours, np.flatnonzero(free))] = True
+        pinned &= ~free
+        spacing = 1.0 / np.sqrt(num_nodes)
+        outside = np.flatnonzero(has_pos & ~free)
+        if len(outside):
+            # (free x outside) distance matrix; the free region is small
+            gaps = np.linalg.norm(pos[outside][None, :, :] - pos[free][:, None, :], axis=2)
+            pinned[outside[(gaps < 2.0 * spacing).any(axis=0)]] = True
+        if not pinned.any():
+            # The neighbourhood swallowed the whole graph: keep every
+            # previously placed node still and only settle the new ones
+            pinned = free & was_placed
+            pinned[changed] = False
+            free &= ~pinned
+            if not pinned.any():
+                return self.calculate_layout()
+
+        region = np.flatnonzero(free | pinned)
+        local = np.full(num_nodes, -1, dtype=np.int64)
+        local[region] = np.arange(len(region))
+        keep = (local[edge_sources] >= 0) & (local[edge_targets] >= 0) & (free[edge_sources] | free[edge_targets])
+        relaxed = self.layout_engine.relax(
+            len(region),
+            local[edge_sources[keep]],
+            local[edge_targets[keep]],
+            initial=pos[region],
+            fixed=pinned[region],
+            spacing=spacing,
+            iterations=iterations,
+        )
+
+        manim_coords = dict(previous)
+        for i, (x, y) in zip(region.tolist(), relaxed.tolist()):
+            if free[i]:
+                manim_coords[ids[i]] = (float(x) * scale, float(y) * scale, 0.0)
+
+        # Re-pack moved clusters; untouched ones keep their previous interiors
+        moved = [ids[i] for i in np.flatnonzero(free).tolist()]
+        descendants: dict[str, tuple[float, float, float]] = {node_id: manim_coords[node_id] for node_id in moved}
+        self._place_descendants(descendants, moved, internal)
+        manim_coords.update(descendants)
+
+        return manim_coords
+
 
+def __getattr__(name: str):
+    # Lazy re-export: importing the scene pulls in manim
+    if name == "DevopsScene":
+        from manim_devops.scene import DevopsScene
+        return DevopsScene
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,50 @@
+"""
+All static edges of a diagram drawn as one mobject.
+
+One VMobject per edge means one Create per edge when revealing and one
+mobject per edge for the renderer to walk on every frame. An ``EdgeLayer``
+packs the paths of every edge sharing a style and z-layer into the subpaths
+of a single VMobject instead. Paths are kept by key (an edge, or a bundle
+segment), so one edge can be rerouted and the layer repacked in one numpy
+pass.
+
+The layer is only what is drawn: ``scene.rendered_edges`` still maps every
+edge to its own undrawn VMobject, which TrafficFlow travels along.
+"""
+from typing import Hashable, Optional
+
+import numpy as np
+from manim import VMobject
+
+
+def corner_curves(waypoints: np.ndarray) -> np.ndarray:
+    """
+    Straight cubic bezier segments through ``waypoints``, as
+    ``VMobject.set_points_as_corners`` builds them, in one array.
+    """
+    waypoints = np.asarray(waypoints, dtype=float).reshape(-1, 3)
+    if len(waypoints) < 2:
+        return np.zeros((0, 3))
+    starts, ends = waypoints[:-1], waypoints[1:]
+    step = (ends - starts) / 3.0
+    return np.stack([starts, starts + step, ends - step, ends], axis=1).reshape(-1, 3)
+
+
+class EdgeLayer(VMobject):
+    """A VMobject whose subpaths are the stored edge paths, in insertion order."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.edge_paths: dict[Hashable, np.ndarray] = {}
+
+    def set_path(self, key: Hashable, waypoints) -> None:
+        """Stores (or replaces) a path; call ``rebuild`` to redraw."""
+        self.edge_paths[key] = np.asarray(waypoints, dtype=float).reshape(-1, 3)
+
+    def remove_path(self, key: Hashable) -> Optional[np.ndarray]:
+        return self.edge_paths.pop(key, None)
+
+    def rebuild(self) -> "EdgeLayer":
+        """Repacks every stored path into this mobject's points."""
+        curves = [corner_curves(waypoints) for waypoints in self.edge_paths.values()]
+        self.set_points(np.concatenate(curves) if curves else np.zeros((0, 3)))
+        return self
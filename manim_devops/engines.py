@@ -0,0 +1,462 @@
+"""
+Pluggable layout engines for Topology.
+
+Every engine works on integer node indices: it receives the node count and
+two parallel arrays of edge endpoints, and returns an ``(n, 2)`` array of
+positions normalised to roughly ``[-1, 1]`` (the same convention as
+``nx.spring_layout``). Topology owns the id <-> index mapping and the
+scale factor, so engines never see Python node objects.
+"""
+from collections import OrderedDict
+from importlib import metadata
+from typing import Optional, Union
+
+import numpy as np
+
+from manim_devops.constants import (
+    LAYOUT_SEED, LAYERED_SWEEPS,
+    FORCE_MAX_ITERATIONS, FORCE_TOLERANCE, FORCE_MAX_GRID, FORCE_CHUNK_SIZE, FORCE_CELL_OCCUPANCY,
+    FORCE_KERNEL_CACHE_SIZE,
+)
+
+
+def _normalise(positions: np.ndarray) -> np.ndarray:
+    """Centers positions on the origin and scales the largest coordinate to 1."""
+    if len(positions) == 0:
+        return positions
+    positions = positions - positions.mean(axis=0)
+    extent = np.abs(positions).max()
+    return positions / extent if extent > 0 else positions
+
+
+class LayoutEngine:
+    """
+    Base class for layout engines.
+
+    Subclasses implement ``compute``. Engines that can warm-start from an
+    existing layout also implement ``relax``; Topology.relayout falls back
+    to a full layout for engines that do not.
+    """
+    name = "base"
+
+    @property
+    def cache_token(self) -> str:
+        """Identifies the engine and its parameters inside layout cache keys."""
+        return self.name
+
+    def compute(self, num_nodes: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def relax(
+        self,
+        num_nodes: int,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        initial: np.ndarray,
+        fixed: np.ndarray,
+        spacing: float,
+        iterations: int,
+    ) -> np.ndarray:
+        """
+        Moves the non-``fixed`` nodes of ``initial`` towards equilibrium.
+        ``fixed`` is a boolean mask; fixed rows must be returned unchanged.
+        """
+        raise NotImplementedError
+
+    @property
+    def supports_warm_start(self) -> bool:
+        return type(self).relax is not LayoutEngine.relax
+
+
+class SpringLayoutEngine(LayoutEngine):
+    """Force-directed layout delegated to ``nx.spring_layout`` (the original engine)."""
+    name = "spring"
+
+    @property
+    def cache_token(self) -> str:
+        return f"{self.name}:networkx-{metadata.version('networkx')}"
+
+    @staticmethod
+    def _graph(num_nodes: int, sources: np.ndarray, targets: np.ndarray, directed: bool = True):
+        import networkx as nx
+        G = nx.DiGraph() if directed else nx.Graph()
+        G.add_nodes_from(range(num_nodes))
+        G.add_edges_from(zip(sources.tolist(), targets.tolist()))
+        return G
+
+    def compute(self, num_nodes: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        import networkx as nx
+        if num_nodes == 0:
+            return np.zeros((0, 2))
+        nx_coords = nx.spring_layout(self._graph(num_nodes, sources, targets), seed=LAYOUT_SEED)
+        return np.array([nx_coords[i] for i in range(num_nodes)], dtype=float).reshape(num_nodes, 2)
+
+    def relax(self, num_nodes, sources, targets, initial, fixed, spacing, iterations):
+        import networkx as nx
+        relaxed = nx.spring_layout(
+            self._graph(num_nodes, sources, targets, directed=False),
+            pos={i: initial[i] for i in range(num_nodes)},
+            fixed=np.flatnonzero(fixed).tolist(),
+            k=spacing,
+            iterations=iterations,
+            seed=LAYOUT_SEED,
+        )
+        return np.array([relaxed[i] for i in range(num_nodes)], dtype=float)
+
+
+class LayeredLayoutEngine(LayoutEngine):
+    """
+    Sugiyama-style layered layout for tiered architectures.
+
+    1. Cycle removal: back edges of an iterative DFS are ignored.
+    2. Ranking: longest path from the sources, so DNS -> IGW -> ALB -> ...
+       land on successive tiers (top to bottom).
+    3. Crossing reduction: alternating down/up barycenter sweeps.
+    4. Coordinates: each tier is centered horizontally, one unit per slot.
+
+    Every stage is O(V + E) per sweep (plus a per-layer sort), versus the
+    O(V^2) per iteration of spring_layout.
+    """
+    name = "layered"
+
+    def __init__(self, sweeps: int = LAYERED_SWEEPS):
+        self.sweeps = sweeps
+
+    @property
+    def cache_token(self) -> str:
+        return f"{self.name}:sweeps={self.sweeps}"
+
+    def compute(self, num_nodes: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        if num_nodes == 0:
+            return np.zeros((0, 2))
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keep = sources != targets  # Self-loops carry no ranking information
+        sources, targets = sources[keep], targets[keep]
+
+        forward = self._acyclic_mask(num_nodes, sources, targets)
+        # Reversing (rather than dropping) back edges keeps cyclic nodes close
+        src = np.where(forward, sources, targets)
+        tgt = np.where(forward, targets, sources)
+
+        rank = self._longest_path_ranks(num_nodes, src, tgt)
+        order = self._reduce_crossings(num_nodes, src, tgt, rank)
+
+        layer_sizes = np.bincount(rank)
+        positions = np.empty((num_nodes, 2))
+        positions[:, 0] = order - (layer_sizes[rank] - 1) / 2.0
+        positions[:, 1] = -rank.astype(float)
+        return _normalise(positions)
+
+    @staticmethod
+    def _csr(num_nodes: int, src: np.ndarray, tgt: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Outgoing adjacency as (indptr, neighbour indices, edge ids)."""
+        edge_ids = np.argsort(src, kind="stable")
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+        return indptr, tgt[edge_ids], edge_ids
+
+    def _acyclic_mask(self, num_nodes: int, src: np.ndarray, tgt: np.ndarray) -> np.ndarray:
+        """Marks every edge True except the back edges of a DFS forest."""
+        indptr, neighbours, edge_ids = self._csr(num_nodes, src, tgt)
+        indptr, neighbours, edge_ids = indptr.tolist(), neighbours.tolist(), edge_ids.tolist()
+        forward = np.ones(len(src), dtype=bool)
+        state = [0] * num_nodes  # 0 = unvisited, 1 = on stack, 2 = done
+        for root in range(num_nodes):
+            if state[root]:
+                continue
+            state[root] = 1
+            stack = [(root, indptr[root])]
+            while stack:
+                node, cursor = stack[-1]
+                if cursor == indptr[node + 1]:
+                    state[node] = 2
+                    stack.pop()
+                    continue
+                stack[-1] = (node, cursor + 1)
+                nxt = neighbours[cursor]
+                if state[nxt] == 1:
+                    forward[edge_ids[cursor]] = False
+                elif state[nxt] == 0:
+                    state[nxt] = 1
+                    stack.append((nxt, indptr[nxt]))
+        return forward
+
+    def _longest_path_ranks(self, num_nodes: int, src: np.ndarray, tgt: np.ndarray) -> np.ndarray:
+        """Kahn's algorithm over the DAG, then pulls sources down next to their successors."""
+        indptr, neighbours, _ = self._csr(num_nodes, src, tgt)
+        indptr, neighbours = indptr.tolist(), neighbours.tolist()
+        indegree = np.bincount(tgt, minlength=num_nodes).tolist()
+        rank = [0] * num_nodes
+        frontier = [i for i in range(num_nodes) if indegree[i] == 0]
+        while frontier:
+            node = frontier.pop()
+            next_rank = rank[node] + 1
+            for nxt in neighbours[indptr[node]:indptr[node + 1]]:
+                if rank[nxt] < next_rank:
+                    rank[nxt] = next_rank
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    frontier.append(nxt)
+        rank = np.array(rank, dtype=np.int64)
+
+        # A source feeding only a deep tier would otherwise float at the top
+        if len(src):
+            is_source = np.bincount(tgt, minlength=num_nodes) == 0
+            closest_successor = np.full(num_nodes, np.iinfo(np.int64).max)
+            np.minimum.at(closest_successor, src, rank[tgt])
+            pull = is_source & (closest_successor != np.iinfo(np.int64).max)
+            rank[pull] = closest_successor[pull] - 1
+        return rank - rank.min()
+
+    def _reduce_crossings(self, num_nodes: int, src: np.ndarray, tgt: np.ndarray, rank: np.ndarray) -> np.ndarray:
+        """Returns each node's slot within its layer after barycenter sweeps."""
+        num_layers = int(rank.max()) + 1
+        # Initial order: insertion order within each layer
+        by_layer = np.lexsort((np.arange(num_nodes), rank))
+        layer_starts = np.searchsorted(rank[by_layer], np.arange(num_layers + 1))
+        layers = [by_layer[layer_starts[r]:layer_starts[r + 1]] for r in range(num_layers)]
+        order = np.empty(num_nodes)
+        for members in layers:
+            order[members] = np.arange(len(members))
+
+        # Edges grouped by the layer of the node being reordered
+        down = np.argsort(rank[tgt], kind="stable")
+        down_starts = np.searchsorted(rank[tgt][down], np.arange(num_layers + 1))
+        up = np.argsort(rank[src], kind="stable")
+        up_starts = np.searchsorted(rank[src][up], np.arange(num_layers + 1))
+
+        for sweep in range(self.sweeps):
+            downward = sweep % 2 == 0
+            sequence = range(1, num_layers) if downward else range(num_layers - 2, -1, -1)
+            for r in sequence:
+                if downward:
+                    edges = down[down_starts[r]:down_starts[r + 1]]
+                    movers, anchors = tgt[edges], src[edges]
+                else:
+                    edges = up[up_starts[r]:up_starts[r + 1]]
+                    movers, anchors = src[edges], tgt[edges]
+                members = layers[r]
+                if len(edges) == 0 or len(members) < 2:
+                    continue
+                # Binned by slot within the layer, so each layer costs O(len + edges)
+                slots = order[movers].astype(np.intp)
+                total = np.bincount(slots, weights=order[anchors], minlength=len(members))
+                count = np.bincount(slots, minlength=len(members))
+                # Unconnected nodes keep their current slot as barycenter
+                barycenter = np.where(count > 0, total / np.maximum(count, 1), order[members])
+                members = members[np.lexsort((order[members], barycenter))]
+                layers[r] = members
+                order[members] = np.arange(len(members))
+        return order
+
+
+def _fast_fft_size(minimum: int) -> int:
+    """The smallest 2^a * 3^b * 5^c >= ``minimum``: sizes pocketfft transforms fastest."""
+    best = 1 << max(minimum - 1, 0).bit_length()
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            size = power35
+            while size < minimum:
+                size *= 2
+            best = min(best, size)
+            power35 *= 3
+        power5 *= 5
+    return best
+
+
+class ForceLayoutEngine(LayoutEngine):
+    """
+    Fruchterman-Reingold layout with grid-accelerated repulsion, for large
+    non-DAG topologies (service meshes, peering) where spring_layout's
+    O(V^2) iterations do not scale.
+
+    Nodes are binned into a uniform grid whose cells are about one optimal
+    distance wide. Repulsion between nodes in the same or adjacent cells is
+    exact; everything further away is approximated by convolving the cell
+    mass grid with the repulsion kernel via FFT (particle-mesh), making an
+    iteration roughly O(V + E + G^2 log G). The grid is refined where nodes
+    crowd and coarsened where they spread, so G^2 stays within a small
+    multiple of V. Iteration stops early once the mean step falls below
+    ``tolerance`` optimal distances.
+
+    Measured single-threaded with the default 100 iterations, on random,
+    ring-mesh, tree and 8-edges-per-node graphs: about 1.2-2 s at 10k
+    nodes, 3-4.5 s at 20k and 9-13 s at 50k, i.e. roughly linear.
+    """
+    name = "force"
+
+    def __init__(
+        self,
+        iterations: int = FORCE_MAX_ITERATIONS,
+        tolerance: float = FORCE_TOLERANCE,
+        max_grid: int = FORCE_MAX_GRID,
+    ):
+        self.iterations = iterations
+        self.tolerance = tolerance
+        self.max_grid = max_grid
+        # LRU of FFT size -> kernel transforms; the grid size drifts as the layout spreads
+        self._kernel_cache: OrderedDict[int, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+    @property
+    def cache_token(self) -> str:
+        return f"{self.name}:it={self.iterations},tol={self.tolerance},grid={self.max_grid},occ={FORCE_CELL_OCCUPANCY}"
+
+    def compute(self, num_nodes: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        if num_nodes <= 1:
+            return np.zeros((num_nodes, 2))
+        rng = np.random.default_rng(LAYOUT_SEED)
+        positions = rng.random((num_nodes, 2))
+        spacing = 1.0 / np.sqrt(num_nodes)
+        positions = self._simulate(positions, sources, targets, spacing, None, self.iterations, 0.1)
+        return _normalise(positions)
+
+    def relax(self, num_nodes, sources, targets, initial, fixed, spacing, iterations):
+        positions = np.array(initial, dtype=float)
+        extent = float(np.ptp(positions, axis=0).max()) if num_nodes > 1 else 1.0
+        return self._simulate(positions, sources, targets, spacing, fixed, iterations, 0.1 * extent)
+
+    def _simulate(
+        self,
+        positions: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        spacing: float,
+        fixed: Optional[np.ndarray],
+        iterations: int,
+        temperature: float,
+    ) -> np.ndarray:
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        cooling = temperature / (iterations + 1)
+        for _ in range(iterations):
+            force = self._repulsion(positions, spacing)
+            force += self._attraction(positions, sources, targets, spacing)
+
+            length = np.hypot(force[:, 0], force[:, 1])
+            step = force * (np.minimum(length, temperature) / np.maximum(length, 1e-12))[:, None]
+            if fixed is not None:
+                step[fixed] = 0.0
+            positions += step
+            temperature -= cooling
+
+            if np.hypot(step[:, 0], step[:, 1]).mean() < self.tolerance * spacing:
+                break
+        return positions
+
+    @staticmethod
+    def _attraction(positions: np.ndarray, sources: np.ndarray, targets: np.ndarray, spacing: float) -> np.ndarray:
+        """Spring pull d^2 / k along every edge, applied to both endpoints."""
+        n = len(positions)
+        delta = positions[targets] - positions[sources]
+        pull = delta * (np.hypot(delta[:, 0], delta[:, 1]) / spacing)[:, None]
+        force = np.empty((n, 2))
+        for axis in (0, 1):
+            force[:, axis] = (
+                np.bincount(sources, weights=pull[:, axis], minlength=n)
+                - np.bincount(targets, weights=pull[:, axis], minlength=n)
+            )
+        return force
+
+    def _repulsion(self, positions: np.ndarray, spacing: float) -> np.ndarray:
+        """Push k^2 / d between all pairs: exact near field + FFT far field."""
+        n = len(positions)
+        lo = positions.min(axis=0)
+        extent = float((positions.max(axis=0) - lo).max()) or spacing
+        # Cells about one optimal distance wide, kept between FORCE_CELL_OCCUPANCY
+        # nodes per cell (crowded layouts) and four cells per node (spread ones)
+        wanted = np.clip(extent / spacing, np.sqrt(n / FORCE_CELL_OCCUPANCY), 2.0 * np.sqrt(n))
+        grid = int(np.clip(np.ceil(wanted), 1, self.max_grid))
+        cell = extent / grid * (1 + 1e-9)  # Keeps the max coordinate inside the grid
+        cx, cy = ((positions - lo) / cell).astype(np.int64).T
+        cell_id = cx * grid + cy
+
+        # Far field: cell masses convolved with the kernel (adjacent cells excluded)
+        mass = np.bincount(cell_id, minlength=grid * grid).reshape(grid, grid).astype(float)
+        size = _fast_fft_size(2 * grid - 1)  # Zero padding: no wrap-around between cells
+        kernel_x, kernel_y = self._far_kernel(size)
+        mass_hat = np.fft.rfft2(mass, s=(size, size))
+        strength = spacing * spacing / cell
+        far_x = np.fft.irfft2(mass_hat * kernel_x, s=(size, size))[:grid, :grid] * strength
+        far_y = np.fft.irfft2(mass_hat * kernel_y, s=(size, size))[:grid, :grid] * strength
+        force = np.column_stack((far_x.ravel()[cell_id], far_y.ravel()[cell_id]))
+
+        # Near field: exact pairs within the 3x3 block of cells around each node
+        order = np.argsort(cell_id, kind="stable")
+        counts = np.bincount(cell_id, minlength=grid * grid)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        # Chunks bound the memory of the pair arrays built per neighbour cell
+        for i in range(0, n, FORCE_CHUNK_SIZE):
+            force += self._near_field(positions, order[i:i + FORCE_CHUNK_SIZE], cx, cy, grid, order, starts, counts, spacing)
+        return force
+
+    def _far_kernel(self, size: int) -> tuple[np.ndarray, np.ndarray]:
+        """FFT of the unit-cell repulsion kernel a / (a^2 + b^2), zeroed for |a|,|b| <= 1."""
+        cache = self._kernel_cache
+        if size in cache:
+            cache.move_to_end(size)
+        else:
+            offsets = np.fft.fftfreq(size, d=1.0 / size)  # 0, 1, ..., -1 in wrap-around order
+            a, b = np.meshgrid(offsets, offsets, indexing="ij")
+            dist2 = a * a + b * b
+            near = (np.abs(a) <= 1) & (np.abs(b) <= 1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                kx = np.where(near, 0.0, a / dist2)
+                ky = np.where(near, 0.0, b / dist2)
+            cache[size] = (np.fft.rfft2(kx), np.fft.rfft2(ky))
+            while len(cache) > FORCE_KERNEL_CACHE_SIZE:
+                cache.popitem(last=False)
+        return cache[size]
+
+    @staticmethod
+    def _near_field(positions, chunk, cx, cy, grid, order, starts, counts, spacing) -> np.ndarray:
+        """
+        Exact repulsion for pairs owned by ``chunk``. Only half of the 3x3
+        neighbourhood is visited (each pair once) and the equal-and-opposite
+        push is applied to both ends, so the result spans all nodes.
+        """
+        n = len(positions)
+        xs, ys = positions[:, 0], positions[:, 1]
+        force = np.zeros((n, 2))
+        for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+            nx_, ny_ = cx[chunk] + dx, cy[chunk] + dy
+            valid = (nx_ >= 0) & (nx_ < grid) & (ny_ >= 0) & (ny_ < grid)
+            neighbour_cell = nx_[valid] * grid + ny_[valid]
+            per_node = counts[neighbour_cell]
+            total = int(per_node.sum())
+            if total == 0:
+                continue
+            owner = np.repeat(chunk[valid], per_node)
+            first = np.repeat(starts[neighbour_cell] - (np.cumsum(per_node) - per_node), per_node)
+            other = order[first + np.arange(total)]
+            # Within the same cell keep only owner < other to visit each pair once
+            keep = other > owner if (dx, dy) == (0, 0) else other != owner
+            owner, other = owner[keep], other[keep]
+
+            delta_x = xs[owner] - xs[other]
+            delta_y = ys[owner] - ys[other]
+            scale = spacing * spacing / np.maximum(delta_x * delta_x + delta_y * delta_y, 1e-12)
+            push_x, push_y = delta_x * scale, delta_y * scale
+            force[:, 0] += np.bincount(owner, weights=push_x, minlength=n) - np.bincount(other, weights=push_x, minlength=n)
+            force[:, 1] += np.bincount(owner, weights=push_y, minlength=n) - np.bincount(other, weights=push_y, minlength=n)
+        return force
+
+
+LAYOUT_ENGINES: dict[str, type[LayoutEngine]] = {
+    SpringLayoutEngine.name: SpringLayoutEngine,
+    LayeredLayoutEngine.name: LayeredLayoutEngine,
+    ForceLayoutEngine.name: ForceLayoutEngine,
+}
+
+
+def resolve_layout_engine(engine: Union[str, LayoutEngine]) -> LayoutEngine:
+    """Accepts an engine instance or a registered name such as ``"layered"``."""
+    if isinstance(engine, LayoutEngine):
+        return engine
+    if engine not in LAYOUT_ENGINES:
+        raise ValueError(
+            f"Unknown layout engine '{engine}'. Available engines: {sorted(LAYOUT_ENGINES)}"
+        )
+    return LAYOUT_ENGINES[engine]()
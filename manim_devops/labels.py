@@ -0,0 +1,228 @@
+"""
+Cached, batched construction of node labels.
+
+Every ``Text`` goes through Pango and an SVG round trip, which makes labels
+one of the largest startup costs of a big diagram even though most of them
+repeat ("Web Server") and all share one font and size. Labels are cached
+by ``(text, font, font_size)`` and handed out as copies, and the labels a
+render still needs are built together:
+
+- by default every missing label becomes one line of a single multi-line
+  ``Text``, whose glyphs are then split back into one group per label, so a
+  topology costs one Pango layout instead of one per node;
+- with ``glyphs=True`` labels are composed from a per-font glyph atlas:
+  each distinct character is laid out once, and labels are assembled from
+  copies of its outline and advance. This skips Pango entirely for text
+  made of known characters, at the cost of kerning. Characters Pango does
+  not draw as exactly one glyph (combining marks, ligature-only scripts)
+  cannot be composed; labels using them are built as in the default mode.
+"""
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from manim import Text, VGroup, VMobject
+
+from manim_devops.constants import LABEL_FONT, LABEL_FONT_SIZE, LABEL_CACHE_MAX_ENTRIES
+
+# Reference glyph with a flat bottom on the baseline and no descender
+_BASELINE_GLYPH = "H"
+
+
+def _glyph_mobjects(text_mob: Text, text: str) -> Optional[list[VMobject]]:
+    """
+    The glyph outlines of ``text_mob`` in character order, skipping
+    whitespace, or None if they cannot be matched to the characters.
+    """
+    submobjects = text_mob.submobjects
+    if len(submobjects) == len(text):  # whitespace kept as empty placeholders
+        return [mob for mob, char in zip(submobjects, text) if not char.isspace()]
+    if len(submobjects) == sum(not char.isspace() for char in text):
+        return list(submobjects)
+    return None
+
+
+class GlyphAtlas:
+    """
+    Outline and advance of every character seen so far for one font and
+    size. Outlines are stored relative to their origin on the baseline, so
+    composing a label only adds up advances.
+    """
+    def __init__(self, font: str, font_size: float):
+        self.font = font
+        self.font_size = font_size
+        self.space_advance = 0.0
+        # Characters whose glyphs could not be matched to them
+        self.unmapped: set[str] = set()
+        self._glyphs: dict[str, tuple[VMobject, float]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, char: str) -> bool:
+        return char.isspace() or char in self._glyphs
+
+    def add(self, chars: Iterable[str]) -> None:
+        """Lays out all missing characters in one Text call."""
+        with self._lock:
+            self._add(chars)
+
+    def _add(self, chars: Iterable[str]) -> None:
+        missing = sorted({char for char in chars if char not in self and char not in self.unmapped})
+        if not missing and self.space_advance:
+            return
+        if not self._layout(missing) and len(missing) > 1:
+            # One character that is not a single glyph spoils the batch
+            for char in missing:
+                self._layout([char])
+        self.unmapped.update(char for char in missing if char not in self._glyphs)
+
+    def _layout(self, chars: list[str]) -> bool:
+        """
+        Measures ``chars`` in one Text of lines "HH", "H H" and "HcH" per
+        character. The left ink edge of H sits at a fixed offset from its
+        origin, so the distance between the H's of a line is H's advance
+        plus that of the character between them. Returns False if the
+        glyphs cannot be matched to the characters.
+        """
+        lines = [_BASELINE_GLYPH * 2, _BASELINE_GLYPH + " " + _BASELINE_GLYPH]
+        lines += [_BASELINE_GLYPH + char + _BASELINE_GLYPH for char in chars]
+        text = "\n".join(lines)
+        try:
+            text_mob = Text(text, font=self.font, font_size=self.font_size, disable_ligatures=True)
+        except ValueError:  # fewer glyphs than characters
+            return False
+        glyphs = _glyph_mobjects(text_mob, text)
+        if glyphs is None:
+            return False
+        lefts = [glyph.get_left()[0] for glyph in glyphs]
+        h_advance = lefts[1] - lefts[0]
+        self.space_advance = lefts[3] - lefts[2] - h_advance
+        for index, char in enumerate(chars):
+            first = 4 + 3 * index  # the leading H of this character's line
+            origin = lefts[first] + h_advance
+            outline = glyphs[first + 1].copy()
+            outline.shift([-origin, -glyphs[first].get_bottom()[1], 0])
+            self._glyphs[char] = (outline, lefts[first + 2] - origin)
+        return True
+
+    def compose(self, text: str) -> VGroup:
+        """
+        Assembles ``text`` from glyph copies along the baseline. Raises
+        ValueError if it uses a character the atlas could not map.
+        """
+        self.add(text)
+        label = VGroup()
+        cursor = 0.0
+        for char in text:
+            if char.isspace():
+                cursor += self.space_advance
+                continue
+            if char not in self._glyphs:
+                raise ValueError(f"No glyph for {char!r} in the {self.font!r} atlas")
+            outline, advance = self._glyphs[char]
+            label.add(outline.copy().shift([cursor, 0, 0]))
+            cursor += advance
+        return label.center() if label.submobjects else label
+
+
+class LabelCache:
+    """Thread-safe LRU of label mobjects keyed by (text, font, font_size)."""
+    def __init__(self, max_entries: int = LABEL_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._atlases: dict[tuple[str, float], GlyphAtlas] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key) -> Optional[VMobject]:
+        with self._lock:
+            label = self._entries.get(key)
+            if label is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return label
+
+    def put(self, key, label: VMobject) -> None:
+        with self._lock:
+            self._entries[key] = label
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def atlas(self, font: str, font_size: float) -> GlyphAtlas:
+        with self._lock:
+            if (font, font_size) not in self._atlases:
+                self._atlases[(font, font_size)] = GlyphAtlas(font, font_size)
+            return self._atlases[(font, font_size)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._atlases.clear()
+
+
+LABEL_CACHE = LabelCache()
+
+
+def _build_batch(texts: list[str], font: str, font_size: float) -> list[VMobject]:
+    """Builds labels as the lines of one Text, falling back to one Text each."""
+    if len(texts) > 1 and all(text.strip() and "\n" not in text for text in texts):
+        joined = "\n".join(texts)
+        glyphs = _glyph_mobjects(Text(joined, font=font, font_size=font_size, disable_ligatures=True), joined)
+        if glyphs is not None:
+            labels, start = [], 0
+            for text in texts:
+                count = sum(not char.isspace() for char in text)
+                labels.append(VGroup(*glyphs[start:start + count]).center())
+                start += count
+            return labels
+    return [Text(text, font=font, font_size=font_size) for text in texts]
+
+
+def build_labels(
+    texts: Iterable[str],
+    font: str = LABEL_FONT,
+    font_size: float = LABEL_FONT_SIZE,
+    glyphs: bool = False,
+) -> list[VMobject]:
+    """
+    Returns one fresh label mobject per text, in order. Each distinct text
+    is built at most once per process; every call hands out copies.
+    """
+    texts = list(texts)
+    # Composed labels lack kerning, so they never stand in for Pango-built ones
+    mode = ("glyphs",) if glyphs else ()
+    labels: dict[str, VMobject] = {}
+    missing = []
+    for text in dict.fromkeys(texts):
+        cached = LABEL_CACHE.get((text, font, font_size) + mode)
+        if cached is None:
+            missing.append(text)
+        else:
+            labels[text] = cached
+
+    if missing:
+        if glyphs:
+            atlas = LABEL_CACHE.atlas(font, font_size)
+            atlas.add("".join(missing))
+            composed = {}
+            for text in missing:
+                try:
+                    composed[text] = atlas.compose(text)
+                except ValueError:
+                    continue  # built whole below
+            unmapped = [text for text in missing if text not in composed]
+            composed.update(zip(unmapped, _build_batch(unmapped, font, font_size)))
+            built = [composed[text] for text in missing]
+        else:
+            built = _build_batch(missing, font, font_size)
+        for text, label in zip(missing, built):
+            LABEL_CACHE.put((text, font, font_size) + mode, label)
+            labels[text] = label
+    return [labels[text].copy() for text in texts]
+
@@ -1,4 +1,14 @@
+import heapq
+import logging
+import time
 import numpy as np
+from typing import Iterable, Iterator, Optional, Union
+from manim_devops.constants import (
+    ROUTER_CLEARANCE, ROUTER_BEND_PENALTY, ROUTER_SEARCH_MARGIN,
+    ROUTER_TIME_BUDGET, ROUTER_GRID_CELL, ROUTER_MAX_GRID_POINTS, BUNDLE_MIN_EDGES,
+)
+
+logger = logging.getLogger(__name__)
 
 class OrthogonalRouter:
     """
@@ -12,46 +22,642 @@ class OrthogonalRouter:
         """
         Calculates an orthogonal path that starts strictly on the boundary 
         of the source node and ends on the boundary of the target node.
+        Single-edge convenience wrapper around compute_paths().
+        """
+        waypoints = self.compute_paths([source_center], [target_center], source_radius, target_radius)[0]
+        return list(waypoints)
+
+    def compute_paths(
+        self,
+        source_centers: np.ndarray,
+        target_centers: np.ndarray,
+        source_radii: Union[float, np.ndarray],
+        target_radii: Union[float, np.ndarray],
+    ) -> list[np.ndarray]:
+        """
+        Routes a whole batch of edges in one vectorized pass.
+
+        Takes (E, 3) source/target centers and scalar or (E,) radii, and
+        returns one (k, 3) waypoint array per edge: the X-first L-bend
+        (start, elbow, end), or just (start, end) when the edge is already
+        straight or has zero length.
+        """
+        sources = np.asarray(source_centers, dtype=float).reshape(-1, 3)
+        targets = np.asarray(target_centers, dtype=float).reshape(-1, 3)
+        count = len(sources)
+        source_radii = np.broadcast_to(np.asarray(source_radii, dtype=float), (count,))
+        target_radii = np.broadcast_to(np.asarray(target_radii, dtype=float), (count,))
+
+        # Calculate direction vectors; zero-length edges keep their raw endpoints
+        raw_vectors = targets - sources
+        lengths = np.sqrt(np.einsum("ij,ij->i", raw_vectors, raw_vectors))
+        degenerate = lengths == 0
+        unit_vectors = np.divide(
+            raw_vectors, lengths[:, None], out=np.zeros_like(raw_vectors), where=~degenerate[:, None]
+        )
+
+        # 1. Start strictly on the boundary of the source, 2. end on the target's
+        starts = sources + unit_vectors * source_radii[:, None]
+        ends = targets - unit_vectors * target_radii[:, None]
+
+        # 3. The elbow joints (X first, then Y) with Z pinned to 0.0 for 2D diagramming
+        elbows = np.column_stack([ends[:, 0], starts[:, 1], np.zeros(count)])
+        has_elbow = ~degenerate & ~(elbows == starts).all(axis=1) & ~(elbows == ends).all(axis=1)
+
+        waypoints = np.stack([starts, elbows, ends], axis=1)
+        return [path if bend else path[::2] for path, bend in zip(waypoints, has_elbow.tolist())]
+
+
+class SpatialGrid:
+    """
+    Uniform-grid index of axis-aligned boxes ``(lo_x, lo_y, hi_x, hi_y)``.
+    Each box is registered in every cell it overlaps, so a rectangle query
+    only inspects the boxes living in the cells that rectangle covers.
+    """
+    def __init__(self, cell_size: float = ROUTER_GRID_CELL):
+        self.cell_size = cell_size
+        self.boxes = np.empty((0, 4))
+        self._cells: dict[tuple[int, int], set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def cells(self, lo_x: float, lo_y: float, hi_x: float, hi_y: float) -> Iterator[tuple[int, int]]:
+        """Grid cells overlapped by the (closed) rectangle."""
+        size = self.cell_size
+        for cx in range(int(np.floor(lo_x / size)), int(np.floor(hi_x / size)) + 1):
+            for cy in range(int(np.floor(lo_y / size)), int(np.floor(hi_y / size)) + 1):
+                yield cx, cy
+
+    def insert(self, boxes: np.ndarray) -> np.ndarray:
+        """Adds (N, 4) boxes and returns their indices."""
+        boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+        first = len(self.boxes)
+        self.boxes = np.vstack([self.boxes, boxes])
+        for index, box in enumerate(boxes.tolist(), start=first):
+            for cell in self.cells(*box):
+                self._cells.setdefault(cell, set()).add(index)
+        return np.arange(first, first + len(boxes))
+
+    def update(self, index: int, box: np.ndarray) -> None:
+        """Moves box ``index`` to a new position."""
+        self.remove(index)
+        self.boxes[index] = box
+        for cell in self.cells(*self.boxes[index].tolist()):
+            self._cells.setdefault(cell, set()).add(index)
+
+    def remove(self, index: int) -> None:
+        """Drops box ``index``; its slot stays allocated but never matches a query."""
+        box = self.boxes[index]
+        if np.isnan(box).any():
+            return
+        for cell in self.cells(*box.tolist()):
+            members = self._cells.get(cell)
+            if members is not None:
+                members.discard(index)
+                if not members:
+                    del self._cells[cell]
+        self.boxes[index] = np.nan
+
+    def query(self, lo_x: float, lo_y: float, hi_x: float, hi_y: float) -> np.ndarray:
+        """Indices of boxes overlapping the (closed) query rectangle."""
+        size = self.cell_size
+        area = (np.floor(hi_x / size) - np.floor(lo_x / size) + 1) * (np.floor(hi_y / size) - np.floor(lo_y / size) + 1)
+        # Walking a cell costs about as much as testing dozens of boxes at once
+        if area > 4 * len(self._cells) or area * 32 > len(self.boxes):
+            candidates = np.arange(len(self.boxes))  # Cheaper to test every box
+        else:
+            found = set()
+            for cell in self.cells(lo_x, lo_y, hi_x, hi_y):
+                found.update(self._cells.get(cell, ()))
+            candidates = np.fromiter(sorted(found), dtype=np.int64, count=len(found))
+        if len(candidates) == 0:
+            return candidates
+        boxes = self.boxes[candidates]
+        overlap = (boxes[:, 0] <= hi_x) & (boxes[:, 2] >= lo_x) & (boxes[:, 1] <= hi_y) & (boxes[:, 3] >= lo_y)
+        return candidates[overlap]
+
+
+def _segment_enters(lo: np.ndarray, hi: np.ndarray, box: np.ndarray) -> bool:
+    """Whether the segment spanning ``lo``..``hi`` overlaps the open interior of ``box``."""
+    return lo[0] < box[2] and hi[0] > box[0] and lo[1] < box[3] and hi[1] > box[1]
+
+
+class ObstacleAvoidingRouter(OrthogonalRouter):
+    """
+    Orthogonal router that steers edges around node bounding boxes.
+
+    Every edge first gets the cheap X-first L-bend. Only edges whose L-bend
+    cuts through a foreign box are re-routed: A* runs over the sparse
+    orthogonal visibility graph (the grid of lines through the endpoints and
+    the clearance-inflated sides of nearby obstacles), with a penalty per
+    bend. Obstacles come from a SpatialGrid, so each query only looks at the
+    boxes around that edge. A search whose grid would exceed
+    ``max_grid_points`` points, that exceeds ``time_budget`` seconds (grid
+    construction included), or that finds no route falls back to the L-bend.
+    """
+    def __init__(
+        self,
+        obstacles: Optional[np.ndarray] = None,
+        clearance: float = ROUTER_CLEARANCE,
+        bend_penalty: float = ROUTER_BEND_PENALTY,
+        time_budget: float = ROUTER_TIME_BUDGET,
+        search_margin: float = ROUTER_SEARCH_MARGIN,
+        max_grid_points: int = ROUTER_MAX_GRID_POINTS,
+    ):
+        super().__init__()
+        self.index = SpatialGrid()
+        self.clearance = clearance
+        self.bend_penalty = bend_penalty
+        self.time_budget = time_budget
+        self.search_margin = search_margin
+        self.max_grid_points = max_grid_points
+        self.fallbacks = 0
+        if obstacles is not None:
+            self.add_obstacles(obstacles)
+
+    @staticmethod
+    def boxes_from_centers(centers: np.ndarray, widths: Iterable[float], heights: Iterable[float]) -> np.ndarray:
+        """Converts node centers and sizes into (N, 4) obstacle boxes."""
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)[:, :2]
+        half = np.column_stack([np.asarray(widths, dtype=float), np.asarray(heights, dtype=float)]) / 2.0
+        return np.hstack([centers - half, centers + half])
+
+    def add_obstacles(self, boxes: np.ndarray) -> np.ndarray:
+        """Registers (N, 4) boxes ``(lo_x, lo_y, hi_x, hi_y)``; returns their indices."""
+        return self.index.insert(boxes)
+
+    def compute_paths(
+        self,
+        source_centers: np.ndarray,
+        target_centers: np.ndarray,
+        source_radii: Union[float, np.ndarray],
+        target_radii: Union[float, np.ndarray],
+    ) -> list[np.ndarray]:
+        paths = super().compute_paths(source_centers, target_centers, source_radii, target_radii)
+        if len(self.index) == 0:
+            return paths
+        sources = np.asarray(source_centers, dtype=float).reshape(-1, 3)
+        targets = np.asarray(target_centers, dtype=float).reshape(-1, 3)
+        source_radii = np.broadcast_to(np.asarray(source_radii, dtype=float), (len(paths),))
+        target_radii = np.broadcast_to(np.asarray(target_radii, dtype=float), (len(paths),))
+
+        for i, path in enumerate(paths):
+            ignore = self._endpoint_boxes(sources[i], targets[i])
+            if not self._blocked(path, ignore):
+                continue
+            routed = self._search(sources[i], targets[i], ignore)
+            if routed is None:
+                self.fallbacks += 1
+                continue
+            trimmed = self._trim(routed, source_radii[i], target_radii[i])
+            if trimmed is None:
+                self.fallbacks += 1  # the detour cannot leave the icons: keep the blocked L-bend
+                continue
+            paths[i] = trimmed
+        return paths
+
+    def _endpoint_boxes(self, source: np.ndarray, target: np.ndarray) -> set[int]:
+        """Boxes containing either endpoint belong to the edge, not in its way."""
+        ignore = set()
+        for x, y in (source[:2], target[:2]):
+            ignore.update(self.index.query(x, y, x, y).tolist())
+        return ignore
+
+    def _blocked(self, path: np.ndarray, ignore: set[int]) -> bool:
+        """Whether any axis-aligned segment of ``path`` enters a foreign box's interior."""
+        for start, end in zip(path[:-1], path[1:]):
+            lo = np.minimum(start[:2], end[:2])
+            hi = np.maximum(start[:2], end[:2])
+            for index in self.index.query(lo[0], lo[1], hi[0], hi[1]).tolist():
+                if index not in ignore and _segment_enters(lo, hi, self.index.boxes[index]):
+                    return True
+        return False
+
+    @staticmethod
+    def enters(path: np.ndarray, box: np.ndarray) -> bool:
+        """Whether any axis-aligned segment of ``path`` enters the interior of ``box``."""
+        return any(
+            _segment_enters(np.minimum(start[:2], end[:2]), np.maximum(start[:2], end[:2]), box)
+            for start, end in zip(path[:-1], path[1:])
+        )
+
+    def _search(self, source: np.ndarray, target: np.ndarray, ignore: set[int]) -> Optional[np.ndarray]:
+        """A* from center to center over the local visibility grid; None on failure."""
+        deadline = time.perf_counter() + self.time_budget
+        margin = self.search_margin
+        window = (
+            min(source[0], target[0]) - margin, min(source[1], target[1]) - margin,
+            max(source[0], target[0]) + margin, max(source[1], target[1]) + margin,
+        )
+        nearby = [i for i in self.index.query(*window).tolist() if i not in ignore]
+        if time.perf_counter() > deadline:
+            return None
+        boxes = self.index.boxes[nearby] + np.array([-1.0, -1.0, 1.0, 1.0]) * self.clearance
+
+        xs = np.unique(np.concatenate([[source[0], target[0], window[0], window[2]], boxes[:, 0], boxes[:, 2]]))
+        ys = np.unique(np.concatenate([[source[1], target[1], window[1], window[3]], boxes[:, 1], boxes[:, 3]]))
+        xs = xs[(xs >= window[0]) & (xs <= window[2])]
+        ys = ys[(ys >= window[1]) & (ys <= window[3])]
+        nx, ny = len(xs), len(ys)
+        # Rasterising and searching the grid cost grows with its area
+        if nx * ny > self.max_grid_points or time.perf_counter() > deadline:
+            return None
+
+        # Every box side inside the window is a grid line, so a box covers an
+        # index range. Rasterise the boxes with 2D prefix sums over a doubled
+        # grid whose odd slots are the midpoints between neighbouring lines.
+        width, height = 2 * nx + 1, 2 * ny + 1
+        lo_i = np.where(boxes[:, 0] < xs[0], 0, 2 * np.searchsorted(xs, boxes[:, 0]) + 1)
+        hi_i = np.where(boxes[:, 2] > xs[-1], 2 * nx, 2 * np.searchsorted(xs, boxes[:, 2]))
+        lo_j = np.where(boxes[:, 1] < ys[0], 0, 2 * np.searchsorted(ys, boxes[:, 1]) + 1)
+        hi_j = np.where(boxes[:, 3] > ys[-1], 2 * ny, 2 * np.searchsorted(ys, boxes[:, 3]))
+        keep = (lo_i < hi_i) & (lo_j < hi_j)  # Strict interiors only
+        lo_i, hi_i, lo_j, hi_j = lo_i[keep], hi_i[keep], lo_j[keep], hi_j[keep]
+        corners = np.concatenate([lo_i * height + lo_j, hi_i * height + lo_j, lo_i * height + hi_j, hi_i * height + hi_j])
+        signs = np.repeat([1, -1, -1, 1], len(lo_i))
+        coverage = np.bincount(corners, weights=signs, minlength=width * height).astype(np.int32)
+        blocked = coverage.reshape(width, height).cumsum(axis=0).cumsum(axis=1) > 0
+        if time.perf_counter() > deadline:
+            return None
+
+        start = (int(np.searchsorted(xs, source[0])), int(np.searchsorted(ys, source[1])))
+        goal = (int(np.searchsorted(xs, target[0])), int(np.searchsorted(ys, target[1])))
+        point = blocked[0:2 * nx:2, 0:2 * ny:2].copy()
+        point[start] = point[goal] = False  # Endpoints may sit within another icon's clearance
+        # A move is allowed when both line points and the midpoint between them are free
+        free_h = (~(blocked[1:2 * nx - 1:2, 0:2 * ny:2] | point[:-1, :] | point[1:, :])).tolist()
+        free_v = (~(blocked[0:2 * nx:2, 1:2 * ny - 1:2] | point[:, :-1] | point[:, 1:])).tolist()
+
+        # Manhattan distance to the goal, plus one bend while off both of its axes
+        dist_x = np.abs(xs - xs[goal[0]]).tolist()
+        dist_y = np.abs(ys - ys[goal[1]]).tolist()
+        gap_x, gap_y = np.diff(xs).tolist(), np.diff(ys).tolist()
+        penalty = self.bend_penalty
+        goal_i, goal_j = goal
+
+        def estimate(i: int, j: int) -> float:
+            return dist_x[i] + dist_y[j] + (penalty if i != goal_i and j != goal_j else 0.0)
+
+        # States are (i, j, heading); heading -1 only for the start
+        start_state = (start[0], start[1], -1)
+        best = {start_state: 0.0}
+        parent: dict = {}
+        heap = [(estimate(*start), 0.0, start[0], start[1], -1)]
+        pops = 0
+        while heap:
+            _, negative_cost, i, j, heading = heapq.heappop(heap)
+            cost = -negative_cost
+            state = (i, j, heading)
+            if i == goal_i and j == goal_j:
+                cells = [(i, j)]
+                while state in parent:
+                    state = parent[state]
+                    cells.append(state[:2])
+                cells.reverse()
+                return np.array([[xs[ci], ys[cj], 0.0] for ci, cj in cells])
+            if cost > best[state]:
+                continue
+            pops += 1
+            if pops % 64 == 1 and time.perf_counter() > deadline:
+                return None
+            moves = []
+            if i + 1 < nx and free_h[i][j]:
+                moves.append((0, i + 1, j, gap_x[i]))
+            if i > 0 and free_h[i - 1][j]:
+                moves.append((1, i - 1, j, gap_x[i - 1]))
+            if j + 1 < ny and free_v[i][j]:
+                moves.append((2, i, j + 1, gap_y[j]))
+            if j > 0 and free_v[i][j - 1]:
+                moves.append((3, i, j - 1, gap_y[j - 1]))
+            for direction, ni, nj, step in moves:
+                new_cost = cost + step
+                if heading != direction and heading != -1:
+                    new_cost += penalty
+                next_state = (ni, nj, direction)
+                if new_cost < best.get(next_state, np.inf):
+                    best[next_state] = new_cost
+                    parent[next_state] = state
+                    # Ties go to the deeper state, which keeps the frontier narrow
+                    heapq.heappush(heap, (new_cost + estimate(ni, nj), -new_cost, ni, nj, direction))
+        return None
+
+    @staticmethod
+    def _trim(points: np.ndarray, source_radius: float, target_radius: float) -> Optional[np.ndarray]:
+        """
+        Drops collinear grid points and cuts ``radius`` worth of path off each
+        end, so the edge starts and ends on the node boundaries like the L-bend.
+        """
+        turns = [0]
+        for k in range(1, len(points) - 1):
+            before = points[k] - points[turns[-1]]
+            after = points[k + 1] - points[k]
+            if before[0] * after[1] - before[1] * after[0] != 0:
+                turns.append(k)
+        corners = points[turns + [len(points) - 1]]
+
+        lengths = np.abs(np.diff(corners, axis=0)).sum(axis=1)
+        total = lengths.sum()
+        if total <= source_radius + target_radius:
+            return None
+        travelled = np.concatenate([[0.0], np.cumsum(lengths)])
+
+        def point_at(distance: float) -> tuple[int, np.ndarray]:
+            k = int(np.clip(np.searchsorted(travelled, distance, side="right") - 1, 0, len(lengths) - 1))
+            fraction = (distance - travelled[k]) / lengths[k]
+            return k, corners[k] + (corners[k + 1] - corners[k]) * fraction
+
+        first, start = point_at(source_radius)
+        last, end = point_at(total - target_radius)
+        return np.vstack([start, corners[first + 1:last + 1], end])
+
+
+EdgeKey = tuple[str, str]
+
+
+class RoutingIndex:
+    """
+    Keeps routed edges indexed by endpoint and by the grid cells their paths
+    pass through, so a node that is added, moved or removed only reroutes
+    its incident edges and the edges running across the affected area: a
+    node's new box reroutes the edges entering it, a vacated box the edges
+    near it (which may have detoured around it).
+
+    Every mutating call returns ``{edge: waypoints}`` for the edges whose
+    path changed; ``paths`` always holds the current route of every edge.
+    """
+    def __init__(self, router: Optional[ObstacleAvoidingRouter] = None):
+        self.router = router if router is not None else ObstacleAvoidingRouter()
+        self.paths: dict[EdgeKey, np.ndarray] = {}
+        self._centers: dict[str, np.ndarray] = {}
+        self._radii: dict[str, float] = {}
+        self._obstacles: dict[str, int] = {}  # node id -> SpatialGrid slot
+        self._by_endpoint: dict[str, set[EdgeKey]] = {}
+        self._by_cell: dict[tuple[int, int], set[EdgeKey]] = {}
+        self._edge_cells: dict[EdgeKey, list[tuple[int, int]]] = {}
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._centers
+
+    # ─── Nodes ───────────────────────────────────────────────
+
+    def add_nodes(
+        self,
+        node_ids: list[str],
+        centers: np.ndarray,
+        radii: Iterable[float],
+        sizes: Optional[np.ndarray] = None,
+    ) -> dict[EdgeKey, np.ndarray]:
+        """
+        Registers nodes with their boundary radius and, for rendered icons,
+        their (width, height) obstacle size (NaN rows for non-obstacles).
         """
-        # Ensure points are numpy arrays for vector math
-        source_center = np.array(source_center)
-        target_center = np.array(target_center)
-        
-        # Calculate direction vector
-        raw_vector = target_center - source_center
-        length = np.linalg.norm(raw_vector)
-        
-        if length == 0:
-            return [source_center, target_center]
-            
-        unit_vector = raw_vector / length
-        
-        # 1. Start strictly on the boundary of the source
-        # Projects a circle radius along the vector mapping.
-        start_edge = source_center + (unit_vector * source_radius)
-        
-        # 2. End strictly on the boundary of the target
-        end_edge = target_center - (unit_vector * target_radius)
-        
-        # 3. Calculate the orthogonal L-bend
-        return self._calculate_orthogonal_path(start_edge, end_edge)
-
-    def _calculate_orthogonal_path(self, start: np.ndarray, end: np.ndarray) -> list[np.ndarray]:
-        """
-        Generates a 90-degree orthogonal path.
-        Returns a "X-first" L-bend.
-        """
-        waypoints = []
-        waypoints.append(start)
-        
-        # The elbow joint (move completely in X direction first, then Y)
-        # We explicitly enforce Z-axis = 0.0 for 2D diagramming
-        elbow = np.array([end[0], start[1], 0.0])
-        
-        # Only add the elbow if it's not strictly a straight line already
-        if not np.array_equal(elbow, start) and not np.array_equal(elbow, end):
-            waypoints.append(elbow)
-            
-        waypoints.append(end)
-        
-        return waypoints
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        for node_id, center, radius in zip(node_ids, centers, radii):
+            self._centers[node_id] = center
+            self._radii[node_id] = float(radius)
+        if sizes is None:
+            return {}
+        sizes = np.asarray(sizes, dtype=float).reshape(-1, 2)
+        solid = ~np.isnan(sizes).any(axis=1)
+        solid_ids = [node_id for node_id, keep in zip(node_ids, solid.tolist()) if keep]
+        boxes = self.router.boxes_from_centers(centers[solid], sizes[solid, 0], sizes[solid, 1])
+        for node_id, slot in zip(solid_ids, self.router.add_obstacles(boxes).tolist()):
+            self._obstacles[node_id] = slot
+        affected = set()
+        for box in boxes:
+            affected |= self._edges_through(box)
+        return self._reroute(affected)
+
+    def add_node(
+        self, node_id: str, center: np.ndarray, radius: float, size: Optional[tuple[float, float]] = None
+    ) -> dict[EdgeKey, np.ndarray]:
+        sizes = None if size is None else np.array([size], dtype=float)
+        return self.add_nodes([node_id], [center], [radius], sizes)
+
+    def move_node(self, node_id: str, center: np.ndarray) -> dict[EdgeKey, np.ndarray]:
+        """Moves a node; reroutes its edges and those near its old and new spot."""
+        center = np.asarray(center, dtype=float)
+        offset = center[:2] - self._centers[node_id][:2]
+        self._centers[node_id] = center
+        affected = set(self._by_endpoint.get(node_id, ()))
+        slot = self._obstacles.get(node_id)
+        if slot is not None:
+            old_box = self.router.index.boxes[slot].copy()
+            new_box = old_box + np.tile(offset, 2)
+            self.router.index.update(slot, new_box)
+            # Edges detouring around the old spot may straighten out
+            affected |= self._edges_near(old_box) | self._edges_through(new_box)
+        return self._reroute(affected)
+
+    def remove_node(self, node_id: str) -> dict[EdgeKey, np.ndarray]:
+        """Removes a node and its incident edges; edges that detoured around it are re-tried."""
+        for edge in list(self._by_endpoint.get(node_id, ())):
+            self.remove_edge(edge)
+        affected = set()
+        slot = self._obstacles.pop(node_id, None)
+        if slot is not None:
+            affected = self._edges_near(self.router.index.boxes[slot])
+            self.router.index.remove(slot)
+        self._centers.pop(node_id, None)
+        self._radii.pop(node_id, None)
+        return self._reroute(affected)
+
+    # ─── Edges ───────────────────────────────────────────────
+
+    def add_edges(self, edges: Iterable[EdgeKey]) -> dict[EdgeKey, np.ndarray]:
+        """Routes new edges in one batch; both endpoints must be registered."""
+        edges = [edge for edge in edges if edge not in self.paths]
+        for src_id, tgt_id in edges:
+            self._by_endpoint.setdefault(src_id, set()).add((src_id, tgt_id))
+            self._by_endpoint.setdefault(tgt_id, set()).add((src_id, tgt_id))
+        return self._reroute(edges)
+
+    def add_routed_edges(self, paths: dict[EdgeKey, np.ndarray]) -> None:
+        """
+        Registers edges that were routed elsewhere (e.g. bundled) with their
+        current paths, so node changes near them reroute them like any
+        other edge. A rerouted edge gets its own router path.
+        """
+        for edge, path in paths.items():
+            if edge in self.paths:
+                continue
+            src_id, tgt_id = edge
+            self._by_endpoint.setdefault(src_id, set()).add(edge)
+            self._by_endpoint.setdefault(tgt_id, set()).add(edge)
+            self._index(edge, np.asarray(path, dtype=float))
+
+    def remove_edge(self, edge: EdgeKey) -> None:
+        self.paths.pop(edge, None)
+        self._unindex(edge)
+        for node_id in edge:
+            self._by_endpoint.get(node_id, set()).discard(edge)
+
+    # ─── Internals ───────────────────────────────────────────
+
+    def _edges_near(self, box: np.ndarray) -> set[EdgeKey]:
+        """Edges whose paths pass through the cells around ``box`` (clearance included)."""
+        pad = self.router.clearance
+        found = set()
+        for cell in self.router.index.cells(box[0] - pad, box[1] - pad, box[2] + pad, box[3] + pad):
+            found |= self._by_cell.get(cell, set())
+        return found
+
+    def _edges_through(self, box: np.ndarray) -> set[EdgeKey]:
+        """Edges near ``box`` whose paths actually enter it (clearance included)."""
+        pad = self.router.clearance
+        inflated = np.asarray(box, dtype=float) + np.array([-pad, -pad, pad, pad])
+        return {edge for edge in self._edges_near(box) if self.router.enters(self.paths[edge], inflated)}
+
+    def _unindex(self, edge: EdgeKey) -> None:
+        for cell in self._edge_cells.pop(edge, ()):
+            members = self._by_cell.get(cell)
+            if members is not None:
+                members.discard(edge)
+                if not members:
+                    del self._by_cell[cell]
+
+    def _reroute(self, edges: Iterable[EdgeKey]) -> dict[EdgeKey, np.ndarray]:
+        edges = list(edges)
+        if not edges:
+            return {}
+        centers, radii = self._centers, self._radii
+        routed = self.router.compute_paths(
+            [centers[src_id] for src_id, _ in edges],
+            [centers[tgt_id] for _, tgt_id in edges],
+            [radii[src_id] for src_id, _ in edges],
+            [radii[tgt_id] for _, tgt_id in edges],
+        )
+        changed = {}
+        for edge, path in zip(edges, routed):
+            previous = self.paths.get(edge)
+            if previous is not None and previous.shape == path.shape and np.array_equal(previous, path):
+                continue
+            self._index(edge, path)
+            changed[edge] = path
+        return changed
+
+    def _index(self, edge: EdgeKey, path: np.ndarray) -> None:
+        """Stores ``path`` as the route of ``edge`` under every grid cell it crosses."""
+        self._unindex(edge)
+        grid = self.router.index
+        cells = list(dict.fromkeys(
+            cell
+            for start, end in zip(path[:-1].tolist(), path[1:].tolist())
+            for cell in grid.cells(min(start[0], end[0]), min(start[1], end[1]), max(start[0], end[0]), max(start[1], end[1]))
+        ))
+        for cell in cells:
+            self._by_cell.setdefault(cell, set()).add(edge)
+        self._edge_cells[edge] = cells
+        self.paths[edge] = path
+
+
+class EdgeBundle:
+    """
+    A fan-out (or fan-in) group of edges sharing one orthogonal trunk.
+
+    The shared geometry is stored once: ``trunk`` leaves the hub's boundary
+    and meets ``bus``, a straight segment spanning every member. Each edge
+    only owns its short ``branches[edge]`` from the bus to the member's
+    boundary. ``paths[edge]`` is the full hub-to-member route in edge
+    direction, for animations that need to travel a single edge.
+    """
+    def __init__(self, hub: str, trunk: np.ndarray, bus: np.ndarray):
+        self.hub = hub
+        self.trunk = trunk
+        self.bus = bus
+        self.branches: dict[EdgeKey, np.ndarray] = {}
+        self.paths: dict[EdgeKey, np.ndarray] = {}
+
+    @property
+    def edges(self) -> list[EdgeKey]:
+        return list(self.branches)
+
+
+def bundle_edges(
+    edges: list[EdgeKey],
+    centers: dict[str, np.ndarray],
+    radii: dict[str, float],
+    min_edges: int = BUNDLE_MIN_EDGES,
+) -> tuple[list[EdgeBundle], list[EdgeKey]]:
+    """
+    Groups fan-out and fan-in edges of busy hubs into EdgeBundles.
+
+    Hubs are taken largest group first and every edge joins at most one
+    bundle. A member only joins when it sits clearly on the hub's dominant
+    side (below/above or left/right of it); everything else is returned as
+    a leftover edge for the regular router.
+    """
+    groups: dict[tuple[str, bool], list[EdgeKey]] = {}
+    for edge in edges:
+        src_id, tgt_id = edge
+        if src_id != tgt_id:
+            groups.setdefault((src_id, True), []).append(edge)
+            groups.setdefault((tgt_id, False), []).append(edge)
+
+    bundled: set[EdgeKey] = set()
+    bundles = []
+    # Largest hubs first; ties keep edge order so the result is deterministic
+    for (hub, outgoing), members in sorted(groups.items(), key=lambda item: -len(item[1])):
+        members = [edge for edge in members if edge not in bundled]
+        if len(members) < min_edges:
+            continue
+        bundle = _build_bundle(hub, outgoing, members, centers, radii)
+        if bundle is not None and len(bundle.branches) >= min_edges:
+            bundles.append(bundle)
+            bundled.update(bundle.branches)
+    return bundles, [edge for edge in edges if edge not in bundled]
+
+
+def _build_bundle(
+    hub: str,
+    outgoing: bool,
+    members: list[EdgeKey],
+    centers: dict[str, np.ndarray],
+    radii: dict[str, float],
+) -> Optional[EdgeBundle]:
+    """Lays out the trunk, bus and branches for one hub (bus style, like an org chart)."""
+    others = [edge[1] if outgoing else edge[0] for edge in members]
+    hub_xy = np.asarray(centers[hub], dtype=float)[:2]
+    hub_radius = radii[hub]
+    points = np.array([np.asarray(centers[other], dtype=float)[:2] for other in others])
+    other_radii = np.array([radii[other] for other in others])
+    offsets = points - hub_xy
+
+    # Bus runs across the dominant direction: horizontal for members mostly below/above
+    axis = 1 if abs(offsets[:, 1].mean()) >= abs(offsets[:, 0].mean()) else 0
+    cross = 1 - axis
+    side = 1.0 if offsets[:, axis].mean() >= 0 else -1.0
+    clearance = side * offsets[:, axis] - other_radii - hub_radius
+    eligible = clearance > 0
+    if eligible.sum() == 0:
+        return None
+    members = [edge for edge, keep in zip(members, eligible.tolist()) if keep]
+    points, other_radii = points[eligible], other_radii[eligible]
+
+    # Bus sits halfway between the hub's boundary and the nearest member's boundary
+    hub_edge = hub_xy[axis] + side * hub_radius
+    bus_level = hub_edge + side * clearance[eligible].min() / 2.0
+
+    def at(along: np.ndarray, level: Union[float, np.ndarray]) -> np.ndarray:
+        """(N, 3) points from cross-axis positions and axis levels, z = 0."""
+        along = np.atleast_1d(np.asarray(along, dtype=float))
+        out = np.zeros((len(along), 3))
+        out[:, cross] = along
+        out[:, axis] = level
+        return out
+
+    trunk = at([hub_xy[cross], hub_xy[cross]], np.array([hub_edge, bus_level]))
+    span = np.array([min(points[:, cross].min(), hub_xy[cross]), max(points[:, cross].max(), hub_xy[cross])])
+    bundle = EdgeBundle(hub, trunk, at(span, bus_level))
+
+    branch_starts = at(points[:, cross], bus_level)
+    branch_ends = at(points[:, cross], points[:, axis] - side * other_radii)
+    for edge, start, end in zip(members, branch_starts, branch_ends):
+        bundle.branches[edge] = np.vstack([start, end])
+        route = [trunk[0], trunk[1], start, end]
+        if np.array_equal(start, trunk[1]):
+            route = [trunk[0], start, end]  # Member straight in line with the trunk
+        path = np.vstack(route)
+        bundle.paths[edge] = path if outgoing else path[::-1].copy()
+    return bundle
@@ -0,0 +1,286 @@
+"""
+Layout quality metrics: orthogonal edge crossings and bounding-box overlaps.
+
+Crossings are counted with a sweep line over the axis-aligned segments of
+the routed paths: horizontal segments enter and leave a Fenwick tree keyed
+by their (compressed) y as the sweep passes their ends, and each vertical
+segment asks how many live horizontals lie strictly inside its y-span. That
+is O(n log n) for n segments whatever the number of crossings. Box overlaps
+use a uniform spatial hash, so only boxes sharing a cell are compared.
+
+Everything here works on plain NumPy geometry, so metrics can be computed
+for any engine/router combination without rendering a scene.
+"""
+import json
+import logging
+import time
+from typing import Mapping, Optional
+
+import numpy as np
+
+from manim_devops.constants import METRICS_NODE_SIZE, METRICS_LABEL_CHAR_WIDTH, METRICS_LABEL_HEIGHT, METRICS_LABEL_GAP
+from manim_devops.layout import OrthogonalRouter
+
+logger = logging.getLogger(__name__)
+
+_DECIMALS = 9  # coordinates are compared after rounding away float noise
+
+
+def path_segments(paths: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Splits waypoint paths into axis-aligned segments.
+
+    Returns ``(horizontal, vertical, skipped)``: (n, 4) arrays of
+    ``(fixed, lo, hi, path_index)`` rows — y, x-span for horizontals and
+    x, y-span for verticals — plus the number of diagonal segments dropped.
+    Zero-length segments are ignored.
+    """
+    starts, ends, owners = [], [], []
+    for index, path in enumerate(paths):
+        points = np.asarray(path, dtype=float)[:, :2]
+        if len(points) > 1:
+            starts.append(points[:-1])
+            ends.append(points[1:])
+            owners.append(np.full(len(points) - 1, index))
+    if not starts:
+        empty = np.empty((0, 4))
+        return empty, empty, 0
+    starts = np.round(np.concatenate(starts), _DECIMALS)
+    ends = np.round(np.concatenate(ends), _DECIMALS)
+    owners = np.concatenate(owners).astype(float)
+
+    same_x = starts[:, 0] == ends[:, 0]
+    same_y = starts[:, 1] == ends[:, 1]
+    is_h = same_y & ~same_x
+    is_v = same_x & ~same_y
+    skipped = int((~same_x & ~same_y).sum())
+    if skipped:
+        logger.warning("Ignoring %d non-orthogonal segment(s) when counting crossings.", skipped)
+
+    horizontal = np.column_stack([
+        starts[is_h, 1],
+        np.minimum(starts[is_h, 0], ends[is_h, 0]),
+        np.maximum(starts[is_h, 0], ends[is_h, 0]),
+        owners[is_h],
+    ])
+    vertical = np.column_stack([
+        starts[is_v, 0],
+        np.minimum(starts[is_v, 1], ends[is_v, 1]),
+        np.maximum(starts[is_v, 1], ends[is_v, 1]),
+        owners[is_v],
+    ])
+    return horizontal, vertical, skipped
+
+
+def _sweep_counts(segments: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """
+    For each query ``(at, lo, hi)`` counts the ``(key, start, end)`` segments
+    with ``start < at < end`` and ``lo < key < hi``. Touching endpoints do not
+    count, so edges meeting at a shared node are not crossings.
+    """
+    counts = np.zeros(len(queries), dtype=np.int64)
+    if len(segments) == 0 or len(queries) == 0:
+        return counts
+    keys = np.unique(segments[:, 0])
+    slots = np.searchsorted(keys, segments[:, 0]) + 1  # 1-based Fenwick slots
+    lows = np.searchsorted(keys, queries[:, 1], side="right")
+    highs = np.searchsorted(keys, queries[:, 2], side="left")
+
+    # Events sorted by position; at equal positions removals run before
+    # queries and insertions after them, which makes both spans open.
+    n_seg, n_query = len(segments), len(queries)
+    positions = np.concatenate([segments[:, 2], queries[:, 0], segments[:, 1]])
+    kinds = np.concatenate([np.zeros(n_seg), np.ones(n_query), np.full(n_seg, 2)])
+    order = np.lexsort((kinds, positions))
+    kinds = kinds[order].astype(np.int64).tolist()
+    refs = np.concatenate([np.arange(n_seg), np.arange(n_query), np.arange(n_seg)])[order].tolist()
+
+    slots, lows, highs = slots.tolist(), lows.tolist(), highs.tolist()
+    size = len(keys)
+    tree = [0] * (size + 1)
+    result = [0] * n_query
+    for kind, ref in zip(kinds, refs):
+        if kind == 1:
+            # Live segments with key slot in (lows, highs]: prefix(highs) - prefix(lows)
+            total = 0
+            i = highs[ref]
+            while i > 0:
+                total += tree[i]
+                i &= i - 1
+            i = lows[ref]
+            while i > 0:
+                total -= tree[i]
+                i &= i - 1
+            result[ref] = total
+        else:
+            step = 1 if kind == 2 else -1
+            i = slots[ref]
+            while i <= size:
+                tree[i] += step
+                i += i & -i
+    counts[:] = result
+    return counts
+
+
+def count_crossings(paths: list[np.ndarray]) -> tuple[int, np.ndarray]:
+    """
+    Counts proper crossings between horizontal and vertical segments of the
+    given paths. Returns the total and the number of crossings per path.
+    """
+    horizontal, vertical, _ = path_segments(paths)
+    return _count_segment_crossings(horizontal, vertical, len(paths))
+
+
+def _count_segment_crossings(horizontal: np.ndarray, vertical: np.ndarray, num_paths: int) -> tuple[int, np.ndarray]:
+    per_path = np.zeros(num_paths, dtype=np.int64)
+    # Each crossing is seen once from its vertical and once from its horizontal
+    at_vertical = _sweep_counts(horizontal[:, :3], vertical[:, :3])
+    at_horizontal = _sweep_counts(vertical[:, :3], horizontal[:, :3])
+    np.add.at(per_path, vertical[:, 3].astype(np.int64), at_vertical)
+    np.add.at(per_path, horizontal[:, 3].astype(np.int64), at_horizontal)
+    return int(at_vertical.sum()), per_path
+
+
+def overlapping_boxes(boxes: np.ndarray, cell_size: Optional[float] = None) -> np.ndarray:
+    """
+    Returns the ``(i, j)`` index pairs (i < j) of boxes ``(lo_x, lo_y, hi_x,
+    hi_y)`` whose interiors overlap. Boxes are hashed into square cells
+    (default: the median box side), so only boxes sharing a cell are tested.
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    if len(boxes) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    extent = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+    if cell_size is None:
+        cell_size = float(np.median(extent)) or 1.0
+
+    lo = np.floor(boxes[:, :2] / cell_size).astype(np.int64)
+    hi = np.floor(boxes[:, 2:] / cell_size).astype(np.int64)
+    span = hi - lo + 1
+    cover = span[:, 0] * span[:, 1]
+    # One (cell, box) entry per covered cell
+    owner = np.repeat(np.arange(len(boxes)), cover)
+    local = np.arange(cover.sum()) - np.repeat(np.cumsum(cover) - cover, cover)
+    cx = lo[owner, 0] + local // span[owner, 1]
+    cy = lo[owner, 1] + local % span[owner, 1]
+    cell = (cx - cx.min()) * (cy.max() - cy.min() + 1) + (cy - cy.min())
+    order = np.lexsort((owner, cell))
+    cell, owner = cell[order], owner[order]
+
+    # Pair every entry with the later entries of the same cell
+    pairs = []
+    for offset in range(1, len(cell)):
+        same = cell[offset:] == cell[:-offset]
+        if not same.any():
+            break
+        pairs.append(np.column_stack([owner[:-offset][same], owner[offset:][same]]))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.unique(np.concatenate(pairs), axis=0)
+    a, b = boxes[pairs[:, 0]], boxes[pairs[:, 1]]
+    hit = (
+        (np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0]) > 1e-9)
+        & (np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1]) > 1e-9)
+    )
+    return pairs[hit]
+
+
+class LayoutMetrics:
+    """Quality report for one laid-out and routed diagram."""
+    def __init__(
+        self,
+        edge_crossings: int,
+        crossings_per_edge: dict,
+        overlaps: list[tuple[str, str]],
+        num_edges: int,
+        num_boxes: int,
+        skipped_segments: int,
+        seconds: float,
+    ):
+        self.edge_crossings = edge_crossings
+        self.crossings_per_edge = crossings_per_edge
+        self.overlaps = overlaps
+        self.num_edges = num_edges
+        self.num_boxes = num_boxes
+        self.skipped_segments = skipped_segments
+        self.seconds = seconds
+
+    @property
+    def box_overlaps(self) -> int:
+        return len(self.overlaps)
+
+    def as_dict(self) -> dict:
+        """JSON-serialisable summary, suitable for comparing engines in CI."""
+        worst = max(self.crossings_per_edge.items(), key=lambda item: item[1], default=(None, 0))
+        return {
+            "edges": self.num_edges,
+            "boxes": self.num_boxes,
+            "edge_crossings": self.edge_crossings,
+            "max_crossings_per_edge": worst[1],
+            "most_crossed_edge": list(worst[0]) if worst[1] else None,
+            "box_overlaps": self.box_overlaps,
+            "overlapping": [list(pair) for pair in self.overlaps],
+            "skipped_segments": self.skipped_segments,
+            "seconds": round(self.seconds, 6),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+def measure_layout(paths: Mapping[tuple, np.ndarray], boxes: Mapping[str, np.ndarray]) -> LayoutMetrics:
+    """
+    Computes crossings for routed ``paths`` (edge -> waypoints) and overlaps
+    for named ``boxes`` (id -> (lo_x, lo_y, hi_x, hi_y)).
+    """
+    started = time.perf_counter()
+    edges = list(paths)
+    path_list = [paths[edge] for edge in edges]
+    horizontal, vertical, skipped = path_segments(path_list)
+    crossings, per_path = _count_segment_crossings(horizontal, vertical, len(edges))
+    names = list(boxes)
+    box_array = np.array([boxes[name] for name in names], dtype=float).reshape(-1, 4)
+    pairs = overlapping_boxes(box_array)
+    return LayoutMetrics(
+        edge_crossings=crossings,
+        crossings_per_edge={edge: count for edge, count in zip(edges, per_path.tolist()) if count},
+        overlaps=[(names[i], names[j]) for i, j in pairs.tolist()],
+        num_edges=len(edges),
+        num_boxes=len(names),
+        skipped_segments=skipped,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def measure_topology(
+    topology,
+    router: Optional[OrthogonalRouter] = None,
+    node_size: float = METRICS_NODE_SIZE,
+    labels: bool = True,
+) -> LayoutMetrics:
+    """
+    Lays out ``topology``, routes its edges with ``router`` (default: the
+    L-bend OrthogonalRouter) and measures the result. Icons are modelled as
+    ``node_size`` squares and labels as text boxes estimated from their
+    length, placed under the icon the way DevopsScene does.
+    """
+    coords = topology.calculate_layout()
+    router = router or OrthogonalRouter()
+    edges = [edge for edge in topology.edges if edge[0] in coords and edge[1] in coords]
+    centers = np.array([coords[node_id] for edge in edges for node_id in edge], dtype=float).reshape(-1, 2, 3)
+    routed = router.compute_paths(centers[:, 0], centers[:, 1], node_size / 2.0, node_size / 2.0)
+
+    # Only drawn nodes get boxes; NodeClusters are abstract containers
+    from manim_devops.core import NodeCluster
+    boxes = {}
+    half = node_size / 2.0
+    for node in topology.nodes:
+        if isinstance(node, NodeCluster):
+            continue
+        x, y, _ = coords[node.node_id]
+        boxes[node.node_id] = (x - half, y - half, x + half, y + half)
+        if labels:
+            width = len(node.label or node.node_id) * METRICS_LABEL_CHAR_WIDTH
+            top = y - half - METRICS_LABEL_GAP
+            boxes[f"{node.node_id}:label"] = (x - width / 2.0, top - METRICS_LABEL_HEIGHT, x + width / 2.0, top)
+    return measure_layout(dict(zip(edges, routed)), boxes)
@@ -0,0 +1,128 @@
+"""
+Concurrent preparation of a Topology for rendering.
+
+Layout only needs the graph, and icons and labels only need the nodes, so
+neither has to wait for the other before placement. For large graphs
+``prepare_topology`` sends the layout to a worker process and builds icons
+and labels in the caller meanwhile; Manim mobjects are not thread-safe and
+their construction holds the GIL, so they stay on the caller's thread. The
+worker process is started once and reused by every later render. Smaller
+graphs, where a process would cost more than it saves, are prepared in the
+caller one stage after the other. Placement, routing and edge drawing then
+run in the caller once everything is ready.
+
+Every stage's wall-clock time is recorded in a ``StageTimings``, which
+``DevopsScene.render_topology`` keeps as ``scene.render_timings``.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from typing import Optional
+
+from manim_devops.core import Topology, NodeCluster
+from manim_devops.labels import build_labels
+from manim_devops.constants import PIPELINE_PROCESS_MIN_NODES
+
+
+class StageTimings:
+    """Wall-clock seconds per stage, in the order stages finished."""
+    def __init__(self):
+        self.seconds: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def as_dict(self) -> dict:
+        return {stage: round(seconds, 6) for stage, seconds in self.seconds.items()}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+
+class PreparedTopology:
+    """Layout coordinates plus the built labels of the nodes that will be drawn."""
+    def __init__(self, coords: dict, drawn: list, labels: list, timings: StageTimings):
+        self.coords = coords
+        self.drawn = drawn
+        self.labels = labels
+        self.timings = timings
+
+
+def _timed_layout(topology: Topology) -> tuple[dict, float]:
+    started = time.perf_counter()
+    coords = topology.calculate_layout()
+    return coords, time.perf_counter() - started
+
+
+_LAYOUT_POOL: Optional[ProcessPoolExecutor] = None
+_LAYOUT_POOL_LOCK = threading.Lock()
+
+
+def _layout_pool() -> ProcessPoolExecutor:
+    """The shared layout worker, started on first use."""
+    global _LAYOUT_POOL
+    with _LAYOUT_POOL_LOCK:
+        if _LAYOUT_POOL is None:
+            _LAYOUT_POOL = ProcessPoolExecutor(max_workers=1)
+        return _LAYOUT_POOL
+
+
+def _discard_layout_pool(pool: ProcessPoolExecutor) -> None:
+    """Drops a broken worker so the next render starts a new one."""
+    global _LAYOUT_POOL
+    with _LAYOUT_POOL_LOCK:
+        if _LAYOUT_POOL is pool:
+            _LAYOUT_POOL = None
+    pool.shutdown(wait=False)
+
+
+def prepare_topology(
+    topology: Topology,
+    pixels_per_unit: Optional[float] = None,
+    instanced: bool = False,
+    label_glyphs: bool = False,
+    use_process: Optional[bool] = None,
+) -> PreparedTopology:
+    """
+    Materializes icons and builds labels, with the layout computed in the
+    shared worker process meanwhile. ``use_process`` forces (or forbids) the
+    worker; by default it is used from PIPELINE_PROCESS_MIN_NODES nodes on.
+    """
+    timings = StageTimings()
+    # NodeClusters are abstract containers: no icon, no label
+    drawn = [node for node in topology.nodes if not isinstance(node, NodeCluster)]
+    if use_process is None:
+        use_process = len(topology.nodes) >= PIPELINE_PROCESS_MIN_NODES
+
+    with timings.stage("prepare"):
+        pool = _layout_pool() if use_process else None
+        layout = pool.submit(_timed_layout, topology.layout_snapshot()) if pool else None
+        with timings.stage("icons"):
+            for node in drawn:
+                node.materialize(pixels_per_unit, instanced=instanced)
+        with timings.stage("labels"):
+            labels = build_labels([node.label or node.node_id for node in drawn], glyphs=label_glyphs)
+        if layout is None:
+            coords, layout_seconds = _timed_layout(topology)
+        else:
+            try:
+                coords, layout_seconds = layout.result()
+            except BrokenProcessPool:
+                # The worker died (e.g. killed for memory): lay out here instead
+                _discard_layout_pool(pool)
+                coords, layout_seconds = _timed_layout(topology)
+    timings.record("layout", layout_seconds)
+    return PreparedTopology(coords, drawn, labels, timings)
@@ -0,0 +1,150 @@
+"""
+Id indexes over a rendered diagram.
+
+Cinematic actions look objects up by node id on every call: the target a
+TrafficFlow pulses, the edge it travels, the cluster a ScaleOutAction grows.
+``SceneRegistry`` keeps those lookups O(1) instead of scanning
+``scene.mobjects``. It holds plain references and does not import manim.
+
+``render_topology`` and ``ScaleOutAction`` register what they draw, and
+``remove_node`` / ``remove_edge`` drop a node together with its label and
+incident edges, so removal actions keep every index consistent.
+"""
+from typing import Any, Optional
+
+from manim_devops.assets import GraphEntity
+from manim_devops.core import NodeCluster
+
+EdgeKey = tuple[str, str]
+
+
+def _pair(a: str, b: str) -> EdgeKey:
+    return (a, b) if a <= b else (b, a)
+
+
+class EdgeIndex(dict):
+    """
+    Directed edge -> mobject (``scene.rendered_edges``), plus an index by
+    unordered node pair and by incident node that every mutation keeps in
+    sync, so both directions and a node's edges are found in O(1).
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._pairs: dict[EdgeKey, list[EdgeKey]] = {}
+        self._incident: dict[str, dict[EdgeKey, None]] = {}  # insertion-ordered sets
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, edge: EdgeKey, mob: Any) -> None:
+        if edge not in self:
+            source, target = edge
+            self._pairs.setdefault(_pair(source, target), []).append(edge)
+            self._incident.setdefault(source, {})[edge] = None
+            self._incident.setdefault(target, {})[edge] = None
+        super().__setitem__(edge, mob)
+
+    def __delitem__(self, edge: EdgeKey) -> None:
+        super().__delitem__(edge)
+        source, target = edge
+        pair = _pair(source, target)
+        self._pairs[pair].remove(edge)
+        if not self._pairs[pair]:
+            del self._pairs[pair]
+        for node_id in (source, target):
+            incident = self._incident.get(node_id)
+            if incident is not None:
+                incident.pop(edge, None)
+                if not incident:
+                    del self._incident[node_id]
+
+    def update(self, *args, **kwargs) -> None:
+        for edge, mob in dict(*args, **kwargs).items():
+            self[edge] = mob
+
+    def setdefault(self, edge: EdgeKey, default: Any = None) -> Any:
+        if edge not in self:
+            self[edge] = default
+        return self[edge]
+
+    def pop(self, edge: EdgeKey, *default) -> Any:
+        if edge not in self:
+            if default:
+                return default[0]
+            raise KeyError(edge)
+        mob = self[edge]
+        del self[edge]
+        return mob
+
+    def popitem(self) -> tuple[EdgeKey, Any]:
+        edge = next(reversed(self))
+        return edge, self.pop(edge)
+
+    def clear(self) -> None:
+        super().clear()
+        self._pairs.clear()
+        self._incident.clear()
+
+    def find(self, source: str, target: str) -> Optional[tuple[Any, bool]]:
+        """
+        The edge mobject joining ``source`` and ``target`` and whether it is
+        stored the other way round (target -> source), or None. The directed
+        edge wins when both directions exist.
+        """
+        edges = self._pairs.get(_pair(source, target))
+        if not edges:
+            return None
+        if (source, target) in self:
+            return self[(source, target)], False
+        return self[(target, source)], True
+
+    def between(self, a: str, b: str) -> list[EdgeKey]:
+        """Directed edges between ``a`` and ``b`` in either direction."""
+        return list(self._pairs.get(_pair(a, b), ()))
+
+    def incident(self, node_id: str) -> list[EdgeKey]:
+        """Directed edges starting or ending at ``node_id``, in insertion order."""
+        return list(self._incident.get(node_id, ()))
+
+
+class SceneRegistry:
+    """Node, label, edge and cluster indexes of one DevopsScene, by id."""
+    def __init__(self):
+        self.nodes: dict[str, Any] = {}
+        self.labels: dict[str, Any] = {}
+        self.clusters: dict[str, NodeCluster] = {}
+        self.edges = EdgeIndex()
+
+    def add_node(self, node: GraphEntity, label: Any = None) -> None:
+        self.nodes[node.node_id] = node
+        if label is not None:
+            self.labels[node.node_id] = label
+
+    def add_cluster(self, cluster: NodeCluster) -> None:
+        """Registers ``cluster`` and every cluster nested inside it."""
+        stack, seen = [cluster], set()
+        while stack:
+            current = stack.pop()
+            # Cluster cycles are allowed (see Topology): visit each id once
+            if current.node_id in seen:
+                continue
+            seen.add(current.node_id)
+            # Already-registered clusters may have gained subclusters since
+            self.clusters.setdefault(current.node_id, current)
+            stack.extend(child for child in current.children if isinstance(child, NodeCluster))
+
+    def entity(self, node_id: str) -> Any:
+        """The drawn node or cluster registered under ``node_id``; KeyError if none."""
+        if node_id in self.nodes:
+            return self.nodes[node_id]
+        return self.clusters[node_id]
+
+    def remove_edge(self, edge: EdgeKey) -> Any:
+        """Unregisters and returns the mobject of ``edge`` (None if unknown)."""
+        return self.edges.pop(edge, None)
+
+    def remove_node(self, node_id: str) -> tuple[Any, Any, dict[EdgeKey, Any]]:
+        """
+        Unregisters a node with its label and incident edges, returning
+        (node, label, {edge: mobject}) so the caller can animate them out.
+        """
+        edges = {edge: self.edges.pop(edge) for edge in self.edges.incident(node_id)}
+        return self.nodes.pop(node_id, None), self.labels.pop(node_id, None), edges
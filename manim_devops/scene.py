@@ -0,0 +1,406 @@
+"""
+The rendering layer: DevopsScene draws a Topology with manim.
+"""
+import logging
+import time
+import zlib
+from typing import Iterable, Optional
+import numpy as np
+from manim import Scene, VMobject, Create, GrowFromCenter, RendererType, config
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.iterables import list_update
+from manim_devops.core import Topology, NodeCluster, CloudNode
+from manim_devops.assets.instancing import InstancingCamera
+from manim_devops.edge_layer import EdgeLayer, corner_curves
+from manim_devops.layout import RoutingIndex, bundle_edges
+from manim_devops.pipeline import prepare_topology
+from manim_devops.registry import EdgeIndex, SceneRegistry
+from manim_devops.constants import (
+    Z_NODE, Z_EDGE, CLUSTER_FALLBACK_RADIUS,
+    RENDER_DURATION, POST_RENDER_WAIT, EDGE_COLOR, BACKGROUND_OVERLAP_MARGIN,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _bounds(mob) -> Optional[np.ndarray]:
+    """(lo_x, lo_y, hi_x, hi_y) of a mobject and its family, or None without points."""
+    points = [member.points for member in mob.get_family() if len(member.points)]
+    if not points:
+        return None
+    xy = np.concatenate(points)[:, :2]
+    return np.concatenate([xy.min(axis=0), xy.max(axis=0)])
+
+
+def _leaf_animations(animations: Iterable) -> Iterable:
+    """The animations inside (nested) AnimationGroups / Successions."""
+    for animation in animations:
+        children = getattr(animation, "animations", None)
+        if children:
+            yield from _leaf_animations(children)
+        else:
+            yield animation
+
+
+def _bundle_points(edge_bundle) -> np.ndarray:
+    """Points of a bundle's trunk, bus and branches as subpaths of one VMobject."""
+    segments = [edge_bundle.trunk, edge_bundle.bus, *edge_bundle.branches.values()]
+    return np.concatenate([corner_curves(segment) for segment in segments])
+
+
+# Per-member state that decides how the static layer is drawn
+_DRAWN_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+_DRAWN_SCALARS = ("stroke_width", "background_stroke_width", "z_index")
+
+
+def _static_signature(static_mobjects: Iterable) -> tuple:
+    """
+    A fingerprint of what the static layer draws: each member (and its
+    point-less children, e.g. instanced paths) with a CRC of its points,
+    colours, stroke widths and z index. Manim edits those arrays in place
+    as well as replacing them, so their contents are hashed, not their ids.
+    """
+    signature = []
+    for mob in static_mobjects:
+        for part in mob.get_family():
+            checksum = 0
+            for name in _DRAWN_ARRAYS:
+                array = getattr(part, name, None)
+                if array is not None:
+                    checksum = zlib.crc32(np.ascontiguousarray(array), checksum)
+            scalars = np.concatenate([np.ravel(getattr(part, name, 0.0)) for name in _DRAWN_SCALARS]).astype(float)
+            signature.append((id(part), zlib.crc32(scalars, checksum)))
+    return tuple(signature)
+
+
+class CompositingRenderer(CairoRenderer):
+    """
+    The Cairo renderer of DevopsScene. Once ``reuse_background`` is set (by
+    DevopsScene.freeze_background), a play whose static layer draws the
+    same as the previous one reuses its frame instead of rasterising it.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reuse_background = False
+        self.background = None  # (signature, rasterised frame) of the last static layer
+
+    def save_static_frame_data(self, scene: Scene, static_mobjects: Iterable) -> Optional[np.ndarray]:
+        if not self.reuse_background:
+            return super().save_static_frame_data(scene, static_mobjects)
+        static_mobjects = list(static_mobjects)
+        signature = _static_signature(static_mobjects)
+        if self.background is not None and self.background[0] == signature:
+            self.static_image = self.background[1]
+            return self.static_image
+        image = super().save_static_frame_data(scene, static_mobjects)
+        self.background = (signature, image) if image is not None else None
+        return image
+
+
+class DevopsScene(Scene):
+    """
+    The orchestrator. Replaces standard Manim Scene to provide
+    context-aware rendering of Topologies without manual cartesian tracking.
+    """
+    # Compose node labels from the cached glyph atlas instead of Pango
+    label_glyphs: bool = False
+    # Share one read-only copy of each icon's points between identical nodes
+    instance_icons: bool = False
+    # After render_topology, redraw only what moves on top of a cached background
+    composite_background: bool = True
+    # Draw all static edges as one multi-path mobject revealed by a single Create
+    merge_edges: bool = False
+    edge_layer: Optional[EdgeLayer] = None
+    # Bundled edge -> index of its bundle in edge_bundles (and rendered_bundles)
+    _bundled: Optional[dict] = None
+    _background_frozen = False
+    _registry: Optional[SceneRegistry] = None
+
+    def __init__(self, renderer=None, camera_class=InstancingCamera, **kwargs):
+        # Instanced icons are placed by the camera; anything else draws as usual
+        if renderer is None and config.renderer != RendererType.OPENGL:
+            renderer = CompositingRenderer(camera_class=camera_class, skip_animations=kwargs.get("skip_animations", False))
+        super().__init__(renderer, camera_class, **kwargs)
+
+    @property
+    def registry(self) -> SceneRegistry:
+        """Id indexes of everything drawn so far (nodes, labels, edges, clusters)."""
+        if self._registry is None:
+            self._registry = SceneRegistry()
+        return self._registry
+
+    @property
+    def rendered_edges(self) -> EdgeIndex:
+        """Directed edge -> path mobject; absent until a topology is rendered."""
+        if self._registry is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute 'rendered_edges'")
+        return self._registry.edges
+
+    @rendered_edges.setter
+    def rendered_edges(self, edges: dict) -> None:
+        self.registry.edges = edges if isinstance(edges, EdgeIndex) else EdgeIndex(edges)
+
+    def freeze_background(self) -> None:
+        """
+        Declares the current scene (icons, labels, edges) a static layer.
+        From now on each play() treats only animated mobjects, and static
+        ones drawn above them (e.g. the icons a packet passes under), as
+        moving. Everything else is rasterised into a background image once
+        and reused across plays for as long as it draws the same. The image
+        is kept by the scene's CompositingRenderer; with another renderer
+        (OpenGL, or one passed in) only the moving set is narrowed.
+        """
+        if not self.composite_background:
+            return
+        self._background_frozen = True
+        if isinstance(self.renderer, CompositingRenderer):
+            self.renderer.reuse_background = True
+            self.renderer.background = None
+
+    def invalidate_background(self) -> None:
+        """
+        Drops the cached background so the next play rasterises it again.
+        Changes to static mobjects are detected without it; ScaleOutAction
+        calls it for the nodes it adds.
+        """
+        if isinstance(self.renderer, CompositingRenderer):
+            self.renderer.background = None
+
+    def unbundle_edge(self, edge) -> bool:
+        """
+        Takes a bundled edge out of its bundle so it can be drawn on its own:
+        its branch leaves the bundle's drawing and its track (or, merged, its
+        own layer path) takes over at the edge z-index. Returns False for
+        edges that are not bundled.
+        """
+        index = (self._bundled or {}).pop(edge, None)
+        if index is None:
+            return False
+        edge_bundle = self.edge_bundles[index]
+        del edge_bundle.branches[edge]
+        path = edge_bundle.paths.pop(edge)
+        track = self.rendered_edges[edge]
+        track.set_z_index(Z_EDGE)
+        if self.edge_layer is not None:
+            self.edge_layer.remove_path(("bundle", index, edge))
+            self.edge_layer.set_path(edge, path)
+        else:
+            self.rendered_bundles[index].set_points(_bundle_points(edge_bundle))
+        return True
+
+    def get_moving_and_static_mobjects(self, animations):
+        """
+        Manim redraws every mobject from the first moving one (in z order)
+        onwards on each frame, which for a packet under the icon layer is
+        the whole diagram. Once the background is frozen, moving mobjects
+        are only the animated ones, those with updaters or in the
+        foreground, and static mobjects drawn above them where they overlap.
+        """
+        if not self._background_frozen:
+            return super().get_moving_and_static_mobjects(animations)
+        top_level = list_update(self.mobjects, self.foreground_mobjects)
+        members = extract_mobject_family_members(
+            top_level, use_z_index=self.renderer.camera.use_z_index, only_those_with_points=True,
+        )
+
+        moving, regions = set(), []
+        for animation in _leaf_animations(animations):
+            moving.update(animation.mobject.get_family())
+            # Where the animation can reach: its mobject, path and target
+            for mob in (animation.mobject, getattr(animation, "path", None), getattr(animation, "target_copy", None)):
+                box = _bounds(mob) if mob is not None else None
+                if box is not None:
+                    regions.append(box)
+        for mob in top_level:
+            if mob in self.foreground_mobjects or mob.get_family_updaters():
+                moving.update(mob.get_family())
+                box = _bounds(mob)
+                if box is not None:
+                    regions.append(box)
+
+        floor = min((mob.z_index for mob in members if mob in moving), default=None)
+        if floor is not None and regions:
+            regions = np.array(regions) + [-BACKGROUND_OVERLAP_MARGIN] * 2 + [BACKGROUND_OVERLAP_MARGIN] * 2
+            for mob in top_level:
+                family = mob.get_family()
+                # Equal z index is drawn in list order, so it may still be on top
+                if all(member in moving or member.z_index < floor for member in family):
+                    continue
+                box = _bounds(mob)
+                if box is not None and (
+                    (box[:2] <= regions[:, 2:]).all(axis=1) & (regions[:, :2] <= box[2:]).all(axis=1)
+                ).any():
+                    moving.update(family)
+
+        moving_members = [mob for mob in members if mob in moving]
+        static_members = [mob for mob in members if mob not in moving]
+        return moving_members, static_members
+
+    def pixels_per_unit(self) -> float:
+        """Output pixels per scene unit, used to pick icon level of detail."""
+        return config.pixel_width / config.frame_width
+
+    def materialize_nodes(self, nodes: Iterable) -> None:
+        """Builds the icons of ``nodes`` at this scene's level of detail and instancing."""
+        pixels_per_unit = self.pixels_per_unit()
+        for node in nodes:
+            if isinstance(node, CloudNode):
+                node.materialize(pixels_per_unit, instanced=self.instance_icons)
+
+    def add(self, *mobjects):
+        """Scene.add, refusing nodes whose icon was never built."""
+        for mob in mobjects:
+            if isinstance(mob, CloudNode) and not mob.is_materialized:
+                raise RuntimeError(
+                    f"Node '{mob.node_id}' has no icon yet. Call scene.materialize_nodes([node]) "
+                    f"(render_topology and ScaleOutAction do) before adding it to the scene."
+                )
+        return super().add(*mobjects)
+
+    def render_topology(self, topology: Topology, bundle: bool = False) -> None:
+        """
+        Takes a Topology, positions all nodes natively, draws the Orthogonal
+        edges, and plays a unified FadeIn/Create animation.
+
+        With ``bundle=True``, fan-out and fan-in edges of busy hubs are drawn
+        as one shared trunk plus short branches instead of overlapping L-bends.
+        With ``merge_edges`` set, every edge and bundle is packed into the
+        single ``self.edge_layer``.
+        """
+        # Large layouts run in a worker process while icons and labels are built (see pipeline.py)
+        prepared = prepare_topology(
+            topology, self.pixels_per_unit(), instanced=self.instance_icons, label_glyphs=self.label_glyphs,
+        )
+        coords, timings = prepared.coords, prepared.timings
+        
+        self.topology = topology  # Store reference so ScaleOutAction can sync (Finding 04)
+        self.rendered_coords = coords  # Persistent memory for ScaleOut offsets Matrix
+        # A fresh registry: nothing drawn for a previous topology stays findable
+        self._registry = SceneRegistry()
+        self.rendered_edges = EdgeIndex()  # Persistent memory for Phase 3 TrafficFlow animations
+        registry = self.registry
+        for node in topology.nodes:
+            if isinstance(node, NodeCluster):
+                registry.add_cluster(node)
+        animations = []
+        placed = []
+        
+        # 1. Place the Mobjects (Nodes) at their mathematical coordinates.
+        #    Phase 4 Bugfix: NodeClusters are purely abstract geometric containers;
+        #    they have no visual SVGs, so the pipeline leaves them out of `drawn`.
+        started = time.perf_counter()
+        for node, label in zip(prepared.drawn, prepared.labels):
+            numeric_coord = coords[node.node_id]
+            node.move_to(numeric_coord)
+            
+            # Force nodes to render on top of lines
+            node.set_z_index(Z_NODE)
+            
+            animations.append(GrowFromCenter(node))
+            placed.append(node)
+            
+            # Keep track of generated visuals for future cinematic actions (Phase 3)
+            self.mobjects.append(node)
+            
+            # Add text label below
+            label.next_to(node, direction=[0, -1, 0])
+            label.set_z_index(Z_NODE)
+            registry.add_node(node, label)
+            
+            animations.append(Create(label))
+        timings.record("placement", time.perf_counter() - started)
+            
+        # 2. Draw the Orthogonal Routing Edges, routed in one batch around the icons.
+        #    The routing index stays on the scene so later actions only reroute
+        #    the edges they affect.
+        started = time.perf_counter()
+        edges = topology.edges
+        # Phase 4 Bugfix: NodeClusters don't have .width
+        radius = {node.node_id: node.width / 2.0 for node in placed}
+        for node_id in dict.fromkeys(node_id for edge in edges for node_id in edge):
+            if node_id not in radius:
+                node = registry.entity(node_id)
+                radius[node_id] = CLUSTER_FALLBACK_RADIUS if isinstance(node, NodeCluster) else node.width / 2.0
+        routing = RoutingIndex()
+        routing.add_nodes(
+            [node.node_id for node in placed],
+            [coords[node.node_id] for node in placed],
+            [radius[node.node_id] for node in placed],
+            sizes=[(node.width, node.height) for node in placed],
+        )
+        others = [node_id for node_id in radius if node_id not in routing]
+        routing.add_nodes(others, [coords[node_id] for node_id in others], [radius[node_id] for node_id in others])
+
+        # 2b. Fan-out/fan-in edges share one trunk per hub; each edge keeps an
+        #     undrawn full-length track so TrafficFlow can still travel it alone
+        bundles, routed_edges = [], edges
+        if bundle:
+            centers = {node_id: np.asarray(coords[node_id]) for node_id in radius}
+            bundles, routed_edges = bundle_edges(edges, centers, radius)
+        routing.add_edges(routed_edges)
+        # Bundled edges are indexed too: a node later dropped onto one
+        # reroutes it out of its bundle onto its own (then drawn) track
+        routing.add_routed_edges({edge: path for edge_bundle in bundles for edge, path in edge_bundle.paths.items()})
+        self.routing = routing
+        timings.record("routing", time.perf_counter() - started)
+        
+        started = time.perf_counter()
+        self.rendered_bundles = []
+        # Merged: edges are subpaths of one layer; per-edge mobjects stay undrawn
+        layer = EdgeLayer(color=EDGE_COLOR) if self.merge_edges else None
+        tracks = {}
+        for index, edge_bundle in enumerate(bundles):
+            if layer is not None:
+                layer.set_path(("bundle", index, "trunk"), edge_bundle.trunk)
+                layer.set_path(("bundle", index, "bus"), edge_bundle.bus)
+                for edge, branch in edge_bundle.branches.items():
+                    layer.set_path(("bundle", index, edge), branch)
+            else:
+                shared = VMobject(color=EDGE_COLOR)
+                shared.set_points(_bundle_points(edge_bundle))
+                shared.set_z_index(Z_EDGE)
+                self.rendered_bundles.append(shared)
+                animations.append(Create(shared))
+            for edge, path in edge_bundle.paths.items():
+                track = VMobject(color=EDGE_COLOR)
+                track.set_points_as_corners(path)
+                tracks[edge] = track
+        self.edge_bundles = bundles
+        self._bundled = {edge: index for index, edge_bundle in enumerate(bundles) for edge in edge_bundle.branches}
+
+        for edge in edges:
+            if edge in tracks:
+                self.rendered_edges[edge] = tracks[edge]
+                continue
+            line = VMobject(color=EDGE_COLOR)
+            line.set_points_as_corners(routing.paths[edge])
+            
+            # Z-Index renders below components
+            line.set_z_index(Z_EDGE) 
+            
+            # Store edge mathematically for future traffic animation (Phase 3)
+            self.rendered_edges[edge] = line
+            
+            if layer is not None:
+                layer.set_path(edge, routing.paths[edge])
+            else:
+                animations.append(Create(line))
+
+        if layer is not None:
+            layer.rebuild()
+            layer.set_z_index(Z_EDGE)
+            animations.append(Create(layer))
+        self.edge_layer = layer
+        timings.record("edges", time.perf_counter() - started)
+        
+        self.render_timings = timings  # Per-stage wall-clock seconds of this render
+        logger.info("render_topology stage timings: %s", timings.to_json())
+            
+        # Play the cinematic rendering
+        self.play(*animations, run_time=RENDER_DURATION)
+        self.wait(POST_RENDER_WAIT)
+        
+        # The diagram is now static: later plays only redraw what moves
+        self.freeze_background()
+
@@ -0,0 +1,271 @@
+"""
+Graph storage backends for Topology.
+
+Both intern node ids to dense integer indices and hand engines the edges as
+index arrays; they differ in how the edges themselves are held:
+
+- ``"edgelist"`` (the default) keeps them as an insertion-ordered dict of
+  index pairs, the set-plus-order-list representation Topology always used
+  next to the NetworkX graph it builds per layout;
+- ``"compact"`` keeps them in growable int32 NumPy arrays in insertion
+  order, so a 100k-edge inventory costs a few megabytes instead of a dict
+  of tuples. Duplicate detection and the CSR adjacency are backed by a
+  sorted array of packed ``(source << 32) | target`` keys that absorbs new
+  edges in geometrically sized batches.
+"""
+import sys
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from manim_devops.constants import COMPACT_INITIAL_CAPACITY, COMPACT_MERGE_MIN, DEFAULT_GRAPH_STORAGE
+
+_INDEX_DTYPE = np.int32
+_TARGET_MASK = np.int64(0xFFFFFFFF)
+
+
+def csr_from_edges(
+    num_nodes: int, sources: np.ndarray, targets: np.ndarray, undirected: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Builds ``(indptr, indices)`` so that the neighbours of node ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]``, sorted ascending.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    if undirected:
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+    return indptr, targets[order]
+
+
+def gather_neighbours(indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+    """Concatenated CSR neighbour lists of ``nodes``, without a Python loop."""
+    nodes = np.asarray(nodes, dtype=np.int64)
+    lengths = indptr[nodes + 1] - indptr[nodes]
+    starts = np.repeat(indptr[nodes] - np.cumsum(lengths) + lengths, lengths)
+    return indices[starts + np.arange(lengths.sum())]
+
+
+class GraphStorage:
+    """
+    Interned node ids; subclasses store the deduplicated, insertion-ordered
+    directed edges between their indices.
+    """
+    def __init__(self):
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+
+    # ─── Nodes ───────────────────────────────────────────────
+
+    @property
+    def ids(self) -> list[str]:
+        """Interned node ids; position ``i`` is the id of index ``i``."""
+        return self._ids
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._ids)
+
+    def intern(self, node_id: str) -> int:
+        """Returns the index of ``node_id``, allocating the next one if new."""
+        index = self._index.get(node_id)
+        if index is None:
+            index = self._index[node_id] = len(self._ids)
+            self._ids.append(node_id)
+            self._changed()
+        return index
+
+    def get(self, node_id: str) -> Optional[int]:
+        """Returns the index of ``node_id``, or None if it was never interned."""
+        return self._index.get(node_id)
+
+    def _changed(self) -> None:
+        """Drops anything derived from the graph; called after every mutation."""
+
+    # ─── Edges ───────────────────────────────────────────────
+
+    @property
+    def num_edges(self) -> int:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return self.num_edges
+
+    def add_edge(self, source: int, target: int) -> bool:
+        """Appends ``source -> target`` unless present; returns whether it was added."""
+        raise NotImplementedError
+
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Read-only (sources, targets) index arrays in insertion order."""
+        raise NotImplementedError
+
+    def edges(self) -> Iterator[tuple[str, str]]:
+        """Yields ``(source_id, target_id)`` pairs in insertion order."""
+        ids = self._ids
+        sources, targets = self.edge_arrays()
+        for source, target in zip(sources.tolist(), targets.tolist()):
+            yield ids[source], ids[target]
+
+    def csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """Out-neighbour adjacency as ``(indptr, indices)``."""
+        return csr_from_edges(self.num_nodes, *self.edge_arrays())
+
+    def successors(self, index: int) -> np.ndarray:
+        indptr, indices = self.csr()
+        return indices[indptr[index]:indptr[index + 1]]
+
+
+class EdgeListGraph(GraphStorage):
+    """Edges as an insertion-ordered dict of ``(source, target)`` index pairs."""
+    def __init__(self):
+        super().__init__()
+        self._edges: dict[tuple[int, int], None] = {}
+
+    @property
+    def num_edges(self) -> int:
+        return len(self._edges)
+
+    def has_edge(self, source: int, target: int) -> bool:
+        return (source, target) in self._edges
+
+    def add_edge(self, source: int, target: int) -> bool:
+        if (source, target) in self._edges:
+            return False
+        self._edges[(source, target)] = None
+        return True
+
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        pairs = np.fromiter(
+            (index for edge in self._edges for index in edge), dtype=_INDEX_DTYPE, count=2 * len(self._edges)
+        ).reshape(-1, 2)
+        pairs.flags.writeable = False
+        return pairs[:, 0], pairs[:, 1]
+
+    def edges(self) -> Iterator[tuple[str, str]]:
+        ids = self._ids
+        for source, target in self._edges:
+            yield ids[source], ids[target]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the edge dict, its tuples and their ints."""
+        total = sys.getsizeof(self._edges)
+        for edge in self._edges:
+            total += sys.getsizeof(edge) + sys.getsizeof(edge[0]) + sys.getsizeof(edge[1])
+        return total
+
+
+class CompactGraph(GraphStorage):
+    """
+    Interned node ids plus a deduplicated, insertion-ordered directed edge list.
+
+    ``add_edge`` is amortised O(1): new edges land in a small pending set and
+    are merged into the sorted key array once the pending batch reaches an
+    eighth of the stored edges, so total merge work stays O(E log E).
+    """
+    def __init__(self, capacity: int = COMPACT_INITIAL_CAPACITY):
+        super().__init__()
+        self._sources = np.empty(capacity, dtype=_INDEX_DTYPE)
+        self._targets = np.empty(capacity, dtype=_INDEX_DTYPE)
+        self._num_edges = 0
+        self._keys = np.empty(0, dtype=np.int64)  # sorted, merged edges
+        self._pending: set[int] = set()
+        self._csr: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    def _changed(self) -> None:
+        self._csr = None
+
+    # ─── Edges ───────────────────────────────────────────────
+
+    @property
+    def num_edges(self) -> int:
+        return self._num_edges
+
+    def has_edge(self, source: int, target: int) -> bool:
+        return self._contains((source << 32) | target)
+
+    def _contains(self, key: int) -> bool:
+        if key in self._pending:
+            return True
+        keys = self._keys
+        slot = keys.searchsorted(key)
+        return slot < len(keys) and keys.item(slot) == key
+
+    def add_edge(self, source: int, target: int) -> bool:
+        """Appends ``source -> target`` unless present; returns whether it was added."""
+        key = (source << 32) | target
+        if self._contains(key):
+            return False
+        count = self._num_edges
+        if count == len(self._sources):
+            self._grow()
+        self._sources[count] = source
+        self._targets[count] = target
+        self._num_edges = count + 1
+        self._pending.add(key)
+        self._changed()
+        if len(self._pending) >= max(COMPACT_MERGE_MIN, len(self._keys) >> 3):
+            self._merge()
+        return True
+
+    def _grow(self) -> None:
+        capacity = max(2 * len(self._sources), COMPACT_INITIAL_CAPACITY)
+        for name in ("_sources", "_targets"):
+            grown = np.empty(capacity, dtype=_INDEX_DTYPE)
+            grown[:self._num_edges] = getattr(self, name)[:self._num_edges]
+            setattr(self, name, grown)
+
+    def _merge(self) -> None:
+        if self._pending:
+            pending = np.fromiter(self._pending, dtype=np.int64, count=len(self._pending))
+            pending.sort()
+            self._keys = np.insert(self._keys, np.searchsorted(self._keys, pending), pending)
+            self._pending.clear()
+
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Read-only (sources, targets) index views in insertion order."""
+        sources = self._sources[:self._num_edges]
+        targets = self._targets[:self._num_edges]
+        sources.flags.writeable = False
+        targets.flags.writeable = False
+        return sources, targets
+
+    def csr(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Out-neighbour adjacency as ``(indptr, indices)``, derived from the
+        sorted key array and rebuilt only after the graph changed.
+        """
+        if self._csr is None:
+            self._merge()
+            sources = self._keys >> 32
+            indptr = np.searchsorted(sources, np.arange(self.num_nodes + 1, dtype=np.int64))
+            self._csr = (indptr, (self._keys & _TARGET_MASK).astype(_INDEX_DTYPE))
+        return self._csr
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the edge arrays (excluding the id table)."""
+        total = self._sources.nbytes + self._targets.nbytes + self._keys.nbytes
+        if self._csr is not None:
+            total += self._csr[0].nbytes + self._csr[1].nbytes
+        return total
+
+
+GRAPH_STORAGES = {
+    "edgelist": EdgeListGraph,
+    "compact": CompactGraph,
+}
+
+
+def resolve_graph_storage(storage: Union[str, GraphStorage] = DEFAULT_GRAPH_STORAGE) -> GraphStorage:
+    """Accepts a storage instance or a registered name such as ``"compact"``."""
+    if isinstance(storage, GraphStorage):
+        return storage
+    if storage not in GRAPH_STORAGES:
+        raise ValueError(
+            f"Unknown graph storage '{storage}'. Available storages: {sorted(GRAPH_STORAGES)}"
+        )
+    return GRAPH_STORAGES[storage]()
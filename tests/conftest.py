@@ -1,5 +1,11 @@
 import pytest
 from manim_devops.core import Topology, CloudNode
+from manim_devops.constants import LAYOUT_CACHE_DIR_ENV
+
+@pytest.fixture(autouse=True)
+def isolated_layout_cache(tmp_path, monkeypatch):
+    """Points the default layout cache at a per-test directory so tests never share state."""
+    monkeypatch.setenv(LAYOUT_CACHE_DIR_ENV, str(tmp_path / "cache"))
 
 @pytest.fixture
 def empty_topology():
@@ -0,0 +1,43 @@
+import numpy as np
+from manim_devops.arc_length import ArcLengthTable, arc_length_table
+
+def _corners(waypoints):
+    """Bezier points of a polyline, laid out as VMobject.set_points_as_corners does."""
+    waypoints = np.asarray(waypoints, dtype=float)
+    starts, ends = waypoints[:-1], waypoints[1:]
+    return np.stack([starts, starts + (ends - starts) / 3, ends - (ends - starts) / 3, ends], axis=1).reshape(-1, 3)
+
+def test_arc_length_table_moves_at_constant_speed_across_segments():
+    """
+    Asserts that an L-bend with a short and a long leg is reduced to its
+    corners and that equal proportions map to equal distances on both legs.
+    """
+    table = ArcLengthTable.from_points(_corners([[0, 0, 0], [1, 0, 0], [1, 3, 0]]))
+
+    assert len(table.vertices) == 3 and table.length == 4.0
+    points = table.point_at_proportion(np.linspace(0.0, 1.0, 5))
+    assert np.allclose(points, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [1, 2, 0], [1, 3, 0]])
+    assert np.allclose(table.point_at([-1.0, 9.0]), [[0, 0, 0], [1, 3, 0]])
+
+def test_arc_length_table_is_cached_until_the_points_are_replaced():
+    """
+    Asserts that an edge's table is built once and rebuilt when its points
+    array is replaced, as Manim does when moving or rerouting it.
+    """
+    class Edge:
+        points = _corners([[0, 0, 0], [2, 0, 0]])
+
+    edge = Edge()
+    table = arc_length_table(edge)
+    assert arc_length_table(edge) is table
+
+    edge.points = _corners([[0, 0, 0], [0, 5, 0]])
+    assert arc_length_table(edge) is not table
+    assert arc_length_table(edge).length == 5.0
+
+def test_curved_edges_are_sampled():
+    """Asserts that a quarter-circle bezier is measured by sampling, close to pi/2."""
+    handle = 4.0 / 3.0 * (np.sqrt(2.0) - 1.0)
+    quarter = np.array([[1, 0, 0], [1, handle, 0], [handle, 1, 0], [0, 1, 0]], dtype=float)
+
+    assert abs(ArcLengthTable.from_points(quarter).length - np.pi / 2) < 1e-3
@@ -1,3 +1,4 @@
+import time
 import pytest
 from manim_devops.core import Topology
 from manim_devops.layout import OrthogonalRouter
@@ -68,3 +69,238 @@ def test_orthogonal_router_handles_zero_length_collision_IMMUTABLE():
     assert len(waypoints) == 2
     assert np.array_equal(waypoints[0], src)
     assert np.array_equal(waypoints[1], tgt)
+
+def test_relayout_only_moves_the_changed_neighbourhood(aws_3_tier_topology: Topology):
+    """
+    Asserts that an incremental relayout warm-starts from the previous
+    coordinates: the new node gets a position, and nodes outside its
+    k-hop neighbourhood keep exactly the coordinates they had.
+    """
+    from manim_devops.assets import CloudNode
+    
+    previous = aws_3_tier_topology.calculate_layout()
+    
+    by_id = {n.node_id: n for n in aws_3_tier_topology.nodes}
+    cache = CloudNode("cache", "ElastiCache")
+    aws_3_tier_topology.add_node(cache)
+    aws_3_tier_topology.connect(by_id["web1"], cache)
+    
+    updated = aws_3_tier_topology.relayout(previous, changed=["cache"], hops=1)
+    
+    assert set(updated) == set(previous) | {"cache"}
+    assert updated["cache"][2] == 0.0
+    # 'web1' is the only node within one hop of the change; DNS is far away
+    assert updated["dns"] == previous["dns"]
+    assert updated["igw"] == previous["igw"]
+
+def test_relayout_is_deterministic(aws_3_tier_topology: Topology):
+    from manim_devops.assets import CloudNode
+    
+    previous = aws_3_tier_topology.calculate_layout()
+    aws_3_tier_topology.add_node(CloudNode("cache", "ElastiCache"))
+    aws_3_tier_topology.connect(aws_3_tier_topology.nodes[3], aws_3_tier_topology.nodes[-1])
+    
+    first = aws_3_tier_topology.relayout(previous, changed=["cache"])
+    second = aws_3_tier_topology.relayout(previous, changed=["cache"])
+    assert first == second
+
+def test_orthogonal_router_batches_edges():
+    """
+    Asserts that compute_paths() routes a mixed batch in one call, agreeing
+    with per-edge compute_path() and dropping elbows for straight or
+    zero-length edges.
+    """
+    router = OrthogonalRouter()
+    sources = np.array([[0.0, 0.0, 0.0], [5.0, 5.0, 0.0], [0.0, 1.0, 0.0]])
+    targets = np.array([[3.0, 4.0, 0.0], [5.0, 5.0, 0.0], [4.0, 1.0, 0.0]])
+    radii = np.array([0.5, 0.5, 1.0])
+    
+    batch = router.compute_paths(sources, targets, radii, 0.5)
+    
+    assert [len(path) for path in batch] == [3, 2, 2]
+    for path, src, tgt, radius in zip(batch, sources, targets, radii):
+        single = router.compute_path(src, tgt, radius, 0.5)
+        assert np.allclose(path, single)
+    assert np.allclose(batch[2], [[1.0, 1.0, 0.0], [3.5, 1.0, 0.0]])
+
+def test_obstacle_router_detours_around_icons():
+    """
+    Asserts that an edge whose L-bend would run straight through another
+    icon is re-routed around it, still starting and ending on the boundaries.
+    """
+    from manim_devops.layout import ObstacleAvoidingRouter
+    
+    centers = np.array([[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [6.0, 0.0, 0.0]])
+    router = ObstacleAvoidingRouter(ObstacleAvoidingRouter.boxes_from_centers(centers, [1.0] * 3, [1.0] * 3))
+    
+    path = router.compute_paths(centers[[0]], centers[[2]], 0.5, 0.5)[0]
+    
+    # Every segment stays axis-aligned and clear of the middle box
+    for start, end in zip(path[:-1], path[1:]):
+        assert start[0] == end[0] or start[1] == end[1]
+        assert not (min(start[0], end[0]) < 3.5 and max(start[0], end[0]) > 2.5 and abs(start[1]) < 0.5 and abs(end[1]) < 0.5)
+    assert np.isclose(np.abs(path[0] - centers[0]).sum(), 0.5)
+    assert np.isclose(np.abs(path[-1] - centers[2]).sum(), 0.5)
+    assert path[:, 2].tolist() == [0.0] * len(path)
+
+def test_obstacle_router_falls_back_to_l_bend_when_out_of_budget():
+    from manim_devops.layout import ObstacleAvoidingRouter
+    
+    centers = np.array([[0.0, 0.0, 0.0], [3.0, 0.0, 0.0], [6.0, 0.0, 0.0]])
+    boxes = ObstacleAvoidingRouter.boxes_from_centers(centers, [1.0] * 3, [1.0] * 3)
+    router = ObstacleAvoidingRouter(boxes, time_budget=0.0)
+    
+    path = router.compute_paths(centers[[0]], centers[[2]], 0.5, 0.5)[0]
+    
+    assert router.fallbacks == 1
+    assert np.allclose(path, OrthogonalRouter().compute_path(centers[0], centers[2], 0.5, 0.5))
+
+def test_obstacle_router_keeps_to_its_time_budget_on_dense_diagrams():
+    """
+    Asserts that long edges across a dense field of icons each finish within
+    about the router's time budget, grid construction included, instead of
+    rasterising thousands of obstacles before the budget is first checked.
+    """
+    from manim_devops.layout import ObstacleAvoidingRouter
+    
+    side, budget = 150, 0.01
+    grid = np.stack(np.meshgrid(np.arange(side) * 1.6, np.arange(side) * 1.6), axis=-1).reshape(-1, 2)
+    centers = np.column_stack([grid, np.zeros(len(grid))])
+    router = ObstacleAvoidingRouter(
+        ObstacleAvoidingRouter.boxes_from_centers(centers, [1.0] * len(grid), [1.0] * len(grid)), time_budget=budget,
+    )
+    corners = [0, side - 1, side * (side - 1), side * side - 1]
+    slowest = 0.0
+    for source, target in [(corners[0], corners[3]), (corners[1], corners[2]), (side // 2, side * side - side // 2)] * 3:
+        started = time.perf_counter()
+        router.compute_paths(centers[[source]], centers[[target]], 0.5, 0.5)
+        slowest = max(slowest, time.perf_counter() - started)
+    
+    assert slowest < budget + 0.04
+
+def test_spatial_grid_only_returns_overlapping_boxes():
+    from manim_devops.layout import SpatialGrid
+    
+    grid = SpatialGrid(cell_size=1.0)
+    grid.insert([[0.0, 0.0, 1.0, 1.0], [10.0, 10.0, 12.0, 11.0], [-5.0, -5.0, 5.0, -4.0]])
+    
+    assert grid.query(0.5, 0.5, 0.6, 0.6).tolist() == [0]
+    assert grid.query(11.0, 10.5, 20.0, 20.0).tolist() == [1]
+    assert grid.query(-1.0, -4.5, 0.5, 0.5).tolist() == [0, 2]
+    assert len(grid.query(3.0, 3.0, 4.0, 4.0)) == 0
+
+def test_routing_index_only_reroutes_affected_edges():
+    """
+    Asserts that adding, moving and removing a node reroutes only the edges
+    incident to it or running through its icon, leaving the rest untouched.
+    """
+    from manim_devops.layout import RoutingIndex
+    
+    routing = RoutingIndex()
+    ids = ["a", "b", "c", "d"]
+    centers = [[0.0, 0.0, 0.0], [6.0, 0.0, 0.0], [0.0, 10.0, 0.0], [6.0, 10.0, 0.0]]
+    routing.add_nodes(ids, centers, [0.5] * 4, sizes=[(1.0, 1.0)] * 4)
+    routing.add_edges([("a", "b"), ("c", "d")])
+    far_path = routing.paths[("c", "d")]
+    
+    # A new icon dropped onto the a -> b line forces only that edge around it
+    rerouted = routing.add_node("blocker", [3.0, 0.0, 0.0], 0.5, size=(1.0, 1.0))
+    assert list(rerouted) == [("a", "b")]
+    assert len(routing.paths[("a", "b")]) > 2
+    assert routing.paths[("c", "d")] is far_path
+    
+    # Moving an endpoint reroutes its incident edge only
+    rerouted = routing.move_node("d", [6.0, 12.0, 0.0])
+    assert list(rerouted) == [("c", "d")]
+    
+    # Removing the blocker lets a -> b straighten out again
+    rerouted = routing.remove_node("blocker")
+    assert list(rerouted) == [("a", "b")]
+    assert np.allclose(routing.paths[("a", "b")], [[0.5, 0.0, 0.0], [5.5, 0.0, 0.0]])
+
+def test_routing_index_skips_nearby_edges_a_new_node_does_not_cross():
+    """
+    Asserts that an added node only sends the edges whose paths enter its
+    box to the router, not every edge indexed in the cells it touches.
+    """
+    from manim_devops.layout import RoutingIndex
+    
+    routing = RoutingIndex()
+    ids = ["a", "b", "c", "d", "e", "f"]
+    centers = [[0.0, 0.0, 0.0], [6.0, 0.0, 0.0], [0.0, 0.8, 0.0], [6.0, 0.8, 0.0], [0.0, -0.9, 0.0], [6.0, -0.9, 0.0]]
+    routing.add_nodes(ids, centers, [0.1] * 6)
+    routing.add_edges([("a", "b"), ("c", "d"), ("e", "f")])
+    routed = []
+    compute_paths = routing.router.compute_paths
+    routing.router.compute_paths = lambda sources, *args: routed.append(len(sources)) or compute_paths(sources, *args)
+    
+    rerouted = routing.add_node("blocker", [3.0, 0.0, 0.0], 0.5, size=(1.0, 1.0))
+    
+    assert list(rerouted) == [("a", "b")]
+    assert routed == [1]
+
+def test_fan_out_edges_share_one_trunk():
+    """
+    Asserts that an ALB fanning out to a row of instances is bundled: one
+    trunk and bus for the whole group, a short vertical branch per edge, and
+    a full per-edge path that still runs hub boundary -> member boundary.
+    """
+    from manim_devops.layout import bundle_edges
+    
+    centers = {"alb": np.array([0.0, 0.0, 0.0])}
+    radii = {"alb": 0.5}
+    edges = []
+    for i in range(20):
+        centers[f"ec2_{i}"] = np.array([i - 9.5, -4.0, 0.0])
+        radii[f"ec2_{i}"] = 0.5
+        edges.append(("alb", f"ec2_{i}"))
+    centers["db"], radii["db"] = np.array([6.0, 0.0, 0.0]), 0.5
+    edges.append(("db", "alb"))
+    
+    bundles, leftover = bundle_edges(edges, centers, radii)
+    
+    assert len(bundles) == 1 and bundles[0].hub == "alb"
+    assert leftover == [("db", "alb")]
+    trunk_bus = bundles[0]
+    assert np.allclose(trunk_bus.trunk, [[0.0, -0.5, 0.0], [0.0, -2.0, 0.0]])
+    assert np.allclose(trunk_bus.bus[:, 0], [-9.5, 9.5])
+    for i, edge in enumerate(edges[:20]):
+        branch = trunk_bus.branches[edge]
+        assert branch[0, 0] == branch[1, 0] == i - 9.5  # vertical drop from the bus
+        path = trunk_bus.paths[edge]
+        assert np.allclose(path[0], [0.0, -0.5, 0.0])
+        assert np.allclose(path[-1], [i - 9.5, -3.5, 0.0])
+
+def test_fan_in_bundle_paths_follow_edge_direction():
+    from manim_devops.layout import bundle_edges
+    
+    centers = {"db": np.array([0.0, 0.0, 0.0])}
+    radii = {"db": 0.5}
+    edges = []
+    for i in range(4):
+        centers[f"app{i}"] = np.array([-6.0, 2.0 * i, 0.0])
+        radii[f"app{i}"] = 0.5
+        edges.append((f"app{i}", "db"))
+    
+    bundles, leftover = bundle_edges(edges, centers, radii)
+    
+    assert leftover == []
+    path = bundles[0].paths[("app3", "db")]
+    assert np.allclose(path[0], [-5.5, 6.0, 0.0])
+    assert np.allclose(path[-1], [-0.5, 0.0, 0.0])
+
+def test_routing_index_reroutes_registered_bundle_paths():
+    """
+    Asserts that edges registered with precomputed (bundled) paths are
+    indexed like routed ones, so an icon dropped onto one reroutes it.
+    """
+    from manim_devops.layout import RoutingIndex
+    
+    routing = RoutingIndex()
+    routing.add_nodes(["hub", "leaf"], [[0.0, 0.0, 0.0], [6.0, -4.0, 0.0]], [0.5] * 2, sizes=[(1.0, 1.0)] * 2)
+    bundled = np.array([[0.0, -0.5, 0.0], [0.0, -2.0, 0.0], [6.0, -2.0, 0.0], [6.0, -3.5, 0.0]])
+    routing.add_routed_edges({("hub", "leaf"): bundled})
+    assert np.array_equal(routing.paths[("hub", "leaf")], bundled)
+    
+    rerouted = routing.add_node("blocker", [3.0, -2.0, 0.0], 0.5, size=(1.0, 1.0))
+    assert list(rerouted) == [("hub", "leaf")]
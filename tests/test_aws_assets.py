@@ -29,3 +29,178 @@ def test_aws_node_fallback_instantiation_IMMUTABLE():
         # Verify it successfully captured the kwargs
         assert comp.node_id is not None
         assert comp.label is not None
+
+def test_icons_are_parsed_once_and_copied_per_instance():
+    """
+    Asserts that repeated instances of one icon type hit the shared parsed-SVG
+    cache instead of re-parsing the file, while owning independent geometry.
+    """
+    from unittest.mock import patch
+    from manim_devops.assets import icon_cache
+    from manim_devops.assets.icon_cache import ICON_CACHE
+    
+    ICON_CACHE.clear()
+    with patch.object(icon_cache, "parse_icon", wraps=icon_cache.parse_icon) as parse:
+        servers = [EC2(f"web{i}", f"Web {i}").materialize() for i in range(5)]
+    
+    assert parse.call_count == 1
+    assert len(ICON_CACHE) == 1
+    first, second = servers[0], servers[1]
+    assert first.submobjects[0] is not second.submobjects[0]
+    first.shift([1, 0, 0])
+    assert not (first.get_center() == second.get_center()).all()
+
+def test_warm_icon_store_skips_the_svg_parser(tmp_path):
+    """
+    Asserts that once an asset pack is pre-warmed on disk, a cold in-process
+    cache rebuilds icons from the stored arrays without parsing any SVG.
+    """
+    import numpy as np
+    from unittest.mock import patch
+    from manim_devops.assets import icon_cache
+    from manim_devops.assets.aws import ASSETS_DIR
+    from manim_devops.assets.icon_cache import ICON_CACHE
+    from manim_devops.assets.icon_store import default_icon_store
+    
+    store = default_icon_store()
+    assert store.warm(ASSETS_DIR)["stored"] == 5
+    ICON_CACHE.clear()
+    parsed = icon_cache.parse_icon(ASSETS_DIR / "Amazon-EC2.svg", 0.5)
+    
+    with patch.object(icon_cache, "parse_icon") as parse:
+        server = EC2("web1", "Web 1").materialize()
+    
+    parse.assert_not_called()
+    assert store.hits == 1
+    assert len(server.submobjects) == len(parsed.submobjects)
+    for rebuilt, original in zip(server.submobjects, parsed.submobjects):
+        assert np.allclose(rebuilt.points, original.points)
+        assert rebuilt.z_index == original.z_index
+
+def _painted(mob) -> dict:
+    """Everything Manim reads when drawing ``mob``, in comparable form."""
+    import numpy as np
+    state = {name: getattr(mob, name) for name in ("joint_type", "cap_style", "z_index", "shade_in_3d")}
+    for name, value in mob.get_style().items():
+        state[name] = value.tolist() if isinstance(value, np.ndarray) else value
+    for name in ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+        state[name] = np.asarray(getattr(mob, name)).tolist()
+    return state
+
+def test_icon_store_round_trip_paints_like_the_parsed_icon(tmp_path):
+    """
+    Asserts that an icon rebuilt from the disk store keeps the points,
+    colours and every style field (sheen, joint and cap style, z-index ...)
+    of the parsed icon and of each of its paths.
+    """
+    from manim import RIGHT, CapStyleType, LineJointType
+    from manim_devops.assets.aws import ASSETS_DIR
+    from manim_devops.assets.icon_cache import parse_icon
+    from manim_devops.assets.icon_store import IconStore
+    
+    svg_path = ASSETS_DIR / "Amazon-EC2.svg"
+    parsed = parse_icon(svg_path, 0.5)
+    parsed.submobjects[0].set_sheen(0.3, RIGHT, family=False).set_cap_style(CapStyleType.ROUND)
+    parsed.submobjects[-1].joint_type = LineJointType.BEVEL
+    store = IconStore(tmp_path)
+    key = store.make_key(svg_path, 0.5)
+    
+    assert store.put(key, parsed)
+    rebuilt = store.get(key)
+    assert _painted(rebuilt) == _painted(parsed)
+    assert len(rebuilt.submobjects) == len(parsed.submobjects)
+    for restored, original in zip(rebuilt.submobjects, parsed.submobjects):
+        assert _painted(restored) == _painted(original)
+
+def test_icon_geometry_is_built_only_by_materialize():
+    """
+    Asserts that constructing nodes only records identity and the icon
+    reference, that materialize() adds the geometry, and that a node used
+    in a scene before that fails loudly instead of drawing nothing.
+    """
+    from unittest.mock import patch
+    from manim import tempconfig
+    from manim_devops.core import DevopsScene
+    from manim_devops.assets.icon_cache import ICON_CACHE
+    
+    with patch.object(ICON_CACHE, "load", wraps=ICON_CACHE.load) as load:
+        servers = [EC2(f"web{i}", f"Web {i}") for i in range(1000)]
+        assert load.call_count == 0
+        assert not servers[0].is_materialized and not servers[0].submobjects
+        
+        servers[0].materialize().move_to([1, 0, 0])
+        servers[0].materialize()  # idempotent
+        
+        assert load.call_count == 1
+        assert servers[0].submobjects and servers[0].get_center()[0] == 1
+        assert servers[0].node_id == "web0" and servers[0].name == "EC2"
+    
+    with tempconfig({"dry_run": True, "quality": "low_quality", "disable_caching": True}):
+        scene = DevopsScene()
+        scene.add(servers[0])
+        with pytest.raises(RuntimeError, match="materialize"):
+            scene.add(servers[1])
+
+def test_small_icons_use_a_simplified_level_of_detail():
+    """
+    Asserts that an icon drawn only a few pixels wide is built from a reduced
+    variant with fewer paths and points, while keeping its footprint.
+    """
+    full = EC2("full", "Full").materialize()
+    tiny = EC2("tiny", "Tiny").materialize(pixels_per_unit=16)
+    
+    count = lambda icon: sum(len(mob.points) for mob in icon.get_family())
+    assert len(tiny.submobjects) <= len(full.submobjects)
+    assert count(tiny) < count(full)
+    assert abs(tiny.width - full.width) < 0.1 * full.width
+
+def test_instanced_icons_share_geometry_at_target_scale():
+    """
+    Asserts that 10k instanced nodes of one icon type hold a single
+    read-only copy of its paths, each node owning only the four corner
+    points Manim transforms, so point memory stays a small fraction of
+    private copies.
+    """
+    from manim_devops.assets.icon_cache import icon_nbytes
+    from manim_devops.assets.instancing import InstancedIcon
+    
+    reference = EC2("ref", "Reference").materialize()
+    servers = [EC2(f"web{i}", f"Web {i}").materialize(instanced=True) for i in range(10_000)]
+    icons = [server.submobjects[0] for server in servers]
+    
+    assert all(isinstance(icon, InstancedIcon) for icon in icons)
+    shared = {id(path.geometry): path.geometry.points for icon in icons for path in icon.submobjects}
+    assert len(shared) == len(reference.submobjects)
+    assert not any(points.flags.writeable for points in shared.values())
+    
+    owned = sum(mob.points.nbytes for server in servers for mob in server.get_family())
+    assert owned == len(servers) * 4 * 3 * 8
+    assert owned + sum(points.nbytes for points in shared.values()) < len(servers) * icon_nbytes(reference) / 10
+
+def test_instanced_icons_are_drawn_where_a_private_copy_would_be():
+    """
+    Asserts that after moving, scaling and rotating, the camera places an
+    instanced node's shared paths exactly on the points of a private copy
+    transformed the same way, and draws the same pixels.
+    """
+    import numpy as np
+    from manim import Camera, tempconfig
+    from manim_devops.assets.instancing import InstancingCamera
+    
+    instanced = EC2("web1", "Web 1").materialize(instanced=True)
+    private = EC2("web2", "Web 2").materialize()
+    for node in (instanced, private):
+        node.move_to([2, 1, 0]).scale(1.5).rotate(0.5)
+    
+    drawn = [points for _, points in instanced.submobjects[0].drawn_paths()]
+    assert len(drawn) == len(private.submobjects)
+    for points, path in zip(drawn, sorted(private.submobjects, key=lambda path: path.z_index)):
+        assert np.allclose(points, path.points)
+    
+    with tempconfig({"quality": "low_quality", "disable_caching": True}):
+        blank, camera, reference = Camera(), InstancingCamera(), Camera()
+        camera.capture_mobjects([instanced])
+        reference.capture_mobjects([private])
+    
+    assert not np.array_equal(camera.pixel_array, blank.pixel_array)
+    assert np.abs(camera.pixel_array.astype(int) - reference.pixel_array.astype(int)).mean() < 0.05
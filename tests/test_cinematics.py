@@ -246,3 +246,54 @@ def test_scale_out_action_raises_key_error_for_invalid_target_IMMUTABLE():
     
     with pytest.raises(KeyError, match="'fake_db' not found in Scene memory"):
         ScaleOutAction(scene, cluster, new_ec2, target=invalid_target)
+
+@pytest.mark.parametrize("merged", [False, True])
+def test_scale_out_draws_each_rerouted_bundled_edge_once(merged):
+    """
+    Asserts that when a new node lands on a bundle branch, every rerouted
+    bundled edge leaves its bundle's drawing and is drawn exactly once on
+    its own track (or, merged, its own layer path) at the edge z-index.
+    """
+    import numpy as np
+    from manim_devops.cinematics import ScaleOutAction
+    from manim_devops.core import NodeCluster, Topology
+    from manim_devops.assets.aws import EC2, ALB
+    from manim_devops.constants import Z_EDGE
+    
+    class BundledScene(DevopsScene):
+        merge_edges = merged
+    
+    with tempconfig({"dry_run": True, "quality": "low_quality", "disable_caching": True}):
+        scene = BundledScene()
+        topo = Topology(layout_engine="layered", scale_factor=6.0)
+        alb = ALB("alb", "ALB")
+        servers = [EC2(f"web{i}", f"Web {i}") for i in range(4)]
+        pool = NodeCluster("pool", "Pool")
+        topo.add_nodes([alb, *servers, pool])
+        for server in servers:
+            topo.connect(alb, server)
+        scene.render_topology(topo, bundle=True)
+        bundled = set(scene.edge_bundles[0].branches)
+        assert len(bundled) == 4
+        
+        # The pool's first node is placed at its center: right on a branch
+        branch = scene.edge_bundles[0].branches[("alb", "web1")]
+        scene.rendered_coords["pool"] = tuple((branch[0] + branch[1]) / 2.0)
+        scene.play(ScaleOutAction(scene, pool, EC2("web4", "Web 4")))
+        
+        detached = bundled - set(scene.edge_bundles[0].branches)
+        assert ("alb", "web1") in detached
+        for edge in detached:
+            track = scene.rendered_edges[edge]
+            assert np.allclose(track.points[[0, -1]], scene.routing.paths[edge][[0, -1]])
+            if merged:
+                assert edge in scene.edge_layer.edge_paths
+                assert not any(key[-1] == edge for key in scene.edge_layer.edge_paths if key[0] == "bundle")
+                assert track not in scene.mobjects
+            else:
+                assert scene.mobjects.count(track) == 1 and track.z_index == Z_EDGE
+        if not merged:
+            # Four points per straight segment of the trunk, bus and remaining branches
+            edge_bundle = scene.edge_bundles[0]
+            segments = [edge_bundle.trunk, edge_bundle.bus, *edge_bundle.branches.values()]
+            assert len(scene.rendered_bundles[0].points) == 4 * sum(len(segment) - 1 for segment in segments)
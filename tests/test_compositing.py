@@ -0,0 +1,80 @@
+from unittest.mock import patch
+from manim import RED, tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim_devops.core import Topology, DevopsScene
+from manim_devops.cinematics import TrafficFlow
+from manim_devops.assets.aws import EC2
+
+DRY_RUN = {"dry_run": True, "quality": "low_quality", "disable_caching": True}
+
+def _chain(scene, count=8):
+    topo = Topology(scale_factor=6.0)
+    servers = [EC2(f"web{i}", f"Web {i}") for i in range(count)]
+    topo.add_nodes(servers)
+    for source, target in zip(servers, servers[1:]):
+        topo.connect(source, target)
+    scene.render_topology(topo)
+    return servers
+
+def test_traffic_frames_redraw_only_what_moves():
+    """
+    Asserts that once the diagram is frozen, a TrafficFlow's moving set is
+    the packet, the pulsed target and icons it may pass under, while the
+    rest of the diagram stays in the static background.
+    """
+    with tempconfig(DRY_RUN):
+        scene = DevopsScene()
+        servers = _chain(scene)
+        flow = TrafficFlow(scene, servers[0], servers[1])
+        scene.add_mobjects_from_animations([flow])
+        flow.begin()
+        
+        moving, static = scene.get_moving_and_static_mobjects([flow])
+    
+    moving = set(moving)
+    assert all(member in moving for member in servers[1].get_family() if len(member.points))
+    far = servers[-1]
+    assert not any(member in moving for member in far.get_family())
+    assert len(static) > len(moving)
+
+def test_background_is_cached_across_plays_until_invalidated():
+    """
+    Asserts that repeating a TrafficFlow reuses the rasterised background,
+    and that invalidate_background() forces a redraw.
+    """
+    with tempconfig(DRY_RUN):
+        scene = DevopsScene()
+        servers = _chain(scene, count=4)
+        with patch.object(
+            CairoRenderer, "save_static_frame_data", autospec=True,
+            side_effect=CairoRenderer.save_static_frame_data,
+        ) as rasterise:
+            scene.play(TrafficFlow(scene, servers[0], servers[1]))
+            scene.play(TrafficFlow(scene, servers[0], servers[1]))
+            assert rasterise.call_count == 1
+            
+            scene.invalidate_background()
+            scene.play(TrafficFlow(scene, servers[0], servers[1]))
+            assert rasterise.call_count == 2
+
+def test_background_is_redrawn_after_a_static_mobject_changes():
+    """
+    Asserts that recolouring or moving a static icon between plays, without
+    invalidate_background(), rasterises the background again instead of
+    reusing the stale frame.
+    """
+    with tempconfig(DRY_RUN):
+        scene = DevopsScene()
+        servers = _chain(scene, count=4)
+        with patch.object(
+            CairoRenderer, "save_static_frame_data", autospec=True,
+            side_effect=CairoRenderer.save_static_frame_data,
+        ) as rasterise:
+            scene.play(TrafficFlow(scene, servers[0], servers[1]))
+            servers[-1].set_color(RED)
+            scene.play(TrafficFlow(scene, servers[0], servers[1]))
+            assert rasterise.call_count == 2
+
+            servers[-1].shift([0.1, 0, 0])
+            scene.play(TrafficFlow(scene, servers[0], servers[1]))
+            assert rasterise.call_count == 3
@@ -0,0 +1,126 @@
+import numpy as np
+from manim_devops.core import Topology, NodeCluster
+from manim_devops.assets import CloudNode
+from manim_devops.compound import INTERIOR_CACHE, cluster_shape, separate_boxes
+
+def _vpc(prefix: str) -> NodeCluster:
+    """A VPC -> subnet -> ASG module with three web servers and a database."""
+    vpc = NodeCluster(f"{prefix}_vpc", "VPC")
+    subnet = NodeCluster(f"{prefix}_subnet", "Private Subnet")
+    asg = NodeCluster(f"{prefix}_asg", "Auto-Scaling Group")
+    for i in range(3):
+        asg.add_child(CloudNode(f"{prefix}_web{i}", "EC2"))
+    subnet.add_child(asg)
+    subnet.add_child(CloudNode(f"{prefix}_db", "RDS"))
+    vpc.add_child(subnet)
+    return vpc
+
+def _bounds(coords: dict, node_ids: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    xy = np.array([coords[node_id][:2] for node_id in node_ids])
+    return xy.min(axis=0) - 0.5, xy.max(axis=0) + 0.5
+
+def test_nested_clusters_place_every_descendant():
+    """
+    Asserts that VPC -> subnet -> ASG nesting resolves recursively: every
+    descendant gets a coordinate and the ASG's servers sit inside the subnet.
+    """
+    topo = Topology(scale_factor=1.0)
+    lb = CloudNode("lb", "ALB")
+    vpc = _vpc("a")
+    topo.add_nodes([lb, vpc])
+    topo.connect(lb, vpc)
+
+    coords = topo.calculate_layout()
+
+    for node_id in ["a_subnet", "a_asg", "a_web0", "a_web1", "a_web2", "a_db"]:
+        assert node_id in coords
+    webs = [coords[f"a_web{i}"] for i in range(3)]
+    # Servers form an evenly spaced row centred on their ASG
+    assert [round(x - webs[0][0], 9) for x, _, _ in webs] == [0.0, 1.0, 2.0]
+    assert webs[1][0] == coords["a_asg"][0]
+    assert all(y == coords["a_asg"][1] for _, y, _ in webs)
+
+def test_identical_subtrees_share_one_interior_layout():
+    """
+    Asserts that interiors are keyed by shape, not node ids, so repeated
+    modules are laid out once and end up with identical relative geometry.
+    """
+    INTERIOR_CACHE.clear()
+    topo = Topology()
+    vpcs = [_vpc(prefix) for prefix in ("a", "b", "c")]
+    topo.add_nodes(vpcs)
+    topo.connect(vpcs[0], vpcs[1])
+    topo.connect(vpcs[1], vpcs[2])
+
+    coords = topo.calculate_layout()
+
+    assert cluster_shape(vpcs[0]) == cluster_shape(vpcs[2])
+    assert len(INTERIOR_CACHE._entries) == 3  # ASG, subnet and VPC shapes only
+    offset_a = np.subtract(coords["a_web2"], coords["a_vpc"])
+    offset_c = np.subtract(coords["c_web2"], coords["c_vpc"])
+    assert np.allclose(offset_a, offset_c)
+
+def test_sibling_clusters_do_not_overlap():
+    """
+    Asserts that clusters are treated as sized super-nodes, so two large
+    clusters never share floor space even at a tight scale factor.
+    """
+    topo = Topology(scale_factor=1.0)
+    left, right = _vpc("a"), _vpc("b")
+    topo.add_nodes([left, right])
+    topo.connect(left, right)
+
+    coords = topo.calculate_layout()
+
+    members = lambda p: [f"{p}_web{i}" for i in range(3)] + [f"{p}_db"]
+    lo_a, hi_a = _bounds(coords, members("a"))
+    lo_b, hi_b = _bounds(coords, members("b"))
+    assert (hi_a <= lo_b + 1e-9).any() or (hi_b <= lo_a + 1e-9).any()
+
+def test_separate_boxes_only_moves_movers():
+    centers = np.array([[0.0, 0.0], [0.5, 0.0], [5.0, 5.0]])
+    sizes = np.array([[2.0, 2.0], [1.0, 1.0], [1.0, 1.0]])
+
+    separated = separate_boxes(centers, sizes, movers=np.array([True, False, False]))
+
+    assert np.array_equal(separated[1:], centers[1:])
+    assert abs(separated[0, 0] - separated[1, 0]) >= 1.5 - 1e-9
+
+def test_large_clusters_stay_in_one_row_unless_wrapping_is_opted_in():
+    """
+    Asserts that a wide cluster keeps the original single-row packing by
+    default, and only wraps into a grid with an explicit cluster_row_limit.
+    """
+    asg = NodeCluster("asg", "ASG")
+    for i in range(12):
+        asg.add_child(CloudNode(f"web{i}", "EC2"))
+    
+    row = asg.resolve_child_coordinates((0.0, 0.0, 0.0))
+    assert len({y for _, y, _ in row.values()}) == 1
+    assert [row[f"web{i}"][0] for i in range(12)] == [i - 5.5 for i in range(12)]
+    
+    topo = Topology(cluster_row_limit=8, layout_cache=False)
+    topo.add_node(asg)
+    grid = topo.resolve_cluster_coordinates(asg, (0.0, 0.0, 0.0))
+    assert len({y for _, y, _ in grid.values()}) == 3
+
+def test_compound_graph_is_rebuilt_only_when_the_topology_changes():
+    """
+    Asserts that repeated cluster resolutions reuse one collapsed graph,
+    and that growing a cluster (as ScaleOutAction does) rebuilds it.
+    """
+    topo = Topology(layout_cache=False)
+    vpc = _vpc("a")
+    topo.add_node(vpc)
+    center = (0.0, 0.0, 0.0)
+    
+    topo.resolve_cluster_coordinates(vpc, center)
+    graph = topo._compound_graph()
+    topo.resolve_cluster_coordinates(vpc, center)
+    assert topo._compound_graph() is graph
+    
+    new_web = CloudNode("a_web3", "EC2")
+    vpc.children[0].children[0].add_child(new_web)
+    topo.add_node(new_web)
+    assert "a_web3" in topo.resolve_cluster_coordinates(vpc, center)
+    assert topo._compound_graph() is not graph
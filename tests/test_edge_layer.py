@@ -0,0 +1,57 @@
+import numpy as np
+from manim import VMobject, tempconfig
+from manim_devops.core import Topology, DevopsScene
+from manim_devops.cinematics import TrafficFlow
+from manim_devops.edge_layer import EdgeLayer, corner_curves
+from manim_devops.assets.aws import EC2
+
+DRY_RUN = {"dry_run": True, "quality": "low_quality", "disable_caching": True}
+
+def test_corner_curves_match_set_points_as_corners():
+    """
+    Asserts that the vectorised segment builder produces exactly the
+    points VMobject.set_points_as_corners would for the same waypoints.
+    """
+    waypoints = np.array([[0, 0, 0], [2, 0, 0], [2, 3, 0], [-1, 3, 0]], dtype=float)
+    line = VMobject()
+    line.set_points_as_corners(waypoints)
+
+    assert np.allclose(corner_curves(waypoints), line.points)
+
+def test_edge_layer_repacks_a_replaced_path():
+    """
+    Asserts that every stored path becomes one subpath of the layer and
+    that replacing a path and rebuilding only changes that subpath.
+    """
+    layer = EdgeLayer()
+    layer.set_path(("a", "b"), [[0, 0, 0], [1, 0, 0]])
+    layer.set_path(("b", "c"), [[5, 5, 0], [5, 6, 0], [6, 6, 0]])
+    layer.rebuild()
+    assert len(layer.get_subpaths()) == 2
+
+    layer.set_path(("a", "b"), [[0, 0, 0], [0, -1, 0], [1, -1, 0]])
+    layer.rebuild()
+    assert len(layer.points) == 16
+    assert np.allclose(layer.points[8:], corner_curves([[5, 5, 0], [5, 6, 0], [6, 6, 0]]))
+
+def test_merged_render_draws_one_edge_mobject():
+    """
+    Asserts that with merge_edges the scene draws a single edge layer
+    while TrafficFlow still travels the individual edge.
+    """
+    class MergedScene(DevopsScene):
+        merge_edges = True
+
+    with tempconfig(DRY_RUN):
+        scene = MergedScene()
+        topo = Topology(scale_factor=6.0)
+        servers = [EC2(f"web{i}", f"Web {i}") for i in range(5)]
+        topo.add_nodes(servers)
+        for source, target in zip(servers, servers[1:]):
+            topo.connect(source, target)
+        scene.render_topology(topo)
+
+        assert scene.edge_layer in scene.mobjects
+        assert not any(edge in scene.mobjects for edge in scene.rendered_edges.values())
+        assert set(scene.edge_layer.edge_paths) == set(topo.edges)
+        TrafficFlow(scene, servers[1], servers[2])
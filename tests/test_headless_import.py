@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+# Generous wall-clock budget for a cold import of the model layer; the
+# rendering stack alone takes several seconds to import.
+IMPORT_BUDGET_SECONDS = 1.0
+
+def _cold_import(statement: str) -> list[str]:
+    script = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - started\n"
+        "heavy = sorted({m.split('.')[0] for m in sys.modules} & {'manim', 'networkx'})\n"
+        "print(elapsed)\n"
+        "print(','.join(heavy))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return result.stdout.splitlines()
+
+def test_model_layer_imports_without_the_rendering_stack():
+    """
+    Asserts that building topologies, laying them out, routing and measuring
+    them never imports manim or networkx, and that the cold import stays fast.
+    """
+    elapsed, heavy = _cold_import(
+        "import manim_devops.core, manim_devops.layout, manim_devops.metrics, manim_devops.adapter\n"
+        "from manim_devops.core import Topology, NodeCluster\n"
+        "from manim_devops.assets import CloudNode\n"
+        "topo = Topology(layout_engine='layered')\n"
+        "a, b = CloudNode('a', 'A'), CloudNode('b', 'B')\n"
+        "topo.add_nodes([a, b]); topo.connect(a, b)\n"
+        "topo.calculate_layout()"
+    )
+    
+    assert heavy == ""
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
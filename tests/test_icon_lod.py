@@ -0,0 +1,44 @@
+import numpy as np
+from manim_devops.assets.lod import lod_level, reduce_points, simplify_subpath, subpaths
+
+def _line_cubics(anchors: np.ndarray) -> np.ndarray:
+    anchors = np.column_stack([anchors, np.zeros(len(anchors))])
+    starts, ends = anchors[:-1], anchors[1:]
+    return np.stack([starts, starts + (ends - starts) / 3, ends - (ends - starts) / 3, ends], axis=1)
+
+def test_flat_runs_collapse_to_their_corners():
+    """
+    Asserts that a finely sampled square outline, with sub-tolerance jitter,
+    is reduced to its four sides and still starts and ends at the same corner.
+    """
+    rng = np.random.default_rng(0)
+    side = np.linspace(0, 1, 26)[:-1]
+    outline = np.concatenate([
+        np.column_stack([side, np.zeros(25)]), np.column_stack([np.ones(25), side]),
+        np.column_stack([1 - side, np.ones(25)]), np.column_stack([np.zeros(25), 1 - side]),
+        [[0.0, 0.0]],
+    ])
+    outline[1:-1] += rng.uniform(-1e-3, 1e-3, outline[1:-1].shape)
+    curves = _line_cubics(outline)
+
+    simplified = simplify_subpath(curves, tolerance=0.01)
+
+    assert len(simplified) == 4
+    assert np.allclose(simplified[0, 0], simplified[-1, 3])
+    assert np.allclose(simplified[:, 3, :2], [[1, 0], [1, 1], [0, 1], [0, 0]], atol=2e-3)
+
+def test_curved_segments_and_visible_subpaths_survive():
+    arc = np.array([[[0, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, 0]]], dtype=float)
+    speck = _line_cubics(np.array([[5.0, 5.0], [5.001, 5.0], [5.001, 5.001], [5.0, 5.0]]))
+    points = np.concatenate([arc, speck]).reshape(-1, 3)
+    assert len(subpaths(points)) == 2
+
+    reduced = reduce_points(points, tolerance=0.01, min_detail=0.01)
+
+    assert np.array_equal(reduced, arc.reshape(-1, 3))
+
+def test_lod_level_quantises_on_screen_size():
+    assert lod_level(None) is None
+    assert lod_level(10) == 16
+    assert lod_level(33) == 64
+    assert lod_level(500) is None
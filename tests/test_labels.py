@@ -0,0 +1,63 @@
+from unittest.mock import patch
+import manim_devops.labels as labels
+from manim_devops.labels import LABEL_CACHE, build_labels
+
+def test_repeated_labels_are_built_once_and_copied():
+    """
+    Asserts that a topology's labels cost one Text layout however many
+    nodes share a caption, and that every node gets its own copy.
+    """
+    LABEL_CACHE.clear()
+    texts = ["Web Server"] * 50 + ["Database", "Cache"]
+    
+    with patch.object(labels, "Text", wraps=labels.Text) as text_cls:
+        built = build_labels(texts)
+        again = build_labels(["Database"])
+    
+    assert text_cls.call_count == 1
+    assert len(built) == 52 and len(LABEL_CACHE) == 3
+    assert built[0] is not built[1]
+    assert len(built[0].submobjects) == len("WebServer")
+    built[0].shift([3, 0, 0])
+    assert built[1].get_center()[0] != built[0].get_center()[0]
+    assert abs(again[0].width - built[50].width) < 1e-6
+
+def test_glyph_atlas_composes_labels_left_to_right():
+    LABEL_CACHE.clear()
+    
+    abc, cab = build_labels(["abc", "c ab"], glyphs=True)
+    
+    lefts = [glyph.get_left()[0] for glyph in abc.submobjects]
+    assert lefts == sorted(lefts)
+    assert len(cab.submobjects) == 3
+    assert cab.width > abc.width  # the space advances the cursor
+
+def test_glyph_atlas_advances_match_pango_layout():
+    """
+    Asserts that composed labels are spaced by each glyph's advance from
+    its origin, so they match the width Pango gives the same text.
+    """
+    LABEL_CACHE.clear()
+    
+    composed = build_labels(["minimum bus"], glyphs=True)[0]
+    laid_out = labels.Text("minimum bus", font=labels.LABEL_FONT, font_size=labels.LABEL_FONT_SIZE)
+    
+    assert abs(composed.width - laid_out.width) < 0.02 * laid_out.width
+
+def test_unmappable_characters_fall_back_to_text_layout():
+    """
+    Asserts that a character the atlas cannot map to one glyph only sends
+    the labels using it through the batched Text layout.
+    """
+    LABEL_CACHE.clear()
+    real = labels._glyph_mobjects
+    
+    def without_e_acute(text_mob, text):
+        return None if "é" in text else real(text_mob, text)
+    
+    with patch.object(labels, "_glyph_mobjects", side_effect=without_e_acute):
+        plain, accented = build_labels(["cafe", "café"], glyphs=True)
+    
+    assert LABEL_CACHE.atlas(labels.LABEL_FONT, labels.LABEL_FONT_SIZE).unmapped == {"é"}
+    assert not isinstance(plain, labels.Text) and isinstance(accented, labels.Text)
+    assert len(accented.submobjects) == 4
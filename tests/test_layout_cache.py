@@ -0,0 +1,129 @@
+import pytest
+from manim_devops.cache import LayoutCache
+from manim_devops.core import Topology, NodeCluster
+from manim_devops.assets import CloudNode
+
+def _build_topology(cache, scale_factor=3.0):
+    topo = Topology(scale_factor=scale_factor, layout_cache=cache)
+    a, b, c = CloudNode("a", "A"), CloudNode("b", "B"), CloudNode("c", "C")
+    topo.add_nodes([a, b, c])
+    topo.connect(a, b)
+    topo.connect(b, c)
+    return topo
+
+def test_repeat_layout_is_served_from_disk(tmp_path):
+    """
+    Asserts that a second, identical Topology skips the layout step and
+    returns exactly the coordinates computed the first time.
+    """
+    cache = LayoutCache(tmp_path)
+    first = _build_topology(cache).calculate_layout()
+    assert cache.hits == 0 and cache.misses == 1
+    
+    second = _build_topology(cache).calculate_layout()
+    assert cache.hits == 1
+    assert second == first
+    
+    # A fresh cache object on the same directory (i.e. a new process) also hits
+    third = _build_topology(LayoutCache(tmp_path)).calculate_layout()
+    assert third == first
+
+def test_layout_key_tracks_every_layout_input(tmp_path):
+    """
+    Asserts that edges, cluster membership and scale factor all change the key.
+    """
+    cache = LayoutCache(tmp_path)
+    base_key = _build_topology(cache).layout_key()
+    assert _build_topology(cache).layout_key() == base_key
+    
+    assert _build_topology(cache, scale_factor=4.0).layout_key() != base_key
+    
+    extra_edge = _build_topology(cache)
+    extra_edge.connect(extra_edge.nodes[2], extra_edge.nodes[0])
+    assert extra_edge.layout_key() != base_key
+    
+    clustered = _build_topology(cache)
+    cluster = NodeCluster("asg", "ASG")
+    clustered.add_node(cluster)
+    key_before_child = clustered.layout_key()
+    cluster.add_child(CloudNode("web", "Web"))
+    assert clustered.layout_key() != key_before_child
+
+def test_layout_cache_false_always_recomputes(tmp_path, monkeypatch):
+    """
+    Asserts that layout_cache=False opts out of caching entirely, while
+    the default (None) uses the shared default cache.
+    """
+    from manim_devops.constants import LAYOUT_CACHE_DIR_ENV
+    monkeypatch.setenv(LAYOUT_CACHE_DIR_ENV, str(tmp_path))
+    assert isinstance(Topology().layout_cache, LayoutCache)
+    
+    topo = _build_topology(False)
+    assert topo.layout_cache is None
+    assert topo.calculate_layout() == _build_topology(False).calculate_layout()
+    assert not list(tmp_path.iterdir())
+
+def test_lru_eviction_keeps_most_recently_used(tmp_path):
+    """
+    Asserts that the cache never grows past max_entries and evicts the
+    entry that was used least recently.
+    """
+    import os
+    cache = LayoutCache(tmp_path, max_entries=2)
+    coords = {"a": (0.0, 0.0, 0.0)}
+    cache.put("old", coords)
+    cache.put("recent", coords)
+    # Backdate 'old' and 'recent' deterministically, then touch 'old' via a hit
+    os.utime(tmp_path / "old.json", (1, 1))
+    os.utime(tmp_path / "recent.json", (2, 2))
+    assert cache.get("old") == coords
+    
+    cache.put("new", coords)
+    
+    assert cache.stats()["entries"] == 2
+    assert cache.evictions == 1
+    assert cache.get("recent") is None
+    assert cache.get("old") == coords
+
+def test_corrupt_entry_is_treated_as_a_miss(tmp_path):
+    """
+    Asserts that a damaged cache file never crashes a render.
+    """
+    cache = LayoutCache(tmp_path)
+    (tmp_path / "broken.json").write_text("{not json")
+    assert cache.get("broken") is None
+    assert not (tmp_path / "broken.json").exists()
+
+def test_stats_expose_location_and_counters(tmp_path):
+    cache = LayoutCache(tmp_path)
+    _build_topology(cache).calculate_layout()
+    _build_topology(cache).calculate_layout()
+    stats = cache.stats()
+    assert stats["cache_dir"] == str(tmp_path)
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+def test_layout_snapshot_pickles_and_reproduces_the_layout(tmp_path):
+    """
+    Asserts that the snapshot shipped to a layout worker process survives
+    pickling, keeps the cache key and cluster structure, and lays out the
+    same coordinates, storing them where the original topology finds them.
+    """
+    import pickle
+    cache = LayoutCache(tmp_path)
+    topo = _build_topology(cache)
+    vpc, subnet = NodeCluster("vpc", "VPC"), NodeCluster("subnet", "Subnet")
+    subnet.add_child(CloudNode("web1", "Web 1"))
+    subnet.add_child(CloudNode("web2", "Web 2"))
+    vpc.add_child(subnet)
+    topo.add_node(vpc)
+    topo.connect(topo.nodes[0], vpc)
+    
+    snapshot = pickle.loads(pickle.dumps(topo.layout_snapshot()))
+    
+    assert snapshot.layout_key() == topo.layout_key()
+    assert snapshot.nodes[-1].children[0].children[1].node_id == "web2"
+    coords = snapshot.calculate_layout()
+    assert cache.get(topo.layout_key()) == coords
+    assert topo.calculate_layout() == coords
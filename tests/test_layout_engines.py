@@ -0,0 +1,132 @@
+import pytest
+import numpy as np
+from manim_devops.core import Topology
+from manim_devops.engines import LayeredLayoutEngine, SpringLayoutEngine, resolve_layout_engine
+
+def test_layered_engine_stacks_tiers_top_to_bottom(aws_3_tier_topology: Topology):
+    """
+    Asserts that the layered engine places every tier of the 3-tier fixture
+    strictly below the previous one, with peers sharing a row.
+    """
+    aws_3_tier_topology.layout_engine = resolve_layout_engine("layered")
+    coords = aws_3_tier_topology.calculate_layout()
+    
+    tiers = ["dns", "igw", "alb", "web1", "db_master", "db_replica"]
+    heights = [coords[node_id][1] for node_id in tiers]
+    assert heights == sorted(heights, reverse=True)
+    assert len(set(heights)) == len(heights)
+    
+    # Both web servers share the compute tier, side by side
+    assert coords["web1"][1] == coords["web2"][1]
+    assert coords["web1"][0] != coords["web2"][0]
+
+def test_layered_engine_can_be_picked_by_name():
+    topo = Topology(layout_engine="layered")
+    assert isinstance(topo.layout_engine, LayeredLayoutEngine)
+    assert isinstance(Topology().layout_engine, SpringLayoutEngine)
+    
+    with pytest.raises(ValueError, match="Unknown layout engine"):
+        Topology(layout_engine="does-not-exist")
+
+@pytest.mark.parametrize("engine", ["spring", "layered", "force"])
+def test_engines_lay_out_endpoints_never_added_as_nodes(engine):
+    """
+    Asserts that, as with the original NetworkX graph, connecting a node
+    that was never passed to add_node still places it instead of failing.
+    """
+    from manim_devops.assets import CloudNode
+    
+    topo = Topology(layout_engine=engine)
+    topo.layout_cache = None
+    web, db, cache = CloudNode("web", "Web"), CloudNode("db", "DB"), CloudNode("cache", "Cache")
+    topo.add_node(web)
+    topo.connect(web, db)
+    topo.connect(cache, web)
+    
+    coords = topo.calculate_layout()
+    assert set(coords) == {"web", "db", "cache"}
+    assert len({coords[node_id] for node_id in coords}) == 3
+
+def test_layered_engine_tolerates_cycles_and_self_loops():
+    """
+    Asserts that back edges are reversed rather than crashing the ranking,
+    so peering / replication loops still lay out.
+    """
+    engine = LayeredLayoutEngine()
+    sources = np.array([0, 1, 2, 2])
+    targets = np.array([1, 2, 0, 2])
+    positions = engine.compute(3, sources, targets)
+    
+    assert positions.shape == (3, 2)
+    assert np.all(np.isfinite(positions))
+    assert len(set(positions[:, 1].tolist())) == 3
+
+def test_barycenter_sweeps_remove_avoidable_crossings():
+    """
+    Two parents each own one child, but the children were inserted in the
+    'wrong' order. The barycenter pass must uncross them.
+    """
+    engine = LayeredLayoutEngine()
+    # 0 -> 3, 1 -> 2  (children 2 and 3 start out crossed)
+    positions = engine.compute(4, np.array([0, 1]), np.array([3, 2]))
+    
+    parents_left_to_right = positions[0, 0] < positions[1, 0]
+    children_left_to_right = positions[3, 0] < positions[2, 0]
+    assert parents_left_to_right == children_left_to_right
+
+def test_engine_choice_is_part_of_the_cache_key(aws_3_tier_topology: Topology):
+    spring_key = aws_3_tier_topology.layout_key()
+    aws_3_tier_topology.layout_engine = LayeredLayoutEngine()
+    assert aws_3_tier_topology.layout_key() != spring_key
+
+def _ring_mesh(num_nodes: int):
+    """A ring with chords: cyclic, so the layered engine is the wrong tool."""
+    sources = np.repeat(np.arange(num_nodes), 2)
+    targets = (sources + np.tile([1, 7], num_nodes)) % num_nodes
+    return sources, targets
+
+def test_force_engine_is_deterministic():
+    """
+    Asserts the LAYOUT_SEED guarantee holds for the grid-accelerated engine,
+    and that its FFT kernel cache stays bounded while the grid size drifts.
+    """
+    from manim_devops.constants import FORCE_KERNEL_CACHE_SIZE
+    from manim_devops.engines import ForceLayoutEngine
+    
+    sources, targets = _ring_mesh(300)
+    engine = ForceLayoutEngine()
+    single = engine.compute(300, sources, targets)
+    again = ForceLayoutEngine().compute(300, sources, targets)
+    
+    assert single.shape == (300, 2)
+    assert np.abs(single).max() == pytest.approx(1.0)
+    assert np.array_equal(single, again)
+    assert 0 < len(engine._kernel_cache) <= FORCE_KERNEL_CACHE_SIZE
+
+def test_force_engine_pulls_neighbours_together():
+    """
+    Connected nodes should end up much closer than arbitrary pairs.
+    """
+    from manim_devops.engines import ForceLayoutEngine
+    
+    sources, targets = _ring_mesh(400)
+    positions = ForceLayoutEngine().compute(400, sources, targets)
+    
+    edge_length = np.linalg.norm(positions[sources] - positions[targets], axis=1).mean()
+    rng = np.random.default_rng(0)
+    a, b = rng.integers(0, 400, (2, 2000))
+    random_length = np.linalg.norm(positions[a] - positions[b], axis=1).mean()
+    assert edge_length < 0.5 * random_length
+
+def test_force_engine_supports_warm_start_relayout(aws_3_tier_topology: Topology):
+    from manim_devops.assets import CloudNode
+    
+    aws_3_tier_topology.layout_engine = resolve_layout_engine("force")
+    previous = aws_3_tier_topology.calculate_layout()
+    
+    aws_3_tier_topology.add_node(CloudNode("cache", "ElastiCache"))
+    aws_3_tier_topology.connect(aws_3_tier_topology.nodes[0], aws_3_tier_topology.nodes[-1])
+    updated = aws_3_tier_topology.relayout(previous, changed=["cache"], hops=1)
+    
+    assert "cache" in updated
+    assert updated["db_replica"] == previous["db_replica"]
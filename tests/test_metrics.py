@@ -0,0 +1,60 @@
+import json
+import numpy as np
+from manim_devops.core import Topology
+from manim_devops.assets import CloudNode
+from manim_devops.layout import OrthogonalRouter
+from manim_devops.metrics import count_crossings, overlapping_boxes, path_segments, measure_topology
+
+def test_sweep_line_matches_brute_force_crossings():
+    """
+    Asserts the sweep-line count equals a pairwise check on random L-bends,
+    and that each crossing is attributed to both edges involved.
+    """
+    rng = np.random.default_rng(1)
+    sources = np.column_stack([rng.integers(0, 20, (300, 2)), np.zeros(300)]).astype(float)
+    targets = np.column_stack([rng.integers(0, 20, (300, 2)), np.zeros(300)]).astype(float)
+    paths = OrthogonalRouter().compute_paths(sources, targets, 0.0, 0.0)
+
+    total, per_path = count_crossings(paths)
+
+    horizontal, vertical, _ = path_segments(paths)
+    expected = sum(
+        1 for y, x0, x1, _ in horizontal for x, y0, y1, _ in vertical
+        if x0 < x < x1 and y0 < y < y1
+    )
+    assert total == expected > 0
+    assert per_path.sum() == 2 * total
+
+def test_edges_meeting_at_endpoints_do_not_cross():
+    plus = [np.array([[-1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]), np.array([[0.0, -1.0, 0.0], [0.0, 1.0, 0.0]])]
+    tee = [np.array([[-1.0, 0.0, 0.0], [1.0, 0.0, 0.0]]), np.array([[0.0, 0.0, 0.0], [0.0, 1.0, 0.0]])]
+
+    assert count_crossings(plus)[0] == 1
+    assert count_crossings(tee)[0] == 0
+
+def test_spatial_hash_finds_exactly_the_overlapping_boxes():
+    rng = np.random.default_rng(2)
+    corners = rng.uniform(0, 30, (400, 2))
+    boxes = np.column_stack([corners, corners + rng.uniform(0.2, 2.0, (400, 2))])
+
+    pairs = overlapping_boxes(boxes)
+
+    expected = [
+        (i, j) for i in range(len(boxes)) for j in range(i + 1, len(boxes))
+        if min(boxes[i, 2], boxes[j, 2]) > max(boxes[i, 0], boxes[j, 0])
+        and min(boxes[i, 3], boxes[j, 3]) > max(boxes[i, 1], boxes[j, 1])
+    ]
+    assert sorted(map(tuple, pairs.tolist())) == expected
+
+def test_measure_topology_reports_machine_readable_metrics():
+    topo = Topology()
+    nodes = [CloudNode(f"n{i}", "EC2") for i in range(6)]
+    topo.add_nodes(nodes)
+    for i in range(5):
+        topo.connect(nodes[i], nodes[i + 1])
+
+    report = json.loads(measure_topology(topo).to_json())
+
+    assert report["edges"] == 5
+    assert report["boxes"] == 12  # one icon and one label per node
+    assert {"edge_crossings", "box_overlaps", "overlapping", "seconds"} <= set(report)
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from manim import Dot, VMobject, tempconfig
+from manim_devops.core import DevopsScene
+from manim_devops.assets import CloudNode
+from manim_devops.cinematics import MoveAlongEdge, PacketField
+
+DRY_RUN = {"dry_run": True, "quality": "low_quality", "disable_caching": True}
+
+def _scene():
+    scene = DevopsScene()
+    scene.rendered_edges = {}
+    line = VMobject()
+    line.set_points_as_corners([[0, 0, 0], [3, 0, 0], [3, 4, 0]])
+    scene.rendered_edges[("A", "B")] = line
+    return scene, CloudNode("A", "Source"), CloudNode("B", "Target")
+
+def test_packet_field_moves_packets_at_constant_speed_and_recycles_slots():
+    """
+    Asserts that a burst advances along the L-bend at the field's speed,
+    that reversed lookups travel the edge backwards, and that arrived
+    packets free their slots instead of growing the state arrays.
+    """
+    with tempconfig(DRY_RUN):
+        scene, a, b = _scene()
+        field = PacketField(scene, speed=1.0, capacity=4)
+        assert field.spawn(a, b, count=2, spacing=1.0) == 2
+        field.advance(4.0)
+        assert np.allclose(field.positions(), [[3, 1, 0], [3, 0, 0]])
+
+        field.spawn(b, a)
+        field.advance(1.0)
+        assert np.allclose(field.positions()[-1], [3, 3, 0])
+
+        field.advance(10.0)
+        assert field.in_flight == 0 and len(field.points) == 0
+        assert field.spawn(a, b, count=6) == 4 and field.dropped == 2
+
+def test_idle_packet_field_advances_without_edges():
+    """
+    Asserts that a field no packet has been sent through yet can be
+    advanced (as its updater is on every frame of a wait) and draws nothing.
+    """
+    with tempconfig(DRY_RUN):
+        scene, _, _ = _scene()
+        field = PacketField(scene)
+        field.advance(1 / 15)
+
+        assert field.in_flight == 0 and len(field.points) == 0
+
+def test_packet_field_streams_and_draws_one_mobject():
+    """
+    Asserts that an emitter keeps rate * time packets in flight, all drawn
+    as closed subpaths of the single field mobject, and that unknown edges
+    raise a KeyError like TrafficFlow.
+    """
+    with tempconfig(DRY_RUN):
+        scene, a, b = _scene()
+        field = PacketField(scene, speed=1.0)
+        field.emit(a, b, rate=5.0)
+        for _ in range(30):
+            field.advance(0.1)
+
+        assert field.in_flight == 15
+        assert len(field.get_subpaths()) == 15
+        assert field.submobjects == []
+        with pytest.raises(KeyError):
+            field.spawn(a, CloudNode("C", "Nowhere"))
+
+def test_move_along_edge_covers_equal_distances_in_equal_time():
+    """
+    Asserts that TrafficFlow's path animation places the packet by arc
+    length, so halfway through the run it is halfway along the L-bend.
+    """
+    with tempconfig(DRY_RUN):
+        scene, _, _ = _scene()
+        packet = Dot()
+        travel = MoveAlongEdge(packet, scene.rendered_edges[("A", "B")], rate_func=lambda t: t)
+        travel.interpolate_mobject(0.5)
+        assert np.allclose(packet.get_center(), [3, 0.5, 0])
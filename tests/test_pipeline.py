@@ -0,0 +1,48 @@
+from manim_devops.core import Topology, NodeCluster
+from manim_devops.assets.aws import EC2, RDS
+from manim_devops.pipeline import prepare_topology
+
+def _estate():
+    topo = Topology(layout_cache=False)  # computed every time, never read back from disk
+    asg = NodeCluster("asg", "Web Tier")
+    servers = [EC2(f"web{i}", "Web Server") for i in range(4)]
+    for server in servers:
+        asg.add_child(server)
+    db = RDS("db", "Database")
+    topo.add_nodes([asg, *servers, db])
+    for server in servers:
+        topo.connect(server, db)
+    return topo
+
+def test_prepare_runs_layout_in_a_worker_process_and_times_each_stage():
+    """
+    Asserts that preparing a topology with the layout in a worker process
+    yields the in-process layout, materialized icons and one label per drawn
+    node (clusters excluded), and reports every stage's wall-clock time.
+    Nothing is cached, so the worker really lays the graph out.
+    """
+    expected = _estate().calculate_layout()
+    topo = _estate()
+    
+    prepared = prepare_topology(topo, use_process=True)
+    
+    assert prepared.coords == expected
+    assert prepared.timings.seconds["layout"] > 0
+    assert [node.node_id for node in prepared.drawn] == [f"web{i}" for i in range(4)] + ["db"]
+    assert all(node.is_materialized for node in prepared.drawn)
+    assert len(prepared.labels) == 5
+    assert set(prepared.timings.as_dict()) == {"prepare", "icons", "labels", "layout"}
+    assert prepared.timings.seconds["prepare"] >= prepared.timings.seconds["icons"] + prepared.timings.seconds["labels"]
+
+def test_layout_worker_is_reused_across_renders():
+    """
+    Asserts that successive preparations send their layouts to the same
+    worker process instead of starting one per render.
+    """
+    from manim_devops import pipeline
+    prepare_topology(_estate(), use_process=True)
+    pool = pipeline._LAYOUT_POOL
+
+    prepare_topology(_estate(), use_process=True)
+
+    assert pool is not None and pipeline._LAYOUT_POOL is pool
@@ -0,0 +1,88 @@
+from manim_devops.core import NodeCluster
+from manim_devops.assets import CloudNode
+from manim_devops.registry import EdgeIndex, SceneRegistry
+
+def test_edge_index_finds_either_direction_with_one_lookup():
+    """
+    Asserts that edges are found by unordered pair, reporting whether the
+    stored direction is reversed, with the directed edge preferred.
+    """
+    edges = EdgeIndex({("a", "b"): "ab"})
+    edges[("c", "b")] = "cb"
+    
+    assert edges.find("a", "b") == ("ab", False)
+    assert edges.find("b", "a") == ("ab", True)
+    assert edges.find("a", "c") is None
+    
+    edges[("b", "a")] = "ba"
+    assert edges.find("b", "a") == ("ba", False)
+    assert edges.between("b", "a") == [("a", "b"), ("b", "a")]
+    assert edges.incident("b") == [("a", "b"), ("c", "b"), ("b", "a")]
+
+def test_edge_index_stays_consistent_through_dict_mutations():
+    """
+    Asserts that the pair and incidence indexes follow every way of
+    mutating the dict, since callers treat it as a plain rendered_edges dict.
+    """
+    edges = EdgeIndex()
+    edges[("a", "b")] = "first"
+    edges[("a", "b")] = "rerouted"
+    edges.setdefault(("b", "c"), "bc")
+    edges.update({("c", "a"): "ca"})
+    
+    assert edges.incident("a") == [("a", "b"), ("c", "a")]
+    del edges[("a", "b")]
+    assert edges.pop(("c", "a")) == "ca"
+    assert edges.find("a", "b") is None and edges.incident("a") == []
+    assert edges.popitem() == (("b", "c"), "bc")
+    assert edges == {} and edges.incident("b") == []
+
+def test_registry_indexes_clusters_and_removes_nodes_with_their_edges():
+    """
+    Asserts that nested clusters are registered with their parent, and that
+    removing a node drops its label and every incident edge.
+    """
+    registry = SceneRegistry()
+    vpc, subnet = NodeCluster("vpc", "VPC"), NodeCluster("subnet", "Subnet")
+    vpc.add_child(subnet)
+    web, db = CloudNode("web", "Web"), CloudNode("db", "DB")
+    registry.add_cluster(vpc)
+    registry.add_node(web, "web-label")
+    registry.add_node(db, "db-label")
+    registry.edges[("web", "db")] = "line"
+    registry.edges[("db", "web")] = "reply"
+    
+    assert registry.entity("subnet") is subnet and registry.entity("web") is web
+    node, label, edges = registry.remove_node("web")
+    
+    assert (node, label) == (web, "web-label")
+    assert edges == {("web", "db"): "line", ("db", "web"): "reply"}
+    assert "web" not in registry.nodes and "web" not in registry.labels
+    assert registry.edges == {} and registry.edges.incident("db") == []
+
+def test_registry_indexes_subclusters_added_after_their_parent():
+    """
+    Asserts that re-registering a known cluster still walks its children,
+    so a subcluster added to it later becomes findable by id.
+    """
+    registry = SceneRegistry()
+    vpc = NodeCluster("vpc", "VPC")
+    registry.add_cluster(vpc)
+    subnet = NodeCluster("subnet", "Subnet")
+    vpc.add_child(subnet)
+    registry.add_cluster(vpc)
+    
+    assert registry.entity("subnet") is subnet
+
+def test_registry_indexes_cyclic_clusters_once():
+    """
+    Asserts that registering a cluster cycle (A contains B contains A),
+    which Topology allows, terminates with both clusters findable.
+    """
+    registry = SceneRegistry()
+    a, b = NodeCluster("a", "A"), NodeCluster("b", "B")
+    a.add_child(b)
+    b.add_child(a)
+    registry.add_cluster(a)
+    
+    assert registry.entity("a") is a and registry.entity("b") is b
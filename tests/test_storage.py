@@ -0,0 +1,79 @@
+import numpy as np
+from manim_devops.core import Topology
+from manim_devops.assets import CloudNode
+import pytest
+from manim_devops.storage import CompactGraph, EdgeListGraph, csr_from_edges
+
+def test_compact_graph_deduplicates_and_keeps_insertion_order():
+    """
+    Asserts that edges come back in the order they were first added, with
+    duplicates dropped, across the pending-batch / sorted-array boundary.
+    """
+    graph = CompactGraph(capacity=4)
+    expected, seen = [], set()
+    rng = np.random.default_rng(0)
+    for source, target in rng.integers(0, 50, size=(20000, 2)).tolist():
+        added = graph.add_edge(graph.intern(f"n{source}"), graph.intern(f"n{target}"))
+        edge = (f"n{source}", f"n{target}")
+        assert added == (edge not in seen)
+        if added:
+            seen.add(edge)
+            expected.append(edge)
+
+    assert list(graph.edges()) == expected
+    assert graph.num_edges == len(expected)
+
+def test_compact_graph_csr_matches_edge_list():
+    graph = CompactGraph()
+    for node_id in "012":
+        graph.intern(node_id)
+    for source, target in [(0, 2), (0, 1), (2, 0), (1, 2), (0, 2)]:
+        graph.add_edge(graph.intern(str(source)), graph.intern(str(target)))
+
+    indptr, indices = graph.csr()
+    assert indptr.tolist() == [0, 2, 3, 4]
+    assert indices.tolist() == [1, 2, 2, 0]  # 0 -> {1, 2}, 1 -> {2}, 2 -> {0}
+    assert graph.successors(0).tolist() == [1, 2]
+
+    sources, targets = graph.edge_arrays()
+    undirected_ptr, _ = csr_from_edges(graph.num_nodes, sources, targets, undirected=True)
+    assert np.diff(undirected_ptr).tolist() == [3, 2, 3]
+
+def test_topology_edges_are_array_backed():
+    """
+    Asserts the public edges API is unchanged while the compact storage
+    underneath costs a small, fixed number of bytes per edge.
+    """
+    topo = Topology(graph_storage="compact")
+    nodes = [CloudNode(f"n{i}", "EC2") for i in range(2000)]
+    topo.add_nodes(nodes)
+    for i in range(len(nodes)):
+        topo.connect(nodes[i], nodes[(i + 1) % len(nodes)])
+        topo.connect(nodes[i], nodes[(i + 1) % len(nodes)])
+
+    assert topo.edges[:2] == [("n0", "n1"), ("n1", "n2")]
+    assert len(topo.edges) == 2000
+    assert topo.graph.nbytes / topo.graph.num_edges < 32
+
+def test_storage_backends_agree():
+    """
+    Asserts that the default edge-list storage and the compact one expose
+    the same edges, index arrays and layout, and that unknown names fail.
+    """
+    topos = [Topology(layout_cache=False), Topology(layout_cache=False, graph_storage="compact")]
+    nodes = [CloudNode(f"n{i}", "EC2") for i in range(30)]
+    for topo in topos:
+        topo.add_nodes(nodes[:20])
+        for i in range(30):
+            topo.connect(nodes[i], nodes[(3 * i + 1) % 30])
+            topo.connect(nodes[i], nodes[(3 * i + 1) % 30])
+
+    default, compact = topos
+    assert isinstance(default.graph, EdgeListGraph)
+    assert default.edges == compact.edges
+    for a, b in zip(default.graph.edge_arrays(), compact.graph.edge_arrays()):
+        assert np.array_equal(a, b)
+    assert np.array_equal(default.graph.csr()[1], compact.graph.csr()[1])
+    assert default.calculate_layout() == compact.calculate_layout()
+    with pytest.raises(ValueError, match="Unknown graph storage"):
+        Topology(graph_storage="does-not-exist")
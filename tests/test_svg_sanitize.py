@@ -0,0 +1,55 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+import manim_devops.assets
+from manim_devops.assets.sanitize import sanitized_svg
+
+ASSETS_DIR = Path(manim_devops.assets.__file__).parent / "aws"
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
+
+DIRTY_SVG = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="0 0 100 100">
+  <defs>
+    <style>/* exported */ .cls-1{fill:#FF9900;} .cls-2, .cls-3{fill:#F2F3F3;stroke:#000}</style>
+    <linearGradient id="base"><stop offset="0" stop-color="#123456"/><stop offset="1" stop-color="#fff"/></linearGradient>
+    <linearGradient id="grad" xlink:href="#base"/>
+  </defs>
+  <title>Icon</title>
+  <rect class="cls-2" fill="#000" width="100" height="100"/>
+  <path class="cls-1" style="fill:#00FF00" d="M50 25L75 75H25L50 25Z"/>
+  <circle fill="url(#grad)" cx="50" cy="50" r="5"/>
+</svg>'''
+
+def test_sanitiser_inlines_classes_and_gradients(tmp_path):
+    """
+    Asserts that CSS classes become presentation attributes (inline styles
+    still win), gradient paints fall back to their first stop colour, and
+    unsupported blocks are removed.
+    """
+    source = tmp_path / "vendor.svg"
+    source.write_text(DIRTY_SVG)
+
+    root = ET.parse(sanitized_svg(source, tmp_path / "out")).getroot()
+
+    rect, path, circle = (root.find(f"{SVG_NS}{tag}") for tag in ("rect", "path", "circle"))
+    assert rect.get("fill") == "#F2F3F3" and rect.get("stroke") == "#000" and rect.get("class") is None
+    assert path.get("fill") == "#FF9900" and path.get("style") == "fill:#00FF00"
+    assert circle.get("fill") == "#123456"
+    assert root.find(f".//{SVG_NS}style") is None and root.find(f"{SVG_NS}title") is None
+
+def test_sanitised_output_is_reused_by_content_hash(tmp_path):
+    first = tmp_path / "a.svg"
+    second = tmp_path / "b.svg"
+    first.write_text(DIRTY_SVG)
+    second.write_text(DIRTY_SVG)
+
+    out = sanitized_svg(first, tmp_path / "out")
+    out.write_text("<svg/>")  # a second sanitise would overwrite this
+
+    assert sanitized_svg(second, tmp_path / "out") == out
+    assert out.read_text() == "<svg/>"
+    assert len(list((tmp_path / "out").iterdir())) == 1
+
+def test_bundled_icons_sanitise_cleanly(tmp_path):
+    for svg_path in sorted(ASSETS_DIR.glob("*.svg")):
+        ET.parse(sanitized_svg(svg_path, tmp_path))